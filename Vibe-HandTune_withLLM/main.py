@@ -1,7 +1,7 @@
 """
-L1 x 0 t 1    ܤ\
-L1<\ D X t  ޔ MIDI t|xD 1\ ,
- \  `   x0 ܤ\
+음성 인식 기반 베이스 생성 및 제스처 제어 시스템
+음성으로 감정을 분석하고 해당 감정에 맞는 MIDI 베이스라인을 생성한 후,
+손 제스처로 실시간 제어할 수 있는 인터랙티브 시스템
 """
 
 import sys
@@ -9,75 +9,114 @@ import os
 import argparse
 
 def run_gui():
-    """GUI \  ܤ\ """
+    """GUI 모드로 전체 시스템 실행"""
     import tkinter as tk
     from src.audio_gui import AudioRecorderGUI
-    
+
     recordings_dir = "audio_recordings"
     os.makedirs(recordings_dir, exist_ok=True)
-    
+
     root = tk.Tk()
     app = AudioRecorderGUI(root)
-    
-    app.result_text.insert(tk.END, 
-        "L1 x t 1 ܤ\\n\n"
-        "1. tl <\ L1 yL\n"
-        "2. M\ X   \n"
-        "3.  ޔ MIDI t|x 1\n"
-        "4.  \  \n\n"
+
+    app.result_text.insert(tk.END,
+        "음성 인식 베이스 생성 시스템\n\n"
+        "1. 마이크 버튼으로 음성 녹음\n"
+        "2. 텍스트로 변환 후 감정 분석\n"
+        "3. 감정에 맞는 MIDI 베이스라인 생성\n"
+        "4. 손 제스처로 실시간 제어\n\n"
     )
-    
+
     root.mainloop()
 
 def test_stt():
-    """L1-M X L"""
-    print("L1-M X L ܑ...")
+    """음성-텍스트 변환 테스트"""
+    print("음성-텍스트 변환 테스트 시작...")
     from src.main_stt_test import main
     main()
 
 def test_emotion():
-    """  L"""
-    print("  L ܑ...")
+    """감정 분석 테스트"""
+    print("감정 분석 테스트 시작...")
     from src.main_emotion_test import main
     main()
 
 def test_gesture():
-    """ x L"""
-    print(" x L ܑ...")
+    """제스처 인식 테스트"""
+    print("제스처 인식 테스트 시작...")
     from src.gesture_test import main
     main()
 
 def test_midi():
-    """MIDI % L"""
-    print("MIDI % L ܑ...")
+    """MIDI 출력 테스트"""
+    print("MIDI 출력 테스트 시작...")
     from src.main_midi_test import main
     main()
 
+def run_batch_stt(args):
+    """녹음 파일 일괄 텍스트 변환"""
+    print("녹음 파일 일괄 변환 시작...")
+    from src.batch_stt import run_batch
+    from src.stt_handler import STTHandler
+
+    stt_handler = STTHandler(language="ko", temperature=0,
+                             max_concurrency=args.workers,
+                             upload_format=args.upload_format)
+    try:
+        run_batch(
+            input_dir=args.input_dir,
+            output_path=args.output,
+            workers=args.workers,
+            rate_limit=args.rate_limit,
+            prompt=args.prompt,
+            recursive=args.recursive,
+            stt_handler=stt_handler
+        )
+    finally:
+        stt_handler.close()
+
 def main():
-    """Tx h -    """
-    parser = argparse.ArgumentParser(description="L1 x t 1 ܤ\")
-    parser.add_argument('--mode', '-m', 
-                      choices=['gui', 'stt', 'emotion', 'gesture', 'midi'],
+    """메인 함수 - 실행 모드 선택"""
+    parser = argparse.ArgumentParser(description="음성 인식 베이스 생성 시스템")
+    parser.add_argument('--mode', '-m',
+                      choices=['gui', 'stt', 'emotion', 'gesture', 'midi', 'batch-stt'],
                       default='gui',
-                      help='    (0: gui)')
-    
+                      help='실행 모드 선택 (기본값: gui)')
+
+    # batch-stt 모드 옵션
+    parser.add_argument('--input-dir', default='audio_recordings',
+                      help='batch-stt: WAV 파일 디렉토리 (기본값: audio_recordings)')
+    parser.add_argument('--output', default=None,
+                      help='batch-stt: 결과 JSONL 파일 (기본값: <input-dir>/transcripts.jsonl)')
+    parser.add_argument('--workers', type=int, default=4,
+                      help='batch-stt: 동시 변환 수 (기본값: 4)')
+    parser.add_argument('--rate-limit', type=float, default=50,
+                      help='batch-stt: 분당 최대 요청 수, 0이면 제한 없음 (기본값: 50)')
+    parser.add_argument('--prompt', default='',
+                      help='batch-stt: STT 프롬프트')
+    parser.add_argument('--upload-format', default='wav',
+                      help='batch-stt: 업로드 형식 (wav, flac, ogg, opus, mp3)')
+    parser.add_argument('--recursive', action='store_true',
+                      help='batch-stt: 하위 디렉토리까지 검색')
+
     args = parser.parse_args()
-    
+
     mode_functions = {
         'gui': run_gui,
         'stt': test_stt,
         'emotion': test_emotion,
         'gesture': test_gesture,
-        'midi': test_midi
+        'midi': test_midi,
+        'batch-stt': lambda: run_batch_stt(args)
     }
-    
+
     try:
         mode_functions[args.mode]()
     except KeyboardInterrupt:
-        print("\n\ ")
+        print("\n프로그램 종료")
     except Exception as e:
-        print(f"$X : {e}")
+        print(f"오류 발생: {e}")
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
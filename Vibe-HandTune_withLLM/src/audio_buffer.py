@@ -0,0 +1,364 @@
+"""
+오디오 버퍼 모듈입니다.
+PortAudio 콜백과 소비자 스레드 사이에서 사용하는 사전 할당 링 버퍼와
+문장 단위 오디오를 이어 붙이는 문장 버퍼를 제공합니다.
+"""
+
+import threading
+import time
+import numpy as np
+
+
+class AudioRingBuffer:
+    """
+    단일 생산자/단일 소비자(SPSC) 고정 용량 오디오 링 버퍼 클래스입니다.
+
+    저장 공간을 용량의 두 배로 잡고 모든 프레임을 두 번(원본 위치와 +capacity 위치)
+    기록하는 미러링 방식을 사용합니다. 덕분에 용량 이하 길이의 읽기는
+    래핑 여부와 관계없이 항상 연속된 뷰(복사 없음)로 반환할 수 있습니다.
+
+    쓰기 위치는 생산자만, 읽기 위치는 소비자만 갱신하므로 데이터 경로에 락이 없습니다.
+    읽기로 반환된 뷰는 생산자가 버퍼를 한 바퀴 돌아 해당 영역을 다시 덮어쓰기 전까지만
+    유효하므로, 오래 보관해야 하는 데이터는 소비자가 직접 복사해야 합니다.
+    """
+    def __init__(self, capacity, channels=1, dtype='int16'):
+        """
+        AudioRingBuffer 클래스 초기화
+
+        Parameters:
+        -----------
+        capacity : int
+            버퍼에 보관할 수 있는 최대 프레임 수
+        channels : int
+            오디오 채널 수
+        dtype : str
+            오디오 데이터 타입 ('int16', 'float32' 등)
+        """
+        if capacity <= 0:
+            raise ValueError(f"버퍼 용량은 양수여야 합니다: {capacity}")
+
+        self.capacity = int(capacity)
+        self.channels = channels
+        self.dtype = np.dtype(dtype)
+
+        # 미러링을 위해 용량의 두 배를 미리 할당
+        self._storage = np.zeros((self.capacity * 2, channels), dtype=self.dtype)
+
+        # 누적 프레임 카운터 (생산자는 _write_total, 소비자는 _read_total만 갱신)
+        self._write_total = 0
+        self._read_total = 0
+
+        # 오버런 통계
+        self.overrun_count = 0
+        self.overrun_frames = 0
+        self.peak_fill_level = 0.0
+
+        # 소비자 대기를 깨우기 위한 알림 (데이터 경로에는 관여하지 않음)
+        self._data_event = threading.Event()
+
+    @property
+    def available(self):
+        """읽을 수 있는 프레임 수"""
+        return self._write_total - self._read_total
+
+    @property
+    def fill_level(self):
+        """현재 버퍼 점유율 (0~1)"""
+        return self.available / self.capacity
+
+    def write(self, data):
+        """
+        오디오 프레임을 버퍼에 기록합니다. (생산자 전용)
+
+        남은 공간이 부족하면 블록 전체를 버리고 오버런으로 집계합니다.
+        읽지 않은 데이터를 덮어쓰지 않으므로 소비자가 가진 뷰는 안전하게 유지됩니다.
+
+        Parameters:
+        -----------
+        data : numpy.ndarray
+            (frames, channels) 모양의 오디오 데이터
+
+        Returns:
+        --------
+        bool
+            기록 성공 여부 (오버런이면 False)
+        """
+        frames = len(data)
+        if frames == 0:
+            return True
+
+        if frames > self.capacity - self.available:
+            self.overrun_count += 1
+            self.overrun_frames += frames
+            return False
+
+        capacity = self.capacity
+        pos = self._write_total % capacity
+        first = min(frames, capacity - pos)
+        rest = frames - first
+
+        # 원본 영역과 미러 영역에 동시에 기록
+        self._storage[pos:pos + first] = data[:first]
+        self._storage[pos + capacity:pos + capacity + first] = data[:first]
+        if rest:
+            self._storage[:rest] = data[first:]
+            self._storage[capacity:capacity + rest] = data[first:]
+
+        self._write_total += frames
+
+        fill_level = self.fill_level
+        if fill_level > self.peak_fill_level:
+            self.peak_fill_level = fill_level
+
+        self._data_event.set()
+        return True
+
+    def read(self, frames, timeout=None):
+        """
+        지정한 프레임 수만큼 데이터를 읽어 뷰로 반환합니다. (소비자 전용)
+
+        Parameters:
+        -----------
+        frames : int
+            읽을 프레임 수 (capacity 이하)
+        timeout : float or None
+            데이터를 기다리는 시간 (초). None이면 무한정 대기.
+
+        Returns:
+        --------
+        numpy.ndarray or None
+            (frames, channels) 모양의 뷰, 타임아웃이면 None 반환
+        """
+        if frames > self.capacity:
+            raise ValueError(f"버퍼 용량({self.capacity})보다 많은 프레임을 읽을 수 없습니다: {frames}")
+
+        if not self.wait_for(frames, timeout):
+            return None
+
+        return self._consume(frames)
+
+    def read_available(self, max_frames=None):
+        """
+        현재 읽을 수 있는 데이터를 모두(또는 max_frames까지) 뷰로 반환합니다. (소비자 전용)
+
+        Parameters:
+        -----------
+        max_frames : int or None
+            최대 읽을 프레임 수
+
+        Returns:
+        --------
+        numpy.ndarray
+            (frames, channels) 모양의 뷰 (데이터가 없으면 길이 0)
+        """
+        frames = self.available
+        if max_frames is not None:
+            frames = min(frames, max_frames)
+        return self._consume(frames)
+
+    def wait_for(self, frames, timeout=None):
+        """
+        지정한 프레임 수가 쌓일 때까지 대기합니다.
+
+        Parameters:
+        -----------
+        frames : int
+            필요한 프레임 수
+        timeout : float or None
+            최대 대기 시간 (초). None이면 무한정 대기.
+
+        Returns:
+        --------
+        bool
+            데이터가 충분히 쌓였는지 여부
+        """
+        if self.available >= frames:
+            return True
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.available < frames:
+            self._data_event.clear()
+            # clear 이후에 다시 확인해야 생산자의 set을 놓치지 않음
+            if self.available >= frames:
+                break
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            self._data_event.wait(remaining)
+        return True
+
+    def clear(self):
+        """
+        읽지 않은 데이터를 모두 버립니다. (소비자 전용)
+        """
+        self._read_total = self._write_total
+
+    def reset_stats(self):
+        """
+        오버런 및 점유율 통계를 초기화합니다.
+        """
+        self.overrun_count = 0
+        self.overrun_frames = 0
+        self.peak_fill_level = self.fill_level
+
+    def get_stats(self):
+        """
+        버퍼 상태 지표를 반환합니다.
+
+        Returns:
+        --------
+        dict
+            점유율, 최대 점유율, 오버런 횟수/프레임 수
+        """
+        return {
+            "capacity": self.capacity,
+            "available": self.available,
+            "fill_level": self.fill_level,
+            "peak_fill_level": self.peak_fill_level,
+            "overrun_count": self.overrun_count,
+            "overrun_frames": self.overrun_frames,
+        }
+
+    def _consume(self, frames):
+        """읽기 위치를 전진시키고 해당 구간의 뷰를 반환"""
+        pos = self._read_total % self.capacity
+        view = self._storage[pos:pos + frames]
+        self._read_total += frames
+        return view
+
+
+
+class PhraseBuffer:
+    """
+    한 문장(phrase) 분량의 오디오를 이어 붙이는 사전 할당 버퍼 클래스입니다.
+
+    청크를 리스트에 모았다가 문장 끝에서 np.vstack 하는 대신,
+    미리 할당된 배열에 청크를 바로 복사하고 완성된 문장을 뷰로 넘겨줍니다.
+    문장 시작 전 일정 길이의 오디오(pre-roll)를 작은 순환 버퍼에 보관해 두었다가
+    문장 시작 시 앞부분에 붙여, 첫 단어가 잘리는 문제를 막습니다.
+    """
+    def __init__(self, max_frames, channels=1, dtype='int16', preroll_frames=0):
+        """
+        PhraseBuffer 클래스 초기화
+
+        Parameters:
+        -----------
+        max_frames : int
+            한 문장의 예상 최대 프레임 수 (초과 시 버퍼가 늘어남)
+        channels : int
+            오디오 채널 수
+        dtype : str
+            오디오 데이터 타입 ('int16', 'float32' 등)
+        preroll_frames : int
+            문장 시작 전에 보관할 프레임 수
+        """
+        self.channels = channels
+        self.dtype = np.dtype(dtype)
+        self.preroll_frames = int(preroll_frames)
+
+        # 문장 버퍼 (pre-roll 포함 크기로 미리 할당)
+        self._storage = np.zeros((self.preroll_frames + int(max_frames), channels), dtype=self.dtype)
+        self.length = 0
+        self.grow_count = 0
+
+        # pre-roll 순환 버퍼
+        self._preroll = np.zeros((self.preroll_frames, channels), dtype=self.dtype)
+        self._preroll_pos = 0
+        self._preroll_filled = 0
+
+    @property
+    def capacity(self):
+        """현재 할당된 문장 버퍼 크기 (프레임)"""
+        return len(self._storage)
+
+    def push_preroll(self, chunk):
+        """
+        문장 시작 전 오디오를 pre-roll 버퍼에 기록합니다.
+        가장 최근 preroll_frames 프레임만 유지됩니다.
+
+        Parameters:
+        -----------
+        chunk : numpy.ndarray
+            (frames, channels) 모양의 오디오 청크
+        """
+        size = self.preroll_frames
+        if size == 0:
+            return
+
+        frames = len(chunk)
+        if frames >= size:
+            self._preroll[:] = chunk[frames - size:]
+            self._preroll_pos = 0
+            self._preroll_filled = size
+            return
+
+        pos = self._preroll_pos
+        first = min(frames, size - pos)
+        self._preroll[pos:pos + first] = chunk[:first]
+        if frames > first:
+            self._preroll[:frames - first] = chunk[first:]
+        self._preroll_pos = (pos + frames) % size
+        self._preroll_filled = min(size, self._preroll_filled + frames)
+
+    def begin(self):
+        """
+        새 문장을 시작합니다. 보관 중인 pre-roll 오디오가 문장 앞부분이 됩니다.
+        """
+        filled = self._preroll_filled
+        if filled < self.preroll_frames:
+            # 아직 한 바퀴를 채우지 못했으면 앞에서부터 순서대로 저장되어 있음
+            self._storage[:filled] = self._preroll[:filled]
+        else:
+            pos = self._preroll_pos
+            tail = self.preroll_frames - pos
+            self._storage[:tail] = self._preroll[pos:]
+            self._storage[tail:filled] = self._preroll[:pos]
+
+        self.length = filled
+        self._preroll_pos = 0
+        self._preroll_filled = 0
+
+    def append(self, chunk):
+        """
+        문장 버퍼 끝에 청크를 복사합니다.
+
+        Parameters:
+        -----------
+        chunk : numpy.ndarray
+            (frames, channels) 모양의 오디오 청크
+        """
+        frames = len(chunk)
+        end = self.length + frames
+        if end > len(self._storage):
+            self._grow(end)
+
+        self._storage[self.length:end] = chunk
+        self.length = end
+
+    def view(self):
+        """
+        현재까지 모인 문장 오디오를 뷰로 반환합니다.
+        다음 begin() 또는 reset() 호출 전까지 유효합니다.
+
+        Returns:
+        --------
+        numpy.ndarray
+            (frames, channels) 모양의 뷰
+        """
+        return self._storage[:self.length]
+
+    def reset(self):
+        """
+        문장 버퍼와 pre-roll 버퍼를 비웁니다.
+        """
+        self.length = 0
+        self._preroll_pos = 0
+        self._preroll_filled = 0
+
+    def _grow(self, min_frames):
+        """버퍼 크기를 두 배 이상으로 늘림"""
+        new_size = max(min_frames, len(self._storage) * 2)
+        new_storage = np.zeros((new_size, self.channels), dtype=self.dtype)
+        new_storage[:self.length] = self._storage[:self.length]
+        self._storage = new_storage
+        self.grow_count += 1
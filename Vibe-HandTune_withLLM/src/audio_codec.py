@@ -0,0 +1,198 @@
+"""
+STT 업로드용 오디오 인코딩 모듈입니다.
+16비트 PCM WAV 대신 FLAC(무손실)이나 Ogg Vorbis/Opus, MP3(저비트레이트)로 압축하여
+업로드 크기를 줄입니다. WAV 이외의 형식은 선택 의존성인 soundfile(libsndfile)이 필요합니다.
+"""
+
+import io
+import time
+import wave
+import threading
+import numpy as np
+
+try:
+    import soundfile as sf
+except (ImportError, OSError):
+    # soundfile 미설치 또는 libsndfile 라이브러리 없음
+    sf = None
+
+# 업로드 형식 -> (soundfile 포맷, 서브타입, 업로드 파일 이름)
+UPLOAD_FORMATS = {
+    "wav": (None, None, "audio.wav"),
+    "flac": ("FLAC", "PCM_16", "audio.flac"),
+    "ogg": ("OGG", "VORBIS", "audio.ogg"),
+    "opus": ("OGG", "OPUS", "audio.ogg"),
+    "mp3": ("MP3", "MPEG_LAYER_III", "audio.mp3"),
+}
+
+
+def available_formats():
+    """
+    현재 환경에서 사용할 수 있는 업로드 형식 목록을 반환합니다.
+
+    Returns:
+    --------
+    list
+        업로드 형식 이름 목록 (항상 'wav' 포함)
+    """
+    formats = ["wav"]
+    if sf is None:
+        return formats
+
+    for name, (sf_format, subtype, _) in UPLOAD_FORMATS.items():
+        if sf_format is None:
+            continue
+        if sf_format in sf.available_formats() and subtype in sf.available_subtypes(sf_format):
+            formats.append(name)
+    return formats
+
+
+def encode_pcm(pcm, sample_rate, upload_format="wav", compression_level=None):
+    """
+    int16 PCM 배열을 업로드 형식의 바이트로 인코딩합니다.
+
+    Parameters:
+    -----------
+    pcm : numpy.ndarray
+        (frames, channels) 또는 (frames,) 모양의 int16 오디오
+    sample_rate : int
+        샘플링 레이트
+    upload_format : str
+        UPLOAD_FORMATS의 형식 이름
+    compression_level : float or None
+        손실 압축 형식의 압축 정도 (0~1, 클수록 작은 파일). None이면 코덱 기본값.
+
+    Returns:
+    --------
+    bytes
+        인코딩된 오디오 파일 내용
+    """
+    if upload_format not in UPLOAD_FORMATS:
+        raise ValueError(f"지원하지 않는 업로드 형식입니다: {upload_format}")
+
+    pcm = np.ascontiguousarray(pcm, dtype=np.int16)
+    sf_format, subtype, _ = UPLOAD_FORMATS[upload_format]
+
+    if sf_format is None:
+        channels = 1 if pcm.ndim == 1 else pcm.shape[1]
+        byte_io = io.BytesIO()
+        with wave.open(byte_io, 'wb') as wf:
+            wf.setnchannels(channels)
+            wf.setsampwidth(2)
+            wf.setframerate(sample_rate)
+            wf.writeframes(pcm.tobytes())
+        return byte_io.getvalue()
+
+    if sf is None:
+        raise RuntimeError(f"'{upload_format}' 형식에는 soundfile 패키지가 필요합니다.")
+
+    options = {}
+    if compression_level is not None and subtype != "PCM_16":
+        options["compression_level"] = compression_level
+
+    byte_io = io.BytesIO()
+    sf.write(byte_io, pcm, sample_rate, format=sf_format, subtype=subtype, **options)
+    return byte_io.getvalue()
+
+
+def read_wav_bytes(wav_bytes):
+    """
+    WAV 바이트에서 PCM 배열과 샘플링 레이트를 읽습니다.
+
+    Returns:
+    --------
+    tuple
+        ((frames, channels) 모양의 int16 배열, 샘플링 레이트)
+    """
+    with wave.open(io.BytesIO(wav_bytes), 'rb') as wf:
+        channels = wf.getnchannels()
+        sample_rate = wf.getframerate()
+        pcm = np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16)
+    return pcm.reshape(-1, channels), sample_rate
+
+
+class UploadEncoder:
+    """
+    STT 업로드 직전에 WAV 바이트를 선택한 형식으로 다시 인코딩하고
+    인코딩 CPU 시간과 전송 바이트 수를 집계하는 클래스입니다.
+    """
+    def __init__(self, upload_format="wav", compression_level=None):
+        """
+        UploadEncoder 클래스 초기화
+
+        Parameters:
+        -----------
+        upload_format : str
+            업로드 형식 ('wav', 'flac', 'ogg', 'opus', 'mp3')
+        compression_level : float or None
+            손실 압축 형식의 압축 정도 (0~1)
+        """
+        if upload_format not in available_formats():
+            raise ValueError(
+                f"사용할 수 없는 업로드 형식입니다: {upload_format} "
+                f"(사용 가능: {', '.join(available_formats())})"
+            )
+
+        self.upload_format = upload_format
+        self.compression_level = compression_level
+        self.filename = UPLOAD_FORMATS[upload_format][2]
+
+        # 통계
+        self._lock = threading.Lock()
+        self.encode_count = 0
+        self.encode_time = 0.0
+        self.raw_bytes = 0
+        self.wire_bytes = 0
+
+    def encode(self, wav_bytes, filename="audio.wav"):
+        """
+        WAV 바이트를 업로드 형식으로 인코딩합니다.
+        WAV가 아닌 입력(이미 압축된 파일 등)은 그대로 통과시킵니다.
+
+        Parameters:
+        -----------
+        wav_bytes : bytes
+            원본 오디오 파일 내용
+        filename : str
+            원본 파일 이름
+
+        Returns:
+        --------
+        tuple
+            (업로드할 바이트, 업로드 파일 이름)
+        """
+        if self.upload_format == "wav" or not filename.lower().endswith(".wav"):
+            encoded, upload_name, elapsed = wav_bytes, filename, 0.0
+        else:
+            start_time = time.process_time()
+            pcm, sample_rate = read_wav_bytes(wav_bytes)
+            encoded = encode_pcm(pcm, sample_rate, self.upload_format, self.compression_level)
+            elapsed = time.process_time() - start_time
+            upload_name = self.filename
+
+        with self._lock:
+            self.encode_count += 1
+            self.encode_time += elapsed
+            self.raw_bytes += len(wav_bytes)
+            self.wire_bytes += len(encoded)
+
+        return encoded, upload_name
+
+    def get_stats(self):
+        """
+        인코딩 통계를 반환합니다.
+
+        Returns:
+        --------
+        dict
+            형식, 인코딩 횟수, 평균 인코딩 CPU 시간(ms), 원본/전송 바이트 수, 압축률
+        """
+        with self._lock:
+            return {
+                "upload_format": self.upload_format,
+                "encode_count": self.encode_count,
+                "encode_ms_mean": self.encode_time / self.encode_count * 1000 if self.encode_count else 0.0,
+                "raw_bytes": self.raw_bytes,
+                "wire_bytes": self.wire_bytes,
+                "ratio": self.wire_bytes / self.raw_bytes if self.raw_bytes else 1.0,
+            }
@@ -0,0 +1,93 @@
+"""
+STT 업로드 형식 비교 스크립트입니다.
+문장 길이의 오디오를 형식별로 인코딩하여 인코딩 CPU 시간, 전송 바이트 수,
+회선 속도별 예상 업로드 시간을 비교합니다.
+"""
+
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+# 프로젝트 루트 경로를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.audio_input import AudioInput
+from src.audio_codec import available_formats, encode_pcm
+from src.vad_benchmark import create_synthetic_signal
+
+SAMPLE_RATE = 16000
+
+
+def measure_format(pcm, upload_format, repeats=5, compression_level=None):
+    """
+    한 형식의 인코딩 CPU 시간(중앙값)과 결과 크기 측정
+
+    Returns:
+        (인코딩 CPU 시간 ms, 바이트 수)
+    """
+    times = []
+    encoded = b""
+    for _ in range(repeats):
+        start_time = time.process_time()
+        encoded = encode_pcm(pcm, SAMPLE_RATE, upload_format, compression_level)
+        times.append(time.process_time() - start_time)
+    return float(np.median(times)) * 1000, len(encoded)
+
+
+def print_results(title, pcm, uplinks, repeats, compression_level):
+    """형식별 측정 결과 표 출력"""
+    duration = len(pcm) / SAMPLE_RATE
+    print(f"\n[{title}] {duration:.1f}초")
+
+    header = f"{'형식':<8}{'인코딩(ms)':>12}{'크기(KB)':>10}{'비율':>7}"
+    for kbps in uplinks:
+        header += f"{f'{kbps}kbps 합계(ms)':>18}"
+    print(header)
+
+    raw_bytes = None
+    for upload_format in available_formats():
+        encode_ms, size = measure_format(pcm, upload_format, repeats, compression_level)
+        if raw_bytes is None:
+            raw_bytes = size
+
+        # 합계 = 인코딩 시간 + 업로드 시간
+        line = f"{upload_format:<8}{encode_ms:>12.2f}{size / 1024:>10.1f}{size / raw_bytes:>7.2f}"
+        for kbps in uplinks:
+            line += f"{encode_ms + size * 8 / (kbps * 1000) * 1000:>18.0f}"
+        print(line)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='STT 업로드 형식 비교')
+    parser.add_argument('wav_files', nargs='*',
+                        help='측정할 WAV 파일 (생략 시 10초 합성 신호 사용)')
+    parser.add_argument('--uplink', type=int, nargs='+', default=[256, 1000, 5000],
+                        help='예상 업로드 시간을 계산할 회선 속도 (kbps, 기본값: 256 1000 5000)')
+    parser.add_argument('--repeats', type=int, default=5,
+                        help='형식별 인코딩 반복 횟수 (기본값: 5)')
+    parser.add_argument('--compression-level', type=float, default=None,
+                        help='손실 압축 형식의 압축 정도 (0~1)')
+    args = parser.parse_args()
+
+    print(f"사용 가능한 형식: {', '.join(available_formats())}")
+
+    if not args.wav_files:
+        audio, _ = create_synthetic_signal()
+        pcm = audio[:10 * SAMPLE_RATE].reshape(-1, 1)
+        print_results("합성 신호", pcm, args.uplink, args.repeats, args.compression_level)
+        return
+
+    loader = AudioInput()
+    for file_path in args.wav_files:
+        audio = loader.load_from_wav_file(file_path)
+        if audio.size == 0:
+            continue
+        pcm = audio.reshape(len(audio), -1)
+        print_results(os.path.basename(file_path), pcm, args.uplink, args.repeats, args.compression_level)
+
+
+if __name__ == "__main__":
+    main()
@@ -15,7 +15,10 @@ import queue
 
 from src.audio_input import AudioInput
 from src.stt_handler import STTHandler
-from src.emotion_analyzer import EmotionAnalyzer
+from src.wav_writer import BackgroundWavWriter
+from src.streaming_stt import split_wav_on_pauses
+from src.emotion_analyzer import get_emotion_name
+from src.emotion_stream import IncrementalEmotionEstimator
 from src.preset_loader import PresetLoader
 
 # 기본 색상 정의
@@ -58,7 +61,6 @@ class AudioRecorderGUI:
         # 모듈 초기화
         self.audio_input = AudioInput(sample_rate=16000, channels=1, chunk_duration=0.1)
         self.stt_handler = STTHandler(language="ko", temperature=0)
-        self.emotion_analyzer = EmotionAnalyzer()
         self.preset_loader = PresetLoader()
         
         # 상태 변수
@@ -74,6 +76,11 @@ class AudioRecorderGUI:
         # 결과 큐 (스레드 간 데이터 전달)
         self.result_queue = queue.Queue()
         
+        # 녹음 파일은 백그라운드에서 저장 (저장이 끝나면 목록 새로고침)
+        self.wav_writer = BackgroundWavWriter(
+            on_saved=lambda path: self.result_queue.put(("file_saved", path))
+        )
+        
         # 오디오 녹음 디렉토리 확인 및 생성
         self.recordings_dir = "audio_recordings"
         os.makedirs(self.recordings_dir, exist_ok=True)
@@ -316,7 +323,8 @@ class AudioRecorderGUI:
             while self.is_recording:
                 chunk = self.audio_input.get_audio_chunk(timeout=0.2)
                 if chunk is not None:
-                    self.audio_chunks.append(chunk)
+                    # 링 버퍼 뷰이므로 보관용으로 복사
+                    self.audio_chunks.append(chunk.copy())
                     
             # 녹음 중지
             self.audio_input.stop_recording()
@@ -326,12 +334,15 @@ class AudioRecorderGUI:
                 # 청크를 하나의 배열로 결합
                 self.audio_data = np.vstack(self.audio_chunks)
                 
-                # 파일로 저장
-                file_path = self.audio_input.save_to_wav_file(self.audio_data)
+                # 메모리에서 WAV로 인코딩하고, 파일 저장은 백그라운드 작업으로 넘김
+                wav_bytes = self.audio_input.get_wav_bytes(self.audio_data)
+                file_path = self.wav_writer.submit(
+                    wav_bytes, self.audio_input.make_recording_path(self.recordings_dir)
+                )
                 self.last_saved_file = file_path
                 
-                # GUI 스레드에 완료 알림
-                self.result_queue.put(("recording_complete", file_path))
+                # GUI 스레드에 완료 알림 (STT는 디스크를 거치지 않고 바이트로 바로 변환)
+                self.result_queue.put(("recording_complete", (file_path, wav_bytes)))
             else:
                 self.result_queue.put(("recording_error", "녹음된 데이터가 없습니다."))
         
@@ -350,19 +361,20 @@ class AudioRecorderGUI:
                 
                 if msg_type == "recording_complete":
                     # 녹음 완료
-                    file_path = msg_data
+                    file_path, wav_bytes = msg_data
                     self.status_label.config(text="녹음이 완료되었습니다. 변환 중...")
                     
-                    # 목록 새로고침
-                    self._load_recording_list()
-                    
-                    # 파일에서 텍스트 변환 (스레드로 실행)
+                    # 메모리의 WAV 바이트로 텍스트 변환 (스레드로 실행)
                     threading.Thread(
                         target=self._convert_file_thread,
-                        args=(file_path,),
+                        args=(file_path, wav_bytes),
                         daemon=True
                     ).start()
                 
+                elif msg_type == "file_saved":
+                    # 백그라운드 저장 완료 후 목록 새로고침
+                    self._load_recording_list()
+                
                 elif msg_type == "recording_error":
                     # 녹음 오류
                     self.status_label.config(text=f"녹음 오류: {msg_data}")
@@ -374,6 +386,19 @@ class AudioRecorderGUI:
                     self.result_text.delete(1.0, tk.END)
                     self.result_text.insert(tk.END, text)
                 
+                elif msg_type == "partial_text":
+                    # 구간별 변환 결과를 도착하는 대로 표시
+                    self.result_text.delete(1.0, tk.END)
+                    self.result_text.insert(tk.END, msg_data)
+                
+                elif msg_type == "emotion_preset":
+                    # 감정 확정 및 프리셋 선택
+                    emotion_number, preset_info, early = msg_data
+                    if early:
+                        self.status_label.config(
+                            text=f"감정 확정: {get_emotion_name(emotion_number)} - 변환을 마무리하는 중..."
+                        )
+                
                 elif msg_type == "conversion_error":
                     # 변환 오류
                     self.status_label.config(text=f"변환 오류: {msg_data}")
@@ -460,34 +485,55 @@ class AudioRecorderGUI:
             daemon=True
         ).start()
     
-    def _convert_file_thread(self, file_path):
+    def _convert_file_thread(self, file_path, wav_bytes=None):
         """
         파일을 텍스트로 변환하는 스레드 함수
         
+        녹음을 쉼 위치에서 여러 구간으로 나누어 동시에 변환하고, 구간 결과가 순서대로
+        도착할 때마다 감정을 점진적으로 추정합니다. 감정이 일찍 확정되면 전체 변환이
+        끝나기 전에 베이스 프리셋을 먼저 선택합니다.
+        
         Parameters:
         -----------
         file_path : str
             변환할 WAV 파일 경로
+        wav_bytes : bytes or None
+            이미 메모리에 있는 WAV 바이트 (있으면 파일을 다시 읽지 않음)
         """
         try:
-            # 파일에서 텍스트 변환
-            text = self.stt_handler.transcribe_wav_file(file_path, prompt="음악, 감정 관련 단어")
+            # 메모리의 WAV 바이트가 없으면 파일에서 읽기
+            if wav_bytes is None:
+                with open(file_path, 'rb') as audio_file:
+                    wav_bytes = audio_file.read()
+            
+            # 구간별 변환을 한꺼번에 시작
+            segments = split_wav_on_pauses(wav_bytes)
+            futures = [
+                self.stt_handler.submit_audio(segment, prompt="음악, 감정 관련 단어")
+                for segment in segments
+            ]
+            
+            # 구간 결과가 도착하는 대로 감정 추정 (확정되면 _apply_emotion 호출)
+            estimator = IncrementalEmotionEstimator(on_commit=self._apply_emotion)
+            fragments = []
+            for future in futures:
+                fragment = future.result().strip()
+                if fragment:
+                    fragments.append(fragment)
+                estimator.add_fragment(fragment)
+                if len(futures) > 1:
+                    self.result_queue.put(("partial_text", " ".join(fragments)))
+            text = " ".join(fragments)
             
-            # 결과가 있으면 감정 분석 진행
+            # 결과가 있으면 감정 확정 (미리 확정되지 않았으면 전체 텍스트로 분석)
             if text:
-                # 감정 분석
-                emotion_number = self.emotion_analyzer.analyze_emotion(text)
-                emotion_name = self.emotion_analyzer.get_emotion_name(emotion_number)
-                
-                # 감정에 따른 프리셋 로드
-                preset_info = self.preset_loader.get_preset_by_emotion(emotion_number)
-                
-                # 현재 감정 및 프리셋 저장
-                self.current_emotion = str(emotion_number)
-                self.current_preset = preset_info
+                emotion_number = estimator.finish(text)
+                emotion_name = get_emotion_name(emotion_number)
+                preset_info = self.current_preset
                 
                 # 감정 분석 결과와 함께 텍스트 표시
-                result_text = f"{text}\n\n[감정: {emotion_name} ({emotion_number}번)]\n"
+                early_note = " - 변환 도중 확정" if estimator.committed_early else ""
+                result_text = f"{text}\n\n[감정: {emotion_name} ({emotion_number}번){early_note}]\n"
                 
                 # 프리셋 정보 추가
                 result_text += f"\n[선택된 베이스 프리셋]\n"
@@ -496,9 +542,6 @@ class AudioRecorderGUI:
                 
                 # 결과 큐에 추가
                 self.result_queue.put(("conversion_complete", result_text))
-                
-                # 감정에 따른 프리셋 정보 큐에 추가
-                self.result_queue.put(("emotion_preset", (emotion_number, preset_info)))
             else:
                 self.result_queue.put(("conversion_error", "텍스트 변환 결과가 없습니다."))
         
@@ -506,6 +549,29 @@ class AudioRecorderGUI:
             print(f"변환 스레드 오류: {str(e)}")
             self.result_queue.put(("conversion_error", str(e)))
     
+    def _apply_emotion(self, emotion_number, confidence, early):
+        """
+        확정된 감정에 맞는 프리셋 선택 (IncrementalEmotionEstimator의 on_commit)
+        
+        Parameters:
+        -----------
+        emotion_number : int
+            확정된 감정 번호
+        confidence : float
+            확정 시점의 감정 확률
+        early : bool
+            전체 변환이 끝나기 전에 확정되었는지 여부
+        """
+        # 감정에 따른 프리셋 로드
+        preset_info = self.preset_loader.get_preset_by_emotion(emotion_number)
+        
+        # 현재 감정 및 프리셋 저장
+        self.current_emotion = str(emotion_number)
+        self.current_preset = preset_info
+        
+        # 감정에 따른 프리셋 정보 큐에 추가 (베이스 재생은 이 시점부터 시작 가능)
+        self.result_queue.put(("emotion_preset", (emotion_number, preset_info, early)))
+    
     def _play_selected_file(self):
         """
         선택한 파일 재생 (현재는 구현되지 않음)
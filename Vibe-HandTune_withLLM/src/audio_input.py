@@ -5,12 +5,14 @@ sounddevice 라이브러리를 사용하여 실시간 오디오 스트림을 캡
 
 import numpy as np
 import sounddevice as sd
-import queue
 import threading
 import time
 import os
 import wave
+import struct
 import datetime
+from src.audio_buffer import AudioRingBuffer
+from src.audio_codec import encode_pcm
 
 class AudioInput:
     """
@@ -20,7 +22,8 @@ class AudioInput:
                  sample_rate=16000, 
                  channels=1, 
                  chunk_duration=1.0,
-                 dtype='int16'):
+                 dtype='int16',
+                 buffer_duration=10.0):
         """
         AudioInput 클래스 초기화
 
@@ -34,6 +37,8 @@ class AudioInput:
             각 오디오 청크의 길이 (초)
         dtype : str
             오디오 데이터 타입 ('int16', 'float32' 등)
+        buffer_duration : float
+            링 버퍼에 보관할 수 있는 최대 오디오 길이 (초)
         """
         self.sample_rate = sample_rate
         self.channels = channels
@@ -41,26 +46,30 @@ class AudioInput:
         self.dtype = dtype
         self.chunk_size = int(self.sample_rate * self.chunk_duration)
         
-        # 오디오 데이터를 저장할 큐
-        self.audio_queue = queue.Queue()
+        # 오디오 데이터를 저장할 사전 할당 링 버퍼 (최소 청크 2개 분량)
+        buffer_frames = max(int(self.sample_rate * buffer_duration), self.chunk_size * 2)
+        self.ring_buffer = AudioRingBuffer(buffer_frames, channels=self.channels, dtype=self.dtype)
         
         # 스트림 상태 변수
         self.is_recording = False
         self.stream = None
         self.stream_thread = None
+        
+        # WAV 헤더 템플릿 캐시 ((채널 수, 샘플링 레이트) -> 44바이트 헤더)
+        self._wav_header_cache = {}
     
     def _audio_callback(self, indata, frames, time, status):
         """
         오디오 스트림 콜백 함수
         
         sounddevice 라이브러리에서 호출되는 콜백으로, 
-        입력 오디오 데이터를 큐에 추가합니다.
+        입력 오디오 데이터를 사전 할당된 링 버퍼에 복사합니다. (메모리 할당 없음)
         """
         if status:
             print(f"상태: {status}")
         
-        # 입력 데이터를 큐에 넣기
-        self.audio_queue.put(indata.copy())
+        # 입력 데이터를 링 버퍼에 기록 (공간이 부족하면 오버런으로 집계됨)
+        self.ring_buffer.write(indata)
     
     def start_recording(self):
         """
@@ -70,9 +79,9 @@ class AudioInput:
             print("이미 녹음 중입니다.")
             return
         
-        # 큐 초기화
-        while not self.audio_queue.empty():
-            self.audio_queue.get()
+        # 버퍼 초기화
+        self.ring_buffer.clear()
+        self.ring_buffer.reset_stats()
         
         # 오디오 스트림 설정 및 시작
         self.stream = sd.InputStream(
@@ -104,27 +113,40 @@ class AudioInput:
     
     def get_audio_chunk(self, timeout=None):
         """
-        오디오 큐에서 청크를 가져옵니다.
+        링 버퍼에서 청크 하나(chunk_size 프레임)를 가져옵니다.
+        
+        반환값은 링 버퍼 내부를 가리키는 뷰이므로 복사 비용이 없습니다.
+        버퍼가 한 바퀴 돌면 덮어써지므로, 오래 보관하려면 호출자가 복사해야 합니다.
         
         Parameters:
         -----------
         timeout : float or None
-            큐에서 데이터를 기다리는 시간 (초). None이면 무한정 대기.
+            버퍼에서 데이터를 기다리는 시간 (초). None이면 무한정 대기.
             
         Returns:
         --------
         numpy.ndarray or None
             오디오 데이터 청크, 타임아웃이면 None 반환
         """
-        try:
-            return self.audio_queue.get(timeout=timeout)
-        except queue.Empty:
-            return None
+        return self.ring_buffer.read(self.chunk_size, timeout=timeout)
+    
+    def get_buffer_stats(self):
+        """
+        링 버퍼의 점유율 및 오버런 통계를 반환합니다.
+        
+        Returns:
+        --------
+        dict
+            fill_level, peak_fill_level, overrun_count 등 버퍼 지표
+        """
+        return self.ring_buffer.get_stats()
     
     def record_for_duration(self, duration):
         """
         지정된 시간(초) 동안 오디오를 녹음하고 전체 데이터를 반환합니다.
         
+        반환값은 링 버퍼 내부를 가리키는 뷰이며 다음 녹음을 시작하기 전까지 유효합니다.
+        
         Parameters:
         -----------
         duration : float
@@ -135,62 +157,122 @@ class AudioInput:
         numpy.ndarray
             녹음된 전체 오디오 데이터
         """
+        # 청크 단위로 녹음되므로 청크 수 기준으로 프레임 수 계산
+        num_chunks = int(duration / self.chunk_duration) + 1
+        num_frames = num_chunks * self.chunk_size
+        
+        # 전체 녹음이 한 번의 뷰로 읽히도록 버퍼 용량 확보
+        if num_frames > self.ring_buffer.capacity and not self.is_recording:
+            self.ring_buffer = AudioRingBuffer(num_frames, channels=self.channels, dtype=self.dtype)
+        
         # 녹음 시작
         self.start_recording()
         
-        # 청크 수 계산
-        num_chunks = int(duration / self.chunk_duration) + 1
-        chunks = []
-        
-        # 지정된 시간 동안 오디오 청크 수집
-        for _ in range(num_chunks):
-            chunk = self.get_audio_chunk(timeout=self.chunk_duration * 1.5)
-            if chunk is not None:
-                chunks.append(chunk)
-            else:
-                break
+        # 지정된 시간 동안 오디오가 쌓이기를 기다림
+        self.ring_buffer.wait_for(num_frames, timeout=duration + self.chunk_duration * 1.5)
         
         # 녹음 중지
         self.stop_recording()
         
-        # 청크들을 하나의 배열로 결합
-        if chunks:
-            return np.vstack(chunks)
+        # 쌓인 데이터를 복사 없이 하나의 배열(뷰)로 반환
+        audio_data = self.ring_buffer.read_available(num_frames)
+        if audio_data.size > 0:
+            return audio_data
         else:
             return np.array([])
     
+    def _wav_header(self, data_size):
+        """
+        PCM 데이터 크기에 맞는 44바이트 WAV 헤더를 반환합니다.
+        
+        포맷 정보가 담긴 헤더 템플릿은 (채널 수, 샘플링 레이트)마다 한 번만 만들고,
+        호출마다 RIFF/data 크기 필드만 채워 넣습니다.
+        """
+        key = (self.channels, self.sample_rate)
+        template = self._wav_header_cache.get(key)
+        if template is None:
+            sample_width = 2  # int16은 2바이트
+            template = struct.pack(
+                '<4sI4s4sIHHIIHH4sI',
+                b'RIFF', 0, b'WAVE',
+                b'fmt ', 16, 1, self.channels, self.sample_rate,
+                self.sample_rate * self.channels * sample_width,
+                self.channels * sample_width, sample_width * 8,
+                b'data', 0
+            )
+            self._wav_header_cache[key] = template
+        
+        header = bytearray(template)
+        struct.pack_into('<I', header, 4, 36 + data_size)
+        struct.pack_into('<I', header, 40, data_size)
+        return header
+    
     def get_wav_bytes(self, audio_data):
         """
         NumPy 배열을 WAV 형식의 바이트로 변환합니다.
         
+        헤더와 오디오 버퍼(memoryview)를 한 번에 이어 붙이므로
+        오디오 데이터는 결과 바이트로 한 번만 복사됩니다.
+        
         Parameters:
         -----------
         audio_data : numpy.ndarray
-            변환할 오디오 데이터
+            변환할 오디오 데이터 (링 버퍼나 문장 버퍼의 뷰도 가능)
             
         Returns:
         --------
         bytes
             WAV 형식의 바이트 데이터
         """
-        import io
-        import wave
-        
         # 데이터가 비어있으면 빈 바이트 반환
         if audio_data.size == 0:
             return b''
         
-        # WAV 파일 형식으로 변환
-        byte_io = io.BytesIO()
-        with wave.open(byte_io, 'wb') as wf:
-            wf.setnchannels(self.channels)
-            wf.setsampwidth(2)  # int16은 2바이트
-            wf.setframerate(self.sample_rate)
-            wf.writeframes(audio_data.tobytes())
+        pcm = np.ascontiguousarray(audio_data, dtype=np.int16)
+        return b''.join((self._wav_header(pcm.nbytes), memoryview(pcm).cast('B')))
+    
+    def get_encoded_bytes(self, audio_data, upload_format="flac", compression_level=None):
+        """
+        NumPy 배열을 압축 형식(FLAC, Ogg Vorbis/Opus, MP3)의 바이트로 변환합니다.
         
-        # 바이트 데이터 반환
-        byte_io.seek(0)
-        return byte_io.read()
+        Parameters:
+        -----------
+        audio_data : numpy.ndarray
+            변환할 오디오 데이터
+        upload_format : str
+            인코딩 형식 ('wav', 'flac', 'ogg', 'opus', 'mp3')
+        compression_level : float or None
+            손실 압축 형식의 압축 정도 (0~1, 클수록 작은 파일)
+            
+        Returns:
+        --------
+        bytes
+            인코딩된 오디오 파일 내용
+        """
+        if audio_data.size == 0:
+            return b''
+        if upload_format == "wav":
+            return self.get_wav_bytes(audio_data)
+        
+        return encode_pcm(audio_data.reshape(-1, self.channels), self.sample_rate,
+                          upload_format, compression_level)
+    
+    def make_recording_path(self, recordings_dir="audio_recordings"):
+        """
+        타임스탬프 기반의 새 녹음 파일 경로를 만듭니다.
+        
+        Parameters:
+        -----------
+        recordings_dir : str
+            녹음 파일을 저장할 디렉토리
+            
+        Returns:
+        --------
+        str
+            녹음 파일 경로
+        """
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        return os.path.join(recordings_dir, f"recording_{timestamp}.wav")
 
     def save_to_wav_file(self, audio_data, file_path=None):
         """
@@ -220,8 +302,7 @@ class AudioInput:
             os.makedirs(recordings_dir, exist_ok=True)
             
             # 타임스탬프로 파일 이름 생성
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            file_path = os.path.join(recordings_dir, f"recording_{timestamp}.wav")
+            file_path = self.make_recording_path(recordings_dir)
         
         # WAV 파일로 저장
         with wave.open(file_path, 'wb') as wf:
@@ -0,0 +1,242 @@
+"""
+녹음 파일 일괄 변환 모듈입니다.
+디렉토리의 WAV 파일을 동시 작업 수와 요청 속도를 제한하며 STT로 변환하고,
+결과를 JSONL 파일에 한 줄씩 바로 기록합니다.
+중간에 중단되어도 다시 실행하면 이미 변환된 파일은 건너뛰고 이어서 진행합니다.
+"""
+
+import os
+import io
+import json
+import time
+import wave
+import threading
+from concurrent.futures import wait, FIRST_COMPLETED
+from src.stt_handler import STTHandler
+
+
+class RateLimiter:
+    """
+    토큰 버킷 방식의 요청 속도 제한 클래스입니다.
+    """
+    def __init__(self, rate_per_minute, burst=1):
+        """
+        RateLimiter 클래스 초기화
+
+        Parameters:
+        -----------
+        rate_per_minute : float
+            분당 허용 요청 수 (0 이하면 제한 없음)
+        burst : int
+            한 번에 몰아서 보낼 수 있는 최대 요청 수
+        """
+        self.rate = rate_per_minute / 60.0
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        요청 하나를 보낼 수 있을 때까지 대기합니다.
+        """
+        if self.rate <= 0:
+            return
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_time = (1 - self._tokens) / self.rate
+            time.sleep(wait_time)
+
+
+def load_completed(output_path):
+    """
+    JSONL 결과 파일에서 변환이 끝난 파일 목록을 읽습니다.
+    충돌로 잘린 마지막 줄이나 실패 기록은 완료로 보지 않습니다.
+
+    Parameters:
+    -----------
+    output_path : str
+        JSONL 결과 파일 경로
+
+    Returns:
+    --------
+    set
+        변환이 끝난 파일의 상대 경로 집합
+    """
+    completed = set()
+    if not os.path.exists(output_path):
+        return completed
+
+    with open(output_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if "text" in record:
+                completed.add(record["file"])
+    return completed
+
+
+def scan_wav_files(input_dir, recursive=False):
+    """
+    디렉토리에서 WAV 파일 목록을 찾습니다.
+
+    Parameters:
+    -----------
+    input_dir : str
+        검색할 디렉토리
+    recursive : bool
+        하위 디렉토리까지 검색할지 여부
+
+    Returns:
+    --------
+    list
+        input_dir 기준 상대 경로 목록 (정렬됨)
+    """
+    files = []
+    if recursive:
+        for root, _, names in os.walk(input_dir):
+            for name in names:
+                if name.lower().endswith(".wav"):
+                    files.append(os.path.relpath(os.path.join(root, name), input_dir))
+    else:
+        files = [name for name in os.listdir(input_dir) if name.lower().endswith(".wav")]
+    return sorted(files)
+
+
+def _wav_duration(wav_bytes):
+    """WAV 바이트의 재생 시간 (초, 읽을 수 없으면 0)"""
+    try:
+        with wave.open(io.BytesIO(wav_bytes), 'rb') as wf:
+            return wf.getnframes() / wf.getframerate()
+    except (wave.Error, EOFError):
+        return 0.0
+
+
+def run_batch(input_dir="audio_recordings", output_path=None, workers=4, rate_limit=50,
+              prompt="", recursive=False, stt_handler=None, progress_interval=10):
+    """
+    디렉토리의 WAV 파일을 일괄 변환합니다.
+
+    Parameters:
+    -----------
+    input_dir : str
+        WAV 파일이 있는 디렉토리
+    output_path : str or None
+        JSONL 결과 파일 경로 (None이면 input_dir/transcripts.jsonl)
+    workers : int
+        동시에 진행할 최대 변환 수
+    rate_limit : float
+        분당 최대 요청 수 (0이면 제한 없음, 캐시 적중은 세지 않음)
+    prompt : str
+        STT 결과를 안내하는 프롬프트
+    recursive : bool
+        하위 디렉토리까지 검색할지 여부
+    stt_handler : STTHandler or None
+        사용할 STT 핸들러 (None이면 workers 동시 요청으로 생성)
+    progress_interval : int
+        진행 상황을 출력할 파일 간격
+
+    Returns:
+    --------
+    dict
+        처리 결과 요약 (변환/실패/건너뜀 파일 수, 처리량)
+    """
+    if output_path is None:
+        output_path = os.path.join(input_dir, "transcripts.jsonl")
+    if stt_handler is None:
+        stt_handler = STTHandler(language="ko", temperature=0, max_concurrency=workers)
+
+    files = scan_wav_files(input_dir, recursive)
+    completed = load_completed(output_path)
+    pending = [name for name in files if name not in completed]
+    print(f"WAV 파일 {len(files)}개 중 {len(files) - len(pending)}개는 이미 변환되어 건너뜁니다.")
+
+    limiter = RateLimiter(rate_limit, burst=workers)
+    in_flight = {}
+    done_count = 0
+    failed_count = 0
+    audio_seconds = 0.0
+    start_time = time.time()
+
+    def report(final=False):
+        elapsed = max(time.time() - start_time, 1e-9)
+        label = "완료" if final else "진행"
+        print(f"[{label}] {done_count + failed_count}/{len(pending)} 파일, "
+              f"{(done_count + failed_count) / elapsed:.2f} 파일/초, "
+              f"{audio_seconds / elapsed:.1f} 오디오초/초 (실패 {failed_count})")
+
+    # 충돌로 마지막 줄이 잘려 있으면 새 기록이 그 줄에 붙지 않도록 줄바꿈 추가
+    if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+        with open(output_path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            needs_newline = f.read(1) != b"\n"
+        if needs_newline:
+            with open(output_path, "ab") as f:
+                f.write(b"\n")
+
+    with open(output_path, "a", encoding="utf-8") as output:
+
+        def collect(futures):
+            nonlocal done_count, failed_count, audio_seconds
+            for future in futures:
+                name, duration = in_flight.pop(future)
+                try:
+                    record = {"file": name, "text": future.result(), "duration": round(duration, 3)}
+                    done_count += 1
+                    audio_seconds += duration
+                except Exception as e:
+                    record = {"file": name, "error": str(e)}
+                    failed_count += 1
+
+                # 결과는 완료 즉시 한 줄씩 기록 (중단되어도 이어서 진행 가능)
+                output.write(json.dumps(record, ensure_ascii=False) + "\n")
+                output.flush()
+
+                if (done_count + failed_count) % progress_interval == 0:
+                    report()
+
+        for name in pending:
+            # 메모리 사용량을 제한하기 위해 진행 중인 요청 수를 workers의 두 배로 유지
+            while len(in_flight) >= workers * 2:
+                finished, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                collect(finished)
+
+            try:
+                with open(os.path.join(input_dir, name), "rb") as f:
+                    wav_bytes = f.read()
+            except OSError as e:
+                print(f"파일 읽기 오류: {name} ({str(e)})")
+                continue
+
+            # 캐시에 있으면 API 요청이 아니므로 속도 제한 대상에서 제외
+            if not stt_handler.is_cached(wav_bytes, prompt):
+                limiter.acquire()
+
+            future = stt_handler.submit_audio(wav_bytes, prompt=prompt)
+            in_flight[future] = (name, _wav_duration(wav_bytes))
+
+        while in_flight:
+            finished, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+            collect(finished)
+
+    report(final=True)
+    elapsed = time.time() - start_time
+    return {
+        "total": len(files),
+        "skipped": len(files) - len(pending),
+        "transcribed": done_count,
+        "failed": failed_count,
+        "elapsed": elapsed,
+        "files_per_second": (done_count + failed_count) / elapsed if elapsed > 0 else 0.0,
+        "audio_seconds_per_second": audio_seconds / elapsed if elapsed > 0 else 0.0,
+        "output_path": output_path,
+    }
@@ -45,7 +45,12 @@ def load_camera_settings(custom_path: Optional[str] = None) -> Dict[str, Any]:
         "min_detection_confidence": 0.7,
         "min_tracking_confidence": 0.5,
         "max_hands": 2,
-        "smooth_landmarks": True
+        "smooth_landmarks": True,
+        "smoothing": {
+            "filter": "one_euro"  # ema, one_euro, kalman (파라미터 기본값은 landmark_filters 참고)
+        },
+        "roi_tracking": False,
+        "roi": {}  # 손 ROI 추적 설정 (기본값은 hand_roi.HandRoiTracker 참고)
     }
     
     # 설정 파일 경로 결정
@@ -72,10 +77,12 @@ def load_camera_settings(custom_path: Optional[str] = None) -> Dict[str, Any]:
         if 'comments' in settings:
             del settings['comments']
             
-        # 기본 설정과 병합 (누락된 설정은 기본값 사용)
+        # 기본 설정과 병합 (누락된 설정은 기본값 사용, 스무딩/ROI 설정은 항목 단위로 병합)
         for key, value in default_settings.items():
             if key not in settings:
                 settings[key] = value
+            elif isinstance(value, dict):
+                settings[key] = {**value, **settings[key]}
         
         return settings
         
@@ -84,6 +91,68 @@ def load_camera_settings(custom_path: Optional[str] = None) -> Dict[str, Any]:
         print("기본 설정을 사용합니다.")
         return default_settings
 
+def load_stt_settings(custom_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    STT 백엔드 설정 파일을 로드합니다.
+    
+    Args:
+        custom_path: 사용자 지정 설정 파일 경로 (선택 사항)
+        
+    Returns:
+        STT 설정 딕셔너리 (backend 및 로컬 엔진별 설정)
+    """
+    # 기본 설정 값 정의
+    default_settings = {
+        "backend": "api",  # api, faster_whisper, stub
+        "faster_whisper": {
+            "model_size": "small",
+            "compute_type": "int8",
+            "cpu_threads": 0,
+            "beam_size": 1
+        },
+        "stub": {
+            "latency_per_second": 0.0
+        }
+    }
+    
+    # 설정 파일 경로 결정
+    if custom_path:
+        settings_path = custom_path
+    else:
+        # 현재 모듈 경로 기준으로 config/stt_settings.json 경로 설정
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        project_root = os.path.dirname(current_dir)
+        settings_path = os.path.join(project_root, "config", "stt_settings.json")
+    
+    # 파일 존재 여부 확인
+    if not os.path.exists(settings_path):
+        print(f"STT 설정 파일을 찾을 수 없습니다: {settings_path}")
+        print("기본 설정을 사용합니다.")
+        return default_settings
+    
+    try:
+        # 설정 파일 로드
+        with open(settings_path, 'r', encoding='utf-8') as f:
+            settings = json.load(f)
+        
+        # comments 필드 제거 (사용하지 않음)
+        if 'comments' in settings:
+            del settings['comments']
+        
+        # 기본 설정과 병합 (엔진별 설정은 항목 단위로 병합)
+        for key, value in default_settings.items():
+            if key not in settings:
+                settings[key] = value
+            elif isinstance(value, dict):
+                settings[key] = {**value, **settings[key]}
+        
+        return settings
+        
+    except Exception as e:
+        print(f"STT 설정 파일 로드 중 오류 발생: {e}")
+        print("기본 설정을 사용합니다.")
+        return default_settings
+
 # 간단한 테스트 코드 (main 블록 내)
 if __name__ == '__main__':
     try:
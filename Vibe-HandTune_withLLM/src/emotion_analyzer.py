@@ -1,12 +1,21 @@
 """
 텍스트 기반 감정 분석 모듈
 OpenAI GPT-4o API를 사용하여 텍스트에서 감정을 분석하고 1~5 사이의 숫자로 분류함
+분석 결과는 정규화한 텍스트 기준으로 캐시하여 반복되는 문장은 API를 다시 호출하지 않음
+먼저 로컬 어휘 사전 분류기로 판단하고, 신뢰도가 낮을 때만 API를 호출함
 """
 
 import os
 import re
+import json
+import time
+import threading
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from openai import OpenAI
 from src.config_loader import load_api_key
+from src.emotion_cache import EmotionCache, normalize_text
+from src.emotion_lexicon import LexiconClassifier
 
 # 감정 매핑 상수
 EMOTION_MAP = {
@@ -20,6 +29,26 @@ EMOTION_MAP = {
 # 전역 클라이언트 변수
 _client = None
 
+# 전역 결과 캐시
+_cache = EmotionCache()
+
+# 1단계 로컬 분류기
+_lexicon = LexiconClassifier()
+
+# 단계별 판단 횟수와 전체 지연 시간 기록 (최근 LATENCY_WINDOW개)
+LATENCY_WINDOW = 1000
+_cascade_lock = threading.Lock()
+_tier_counts = {"lexicon": 0, "llm": 0, "fallback": 0}
+_latencies = deque(maxlen=LATENCY_WINDOW)
+
+# 일괄 분석 토큰 추정값 (한국어는 글자당 약 1토큰으로 넉넉하게 계산)
+BATCH_PROMPT_TOKENS = 250
+ITEM_OVERHEAD_TOKENS = 8
+RESPONSE_TOKENS_PER_ITEM = 12
+
+# 마지막 일괄 분석 결과 요약
+_batch_stats = {}
+
 def _get_client():
     """OpenAI 클라이언트 초기화 및 반환"""
     global _client
@@ -49,24 +78,120 @@ def _create_emotion_prompt(text):
         {"role": "user", "content": user_message}
     ]
 
+def _create_batch_prompt(texts):
+    """여러 텍스트를 한 번에 분석하기 위한 프롬프트 생성"""
+    system_message = """당신은 감정 분석 전문가입니다. 
+번호가 붙은 여러 텍스트가 주어집니다. 각 텍스트의 감정을 아래 다섯 가지 중 하나로 분류하세요.
+
+1: 슬픔 - 우울함, 슬픔, 상실감, 절망
+2: 평온 - 안정, 차분함, 평화로움
+3: 중립 - 감정이 없거나 중립적, 일상적
+4: 행복 - 기쁨, 즐거움, 만족감
+5: 흥분 - 열정, 활기참, 에너지, 격앙됨
+
+다음 JSON 형식으로만 답변하세요. 모든 번호를 한 번씩 포함해야 합니다.
+{"results": [{"id": 텍스트 번호, "emotion": 감정 숫자}, ...]}"""
+
+    lines = [f"{index}. {' '.join(text.split())}" for index, text in enumerate(texts, 1)]
+    user_message = "다음 텍스트들의 감정을 분석해주세요:\n" + "\n".join(lines)
+
+    return [
+        {"role": "system", "content": system_message},
+        {"role": "user", "content": user_message}
+    ]
+
+def _parse_emotion(value):
+    """응답 값에서 감정 번호 추출 (없으면 None)"""
+    match = re.search(r'[1-5]', str(value))
+    return int(match.group(0)) if match else None
+
 def _validate_response(response):
     """API 응답에서 유효한 감정 번호 추출"""
-    match = re.search(r'[1-5]', response)
+    emotion = _parse_emotion(response)
     
-    if match:
-        return int(match.group(0))
+    if emotion is not None:
+        return emotion
     else:
         print(f"유효하지 않은 응답: {response}")
         return 3  # 기본값: 중립
 
-def analyze_emotion(text, model="gpt-4o-mini", temperature=0.2):
+def _request_emotion(text, model, temperature):
+    """API를 호출하여 감정 번호 반환 (오류는 호출한 쪽으로 전달)"""
+    client = _get_client()
+    messages = _create_emotion_prompt(text)
+
+    response = client.chat.completions.create(
+        model=model,
+        messages=messages,
+        temperature=temperature,
+        max_tokens=10
+    )
+
+    result = response.choices[0].message.content.strip()
+    return _validate_response(result)
+
+def _request_emotions(texts, model, temperature):
+    """
+    여러 텍스트를 한 번의 API 호출로 분석
+
+    Returns:
+        list: 텍스트별 감정 번호 (응답에서 찾지 못하거나 유효하지 않은 항목은 None)
+    """
+    client = _get_client()
+    messages = _create_batch_prompt(texts)
+
+    response = client.chat.completions.create(
+        model=model,
+        messages=messages,
+        temperature=temperature,
+        max_tokens=RESPONSE_TOKENS_PER_ITEM * len(texts) + 20,
+        response_format={"type": "json_object"}
+    )
+
+    emotions = [None] * len(texts)
+    content = response.choices[0].message.content
+    try:
+        data = json.loads(content)
+    except (TypeError, ValueError):
+        print(f"유효하지 않은 일괄 응답: {content}")
+        return emotions
+
+    items = data.get("results") if isinstance(data, dict) else data
+    if not isinstance(items, list):
+        return emotions
+
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        try:
+            index = int(item.get("id")) - 1
+        except (TypeError, ValueError):
+            continue
+        if 0 <= index < len(texts) and emotions[index] is None:
+            emotions[index] = _parse_emotion(item.get("emotion"))
+    return emotions
+
+def _record_decision(tier, start_time):
+    """판단한 단계와 전체 지연 시간 기록"""
+    with _cascade_lock:
+        _tier_counts[tier] += 1
+        _latencies.append(time.perf_counter() - start_time)
+
+def analyze_emotion(text, model="gpt-4o-mini", temperature=0.2, use_cache=True,
+                    use_lexicon=True, min_confidence=0.6):
     """
     텍스트에서 감정을 분석하여 1~5 사이의 숫자로 반환
     
+    어휘 사전 분류기의 신뢰도가 min_confidence 이상이면 API를 호출하지 않고 바로 반환하며,
+    API 호출이 실패하면 어휘 사전 분류 결과를 사용함
+    
     Args:
         text: 분석할 텍스트
         model: 사용할 OpenAI 모델 이름
         temperature: 모델의 온도 값 (0~1)
+        use_cache: 결과 캐시 사용 여부 (같은 텍스트의 동시 요청도 한 번만 호출)
+        use_lexicon: 어휘 사전 분류기를 먼저 사용할지 여부
+        min_confidence: 어휘 사전 분류 결과를 그대로 쓸 최소 신뢰도 (0~1)
         
     Returns:
         int: 감정 번호 (1~5)
@@ -80,23 +205,233 @@ def analyze_emotion(text, model="gpt-4o-mini", temperature=0.2):
         print("빈 텍스트입니다.")
         return 3
     
+    start_time = time.perf_counter()
+    lexicon_emotion = 3
+    if use_lexicon:
+        lexicon_emotion, confidence, _ = _lexicon.classify(text)
+        if confidence >= min_confidence:
+            _record_decision("lexicon", start_time)
+            return lexicon_emotion
+    
     try:
-        client = _get_client()
-        messages = _create_emotion_prompt(text)
-        
-        response = client.chat.completions.create(
-            model=model,
-            messages=messages,
-            temperature=temperature,
-            max_tokens=10
-        )
-        
-        result = response.choices[0].message.content.strip()
-        return _validate_response(result)
+        if use_cache:
+            key = (normalize_text(text), model, temperature)
+            emotion = _cache.get_or_compute(key, lambda: _request_emotion(text, model, temperature))
+        else:
+            emotion = _request_emotion(text, model, temperature)
+        _record_decision("llm", start_time)
+        return emotion
         
     except Exception as e:
         print(f"감정 분석 중 오류 발생: {str(e)}")
-        return 3
+        _record_decision("fallback", start_time)
+        return lexicon_emotion
+
+class _TokenBudget:
+    """분당 토큰 사용량 제한 (토큰 버킷)"""
+
+    def __init__(self, tokens_per_minute):
+        """
+        _TokenBudget 초기화
+
+        Args:
+            tokens_per_minute: 분당 허용 토큰 수 (0 이하면 제한 없음)
+        """
+        self.capacity = tokens_per_minute
+        self.rate = tokens_per_minute / 60.0
+        self._tokens = float(tokens_per_minute)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens):
+        """tokens만큼 사용할 수 있을 때까지 대기 (capacity보다 큰 요청은 버킷이 가득 차면 허용)"""
+        if self.rate <= 0:
+            return
+
+        tokens = min(tokens, self.capacity)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait_time = (tokens - self._tokens) / self.rate
+            time.sleep(wait_time)
+
+def _estimate_tokens(text):
+    """텍스트 하나를 일괄 프롬프트에 넣을 때의 예상 토큰 수"""
+    return len(text) + ITEM_OVERHEAD_TOKENS + RESPONSE_TOKENS_PER_ITEM
+
+def _pack_batches(entries, max_batch_size, max_batch_tokens):
+    """항목들을 크기와 예상 토큰 수 제한에 맞게 순서대로 묶음"""
+    batches = []
+    batch = []
+    batch_tokens = BATCH_PROMPT_TOKENS
+    for entry in entries:
+        tokens = _estimate_tokens(entry[0])
+        if batch and (len(batch) >= max_batch_size or batch_tokens + tokens > max_batch_tokens):
+            batches.append(batch)
+            batch = []
+            batch_tokens = BATCH_PROMPT_TOKENS
+        batch.append(entry)
+        batch_tokens += tokens
+    if batch:
+        batches.append(batch)
+    return batches
+
+def analyze_emotions(texts, model="gpt-4o-mini", temperature=0.2, use_cache=True,
+                     use_lexicon=True, min_confidence=0.6, max_batch_size=40,
+                     max_batch_tokens=3000, workers=4, tokens_per_minute=0, verbose=True):
+    """
+    여러 텍스트의 감정을 일괄 분석하여 입력 순서대로 반환
+    
+    어휘 사전과 캐시로 판단할 수 없는 텍스트만 중복을 없앤 뒤 여러 개씩 한 프롬프트에 묶어
+    JSON 응답으로 받고, 묶음들은 workers개까지 동시에 요청함.
+    응답에서 빠졌거나 유효하지 않은 항목은 analyze_emotion()으로 하나씩 다시 분석함
+    
+    Args:
+        texts: 분석할 텍스트 목록
+        model: 사용할 OpenAI 모델 이름
+        temperature: 모델의 온도 값 (0~1)
+        use_cache: 결과 캐시 사용 여부
+        use_lexicon: 어휘 사전 분류기를 먼저 사용할지 여부
+        min_confidence: 어휘 사전 분류 결과를 그대로 쓸 최소 신뢰도 (0~1)
+        max_batch_size: 한 요청에 넣을 최대 텍스트 수
+        max_batch_tokens: 한 요청의 최대 예상 토큰 수 (프롬프트 + 응답)
+        workers: 동시에 보낼 최대 요청 수
+        tokens_per_minute: 분당 최대 예상 토큰 수 (0이면 제한 없음)
+        verbose: 처리 결과 요약 출력 여부
+        
+    Returns:
+        list: 텍스트별 감정 번호 (1~5)
+    """
+    start_time = time.perf_counter()
+    results = [3] * len(texts)
+    pending = OrderedDict()  # 캐시 키 -> (텍스트, 입력 인덱스 목록)
+    lexicon_count = 0
+    cache_count = 0
+
+    for index, text in enumerate(texts):
+        if not text or not isinstance(text, str) or not text.strip():
+            continue
+        text = text.strip()
+
+        if use_lexicon:
+            emotion, confidence, _ = _lexicon.classify(text)
+            if confidence >= min_confidence:
+                results[index] = emotion
+                lexicon_count += 1
+                continue
+
+        key = (normalize_text(text), model, temperature)
+        if key in pending:
+            pending[key][1].append(index)
+            continue
+        if use_cache:
+            emotion = _cache.get(key)
+            if emotion is not None:
+                results[index] = emotion
+                cache_count += 1
+                continue
+        pending[key] = (text, [index])
+
+    batches = _pack_batches(list(pending.items()),
+                            max_batch_size, max_batch_tokens)
+    budget = _TokenBudget(tokens_per_minute)
+    retried = [0]
+    retried_lock = threading.Lock()
+
+    def run_batch(batch):
+        batch_texts = [text for _, (text, _) in batch]
+        budget.acquire(BATCH_PROMPT_TOKENS + sum(_estimate_tokens(text) for text in batch_texts))
+
+        request_start = time.perf_counter()
+        try:
+            emotions = _request_emotions(batch_texts, model, temperature)
+        except Exception as e:
+            print(f"일괄 감정 분석 중 오류 발생: {str(e)}")
+            emotions = [None] * len(batch)
+        latency = (time.perf_counter() - request_start) / len(batch)
+
+        for position, ((key, (text, _)), emotion) in enumerate(zip(batch, emotions)):
+            if emotion is None:
+                # 항목별 대체: 하나씩 다시 분석 (실패하면 어휘 사전 추정 사용)
+                with retried_lock:
+                    retried[0] += 1
+                emotions[position] = analyze_emotion(text, model, temperature, use_cache,
+                                                     use_lexicon, min_confidence=float("inf"))
+            elif use_cache:
+                _cache.put(key, emotion, latency)
+        return batch, emotions
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        for batch, emotions in executor.map(run_batch, batches):
+            for (_, (_, indices)), emotion in zip(batch, emotions):
+                for index in indices:
+                    results[index] = emotion
+
+    elapsed = time.perf_counter() - start_time
+    _batch_stats.clear()
+    _batch_stats.update({
+        "texts": len(texts),
+        "lexicon": lexicon_count,
+        "cached": cache_count,
+        "unique_requested": len(pending),
+        "requests": len(batches),
+        "retried": retried[0],
+        "elapsed": elapsed,
+        "texts_per_second": len(texts) / elapsed if elapsed > 0 else 0.0,
+    })
+    if verbose:
+        print(f"[완료] {len(texts)}개 텍스트, {_batch_stats['texts_per_second']:.1f}개/초 "
+              f"(어휘 사전 {lexicon_count}개, 캐시 {cache_count}개, "
+              f"API 요청 {len(batches)}회로 {len(pending)}개, 개별 재시도 {retried[0]}개)")
+    return results
+
+def get_batch_stats():
+    """
+    마지막 analyze_emotions() 실행 결과 요약 반환
+
+    Returns:
+        dict: 텍스트 수, 단계별 처리 수, API 요청 수, 개별 재시도 수, 처리량(개/초)
+    """
+    return dict(_batch_stats)
+
+def get_cascade_stats():
+    """
+    단계별 판단 비율과 전체 지연 시간 백분위 반환
+
+    Returns:
+        dict: 단계별 판단 횟수와 비율, 최근 판단들의 지연 시간 p50/p95/p99 (ms)
+    """
+    with _cascade_lock:
+        counts = dict(_tier_counts)
+        latencies = sorted(_latencies)
+
+    total = sum(counts.values())
+    stats = {
+        "decisions": total,
+        "tiers": counts,
+        "tier_rates": {tier: (count / total if total else 0.0) for tier, count in counts.items()},
+    }
+    for name, q in (("p50_ms", 0.50), ("p95_ms", 0.95), ("p99_ms", 0.99)):
+        stats[name] = latencies[min(int(q * len(latencies)), len(latencies) - 1)] * 1000 if latencies else 0.0
+    return stats
+
+def get_emotion_cache_stats():
+    """
+    감정 분석 캐시 지표 반환
+
+    Returns:
+        dict: 적중률, 합쳐진 동시 요청 수, 절약한 API 호출 수와 시간 등
+    """
+    return _cache.get_stats()
+
+def clear_emotion_cache():
+    """감정 분석 캐시 초기화"""
+    _cache.clear()
 
 def get_emotion_name(emotion_number):
     """감정 번호에 해당하는 감정 이름 반환"""
@@ -111,7 +446,8 @@ def test_emotion_analysis():
         "평화롭고 고요한 밤이야.",
         "그냥 보통 하루였어. 특별한 일은 없었어.",
         "와! 정말 즐겁고 신나는 여행이었어!",
-        "너무 흥분되고 열정적인 공연이었다!"
+        "너무 흥분되고 열정적인 공연이었다!",
+        "와! 정말 즐겁고 신나는 여행이었어!!"
     ]
     
     for text in test_texts:
@@ -122,5 +458,15 @@ def test_emotion_analysis():
         print(f"감정 번호: {emotion_number}")
         print(f"감정 이름: {emotion_name}")
 
+    stats = get_emotion_cache_stats()
+    print(f"\n캐시: 적중 {stats['hits']}회, 합침 {stats['coalesced']}회, "
+          f"절약한 시간 {stats['saved_latency']:.2f}초")
+
+    cascade = get_cascade_stats()
+    print(f"판단 단계: 어휘 사전 {cascade['tiers']['lexicon']}회, API {cascade['tiers']['llm']}회, "
+          f"대체 {cascade['tiers']['fallback']}회")
+    print(f"지연 시간: p50 {cascade['p50_ms']:.2f}ms, p95 {cascade['p95_ms']:.2f}ms, "
+          f"p99 {cascade['p99_ms']:.2f}ms")
+
 if __name__ == "__main__":
     test_emotion_analysis() 
\ No newline at end of file
@@ -0,0 +1,190 @@
+"""
+감정 분석 결과 캐시 모듈
+정규화한 텍스트를 키로 결과를 메모리에 보관(LRU + TTL)하고,
+같은 텍스트에 대한 동시 요청은 하나의 API 호출로 합침
+"""
+
+import re
+import time
+import threading
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import Future
+
+# 캐시에 없음을 나타내는 값 (None도 결과로 저장할 수 있도록 구분)
+_MISSING = object()
+
+
+def normalize_text(text):
+    """
+    캐시 키용 텍스트 정규화
+
+    유니코드 정규화(NFKC), 소문자 변환, 문장 부호 제거, 공백 정리를 하고
+    세 번 이상 반복되는 글자는 두 번으로 줄임 ("신나!!!" -> "신나", "와아아아" -> "와아")
+
+    Args:
+        text: 원본 텍스트
+
+    Returns:
+        str: 정규화된 텍스트
+    """
+    text = unicodedata.normalize("NFKC", text).lower()
+    text = re.sub(r"[^\w\s]", " ", text)
+    text = re.sub(r"(\w)\1{2,}", r"\1\1", text)
+    return " ".join(text.split())
+
+
+class EmotionCache:
+    """감정 분석 결과 캐시 클래스 (스레드 안전)"""
+
+    def __init__(self, max_entries=512, ttl=3600.0):
+        """
+        EmotionCache 초기화
+
+        Args:
+            max_entries: 보관할 최대 항목 수 (넘으면 가장 오래 사용하지 않은 항목부터 제거)
+            ttl: 항목 유효 시간 (초, None이면 만료 없음)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.expirations = 0
+        self.evictions = 0
+        self.saved_latency = 0.0
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # 키 -> (결과, 저장 시각, 계산에 걸린 시간)
+        self._in_flight = {}           # 키 -> Future
+
+    def get(self, key):
+        """
+        캐시된 결과 반환 (없거나 만료되었으면 None)
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            캐시된 결과 또는 None
+        """
+        with self._lock:
+            value = self._lookup(key)
+            if value is _MISSING:
+                self.misses += 1
+                return None
+            return value
+
+    def put(self, key, value, latency=0.0):
+        """
+        결과 저장
+
+        Args:
+            key: 캐시 키
+            value: 저장할 결과
+            latency: 결과를 얻는 데 걸린 시간 (초, 이후 적중 시 절약한 시간으로 집계)
+        """
+        with self._lock:
+            self._store(key, value, latency)
+
+    def get_or_compute(self, key, compute):
+        """
+        캐시된 결과를 반환하거나, 없으면 compute()를 호출하여 결과를 저장
+
+        같은 키를 계산 중인 요청이 있으면 새로 호출하지 않고 그 결과를 기다림.
+        compute()가 예외를 던지면 결과를 저장하지 않고 기다리던 모든 요청에 예외를 전달함
+
+        Args:
+            key: 캐시 키
+            compute: 인자 없이 결과를 반환하는 함수
+
+        Returns:
+            compute()의 결과 또는 캐시된 결과
+        """
+        with self._lock:
+            value = self._lookup(key)
+            if value is not _MISSING:
+                return value
+
+            future = self._in_flight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                future = Future()
+                self._in_flight[key] = future
+                self.misses += 1
+                leader = True
+
+        if not leader:
+            return future.result()
+
+        start_time = time.monotonic()
+        try:
+            value = compute()
+        except BaseException as e:
+            with self._lock:
+                del self._in_flight[key]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._store(key, value, time.monotonic() - start_time)
+            del self._in_flight[key]
+        future.set_result(value)
+        return value
+
+    def _lookup(self, key):
+        """유효한 항목을 찾아 적중으로 집계 (없으면 _MISSING, 잠금을 잡은 상태에서 호출)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+
+        value, stored_at, latency = entry
+        if self.ttl is not None and time.monotonic() - stored_at >= self.ttl:
+            del self._entries[key]
+            self.expirations += 1
+            return _MISSING
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        self.saved_latency += latency
+        return value
+
+    def _store(self, key, value, latency):
+        """항목 저장 후 max_entries를 넘는 오래된 항목 제거 (잠금을 잡은 상태에서 호출)"""
+        self._entries[key] = (value, time.monotonic(), latency)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """저장된 항목과 지표 초기화"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.coalesced = 0
+            self.expirations = self.evictions = 0
+            self.saved_latency = 0.0
+
+    def get_stats(self):
+        """
+        캐시 지표 반환
+
+        Returns:
+            dict: 항목 수, 적중/실패/합침/만료/제거 횟수, 적중률, 절약한 API 호출 수와 시간(초)
+        """
+        with self._lock:
+            lookups = self.hits + self.misses + self.coalesced
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "expirations": self.expirations,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "calls_saved": self.hits + self.coalesced,
+                "saved_latency": self.saved_latency,
+            }
@@ -0,0 +1,168 @@
+"""
+어휘 사전 기반 감정 분류 모듈
+한국어 감정 표현 어휘를 하나의 정규식으로 컴파일하여 텍스트를 한 번만 훑고
+EMOTION_MAP의 다섯 감정별 점수와 신뢰도를 계산함 (API 호출 없이 수십 마이크로초 안에 동작)
+"""
+
+import re
+
+# 감정 번호별 어휘 (정규식 패턴, 가중치)
+# 어간 위주로 적어 활용형("슬프다", "슬펐어", "슬픈")을 함께 잡음
+# 같은 위치에서는 먼저 적힌 패턴 하나만 매치되므로 한 어휘는 한 감정에만 둠
+EMOTION_LEXICON = {
+    1: [  # 슬픔
+        (r"슬프|슬퍼|슬펐|슬픈|슬픔", 1.5), (r"우울", 1.5), (r"눈물|울었|울고|울어", 1.2),
+        (r"외로|쓸쓸", 1.2), (r"그리워|그립", 1.0), (r"힘들|지쳤|지친", 1.0),
+        (r"속상|서운|서럽|아쉽|아쉬워", 1.0), (r"절망|상실|괴로", 1.5),
+        (r"안\s*좋|좋지\s*않|싫어|짜증", 1.0), (r"ㅠ|ㅜ", 0.7),
+    ],
+    2: [  # 평온
+        (r"평화|평온", 1.5), (r"고요|잔잔", 1.5), (r"차분|편안|편해", 1.2),
+        (r"여유|느긋|한가", 1.0), (r"포근|따뜻|아늑", 1.0), (r"조용", 0.8), (r"쉬고|쉬는|휴식", 0.8),
+    ],
+    3: [  # 중립
+        (r"보통", 1.2), (r"평범", 1.2), (r"그냥|그저", 0.8), (r"일상", 0.8),
+        (r"별일\s*없|별\s*일\s*없|특별한\s*일(은|이)?\s*없", 1.5), (r"그럭저럭|무난", 1.2),
+    ],
+    4: [  # 행복
+        (r"행복", 1.5), (r"기쁘|기뻐|기쁜|기뻤", 1.5), (r"즐겁|즐거", 1.2),
+        (r"좋아|좋았|좋은|좋다", 1.0), (r"웃|ㅋㅋ|ㅎㅎ", 0.8), (r"고마|감사", 1.0),
+        (r"사랑", 1.0), (r"재밌|재미있", 1.0), (r"만족|뿌듯", 1.2),
+    ],
+    5: [  # 흥분
+        (r"흥분", 1.5), (r"열정", 1.5), (r"짜릿|두근|설레|설렌", 1.2), (r"최고", 1.0),
+        (r"대박|미쳤|미치겠", 1.2), (r"신나|신났", 1.0), (r"에너지|활기", 1.2),
+        (r"야호|우와|와+!", 1.0), (r"빨리|당장", 0.6),
+    ],
+}
+
+# 강조 표현 (바로 뒤 감정 어휘의 가중치를 키움)
+INTENSIFIER_PATTERN = r"(?:너무|정말|진짜|완전|엄청|매우|아주)\s*"
+INTENSIFIER_WEIGHT = 1.5
+
+# 부정 표현 (부정된 감정 어휘는 점수에 넣지 않음)
+# 앞: 어휘 바로 앞의 "안", "못" ("하나도 안 행복해", "안 슬퍼")
+# 뒤: 어휘 뒤 짧은 어미/조사 다음의 "-지 않", "-지 못", "아니", "없" ("슬프지 않아", "최고는 아니었어")
+PRE_NEGATION_PATTERN = r"(?<![가-힣])(?:안|못)\s*$"
+POST_NEGATION_PATTERN = (r"[가-힣]{0,3}(?:\s*(?:건|게|것은|것도))?\s*"
+                         r"(?:지\s*[도는만]?\s*(?:않|못)|아니|없)")
+
+# 느낌표 하나당 흥분 점수 (최대 EXCLAMATION_MAX)
+EXCLAMATION_WEIGHT = 0.3
+EXCLAMATION_MAX = 1.2
+
+
+class LexiconClassifier:
+    """어휘 사전 기반 감정 분류기"""
+
+    def __init__(self, lexicon=None, evidence_prior=1.5):
+        """
+        LexiconClassifier 초기화 (모든 어휘를 하나의 정규식으로 컴파일)
+
+        Args:
+            lexicon: {감정 번호: [(패턴, 가중치), ...]} (None이면 EMOTION_LEXICON)
+            evidence_prior: 신뢰도 계산 시 더하는 값 (근거가 적을수록 신뢰도가 낮아짐,
+                기본값에서는 강조 없는 어휘 하나만으로는 신뢰도 0.6에 미치지 않음)
+        """
+        self.lexicon = lexicon or EMOTION_LEXICON
+        self.evidence_prior = evidence_prior
+
+        # 어휘마다 이름 있는 그룹을 하나씩 만들어 매치된 그룹 이름으로 감정과 가중치를 찾음
+        self._groups = {}
+        alternatives = []
+        for emotion, entries in self.lexicon.items():
+            for index, (pattern, weight) in enumerate(entries):
+                name = f"e{emotion}_{index}"
+                self._groups[name] = (emotion, weight)
+                alternatives.append(f"(?P<{name}>{pattern})")
+
+        self._pattern = re.compile(f"(?P<boost>{INTENSIFIER_PATTERN})?(?:{'|'.join(alternatives)})")
+        self._pre_negation = re.compile(PRE_NEGATION_PATTERN)
+        self._post_negation = re.compile(POST_NEGATION_PATTERN)
+
+    def is_negated(self, text, start, end):
+        """text[start:end]의 감정 어휘가 앞뒤의 부정 표현으로 부정되었는지 여부"""
+        return bool(self._pre_negation.search(text[max(0, start - 3):start])
+                    or self._post_negation.match(text, end))
+
+    def score(self, text):
+        """
+        감정별 점수 계산 (부정된 어휘는 제외)
+
+        Args:
+            text: 분석할 텍스트
+
+        Returns:
+            dict: {감정 번호: 점수}
+        """
+        scores = dict.fromkeys(self.lexicon, 0.0)
+        for match in self._pattern.finditer(text):
+            if self.is_negated(text, match.start(), match.end()):
+                continue
+            # 어휘 그룹이 강조 그룹보다 나중에 닫히므로 lastgroup이 어휘 그룹 이름
+            emotion, weight = self._groups[match.lastgroup]
+            if match.group("boost"):
+                weight *= INTENSIFIER_WEIGHT
+            scores[emotion] += weight
+
+        if 5 in scores:
+            scores[5] += min(text.count("!") * EXCLAMATION_WEIGHT, EXCLAMATION_MAX)
+        return scores
+
+    def classify(self, text):
+        """
+        텍스트의 감정을 분류하고 신뢰도를 함께 반환
+
+        신뢰도 = 최고 점수 / (전체 점수 + evidence_prior)
+        감정 어휘가 하나도 없으면 중립(3), 신뢰도 0
+
+        Args:
+            text: 분석할 텍스트
+
+        Returns:
+            tuple: (감정 번호, 신뢰도 0~1, 감정별 점수)
+        """
+        scores = self.score(text)
+        total = sum(scores.values())
+        if total <= 0:
+            return 3, 0.0, scores
+
+        emotion = max(scores, key=scores.get)
+        return emotion, scores[emotion] / (total + self.evidence_prior), scores
+
+
+# 테스트 함수
+def test_lexicon_classifier(min_confidence=0.6):
+    """어휘 사전 분류 테스트 (기대 감정이 None이면 신뢰도가 낮아 API에 맡겨야 하는 문장)"""
+    test_cases = [
+        ("오늘은 정말 슬프고 우울한 하루였어...", 1),
+        ("평화롭고 고요한 밤이야.", 2),
+        ("그냥 보통 하루였어. 특별한 일은 없었어.", 3),
+        ("너무 흥분되고 열정적인 공연이었다!", 5),
+        # 부정 표현
+        ("안 슬퍼", None),
+        ("슬프지 않아", None),
+        ("전혀 우울하지 않아", None),
+        ("하나도 안 행복해", None),
+        ("최고는 아니었어", None),
+        ("슬픈 건 아니야", None),
+        # 근거가 어휘 하나뿐인 문장
+        ("우울", None),
+    ]
+
+    classifier = LexiconClassifier()
+    failures = 0
+    for text, expected in test_cases:
+        emotion, confidence, _ = classifier.classify(text)
+        decided = emotion if confidence >= min_confidence else None
+        passed = decided == expected
+        failures += not passed
+        print(f"{'통과' if passed else '실패'}: \"{text}\" -> 감정 {emotion}, 신뢰도 {confidence:.2f} "
+              f"(기대: {expected if expected is not None else 'API 판단'})")
+
+    print(f"\n{len(test_cases) - failures}/{len(test_cases)}개 통과")
+    return failures == 0
+
+
+if __name__ == "__main__":
+    test_lexicon_classifier()
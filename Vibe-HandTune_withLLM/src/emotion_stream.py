@@ -0,0 +1,135 @@
+"""
+부분 텍스트 기반 점진적 감정 추정 모듈
+STT 구간 결과가 도착할 때마다 어휘 사전 점수를 누적하여 감정 분포를 갱신하고,
+분포가 충분히 안정되면 전체 텍스트를 기다리지 않고 감정을 미리 확정함
+"""
+
+import threading
+from src.emotion_lexicon import LexiconClassifier
+from src.emotion_analyzer import analyze_emotion
+
+
+class IncrementalEmotionEstimator:
+    """부분 텍스트로 감정을 점진적으로 추정하는 클래스"""
+
+    def __init__(self, commit_confidence=0.6, stable_fragments=2, min_evidence=1.5,
+                 prior=0.5, on_commit=None, classifier=None):
+        """
+        IncrementalEmotionEstimator 초기화
+
+        Args:
+            commit_confidence: 미리 확정할 최소 확률 (0~1)
+            stable_fragments: 최고 감정이 연속으로 유지되어야 하는 조각 수
+            min_evidence: 미리 확정하기 위한 최소 누적 점수
+            prior: 감정별 기본 점수 (근거가 적을 때 분포를 평평하게 유지)
+            on_commit: 감정이 확정되면 호출할 함수 (감정 번호, 확률, 조기 확정 여부)
+            classifier: 사용할 LexiconClassifier (None이면 기본 어휘 사전)
+        """
+        self.commit_confidence = commit_confidence
+        self.stable_fragments = stable_fragments
+        self.min_evidence = min_evidence
+        self.prior = prior
+        self.on_commit = on_commit
+        self.classifier = classifier or LexiconClassifier()
+
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """새 발화를 위해 상태 초기화"""
+        with self._lock:
+            self.scores = dict.fromkeys(self.classifier.lexicon, 0.0)
+            self.fragments = []
+            self.committed_emotion = None
+            self.committed_early = False
+            self.commit_fragment_count = 0
+            self._leader = None
+            self._stable_count = 0
+
+    def get_distribution(self):
+        """
+        현재 감정 분포 반환
+
+        Returns:
+            dict: {감정 번호: 확률}
+        """
+        with self._lock:
+            return self._distribution()
+
+    def _distribution(self):
+        """누적 점수에 prior를 더해 정규화한 분포 (잠금을 잡은 상태에서 호출)"""
+        total = sum(self.scores.values()) + self.prior * len(self.scores)
+        return {emotion: (score + self.prior) / total for emotion, score in self.scores.items()}
+
+    def add_fragment(self, text):
+        """
+        부분 텍스트 하나를 반영
+
+        Args:
+            text: 새로 도착한 텍스트 조각
+
+        Returns:
+            tuple: (현재 최고 감정 번호, 확률)
+        """
+        commit = None
+        with self._lock:
+            if text and text.strip():
+                self.fragments.append(text.strip())
+                for emotion, score in self.classifier.score(text).items():
+                    self.scores[emotion] += score
+
+            distribution = self._distribution()
+            leader = max(distribution, key=distribution.get)
+            confidence = distribution[leader]
+
+            if sum(self.scores.values()) <= 0:
+                # 감정 어휘가 아직 없으면 안정도를 세지 않음
+                self._leader = None
+                self._stable_count = 0
+            elif leader == self._leader:
+                self._stable_count += 1
+            else:
+                self._leader = leader
+                self._stable_count = 1
+
+            if (self.committed_emotion is None
+                    and self._stable_count >= self.stable_fragments
+                    and confidence >= self.commit_confidence
+                    and sum(self.scores.values()) >= self.min_evidence):
+                self.committed_emotion = leader
+                self.committed_early = True
+                self.commit_fragment_count = len(self.fragments)
+                commit = (leader, confidence)
+
+        if commit is not None and self.on_commit is not None:
+            self.on_commit(commit[0], commit[1], True)
+        return leader, confidence
+
+    def finish(self, full_text=None):
+        """
+        발화가 끝났을 때 최종 감정 반환
+
+        미리 확정된 감정이 있으면 그대로 사용하고, 없으면 전체 텍스트를
+        analyze_emotion()(어휘 사전 → 캐시 → API 단계)으로 분석하여 확정함
+
+        Args:
+            full_text: 전체 텍스트 (None이면 받은 조각들을 이어 붙여 사용)
+
+        Returns:
+            int: 감정 번호 (1~5)
+        """
+        with self._lock:
+            if self.committed_emotion is not None:
+                return self.committed_emotion
+            if full_text is None:
+                full_text = " ".join(self.fragments)
+
+        emotion = analyze_emotion(full_text)
+        with self._lock:
+            self.committed_emotion = emotion
+            self.committed_early = False
+            self.commit_fragment_count = len(self.fragments)
+
+        if self.on_commit is not None:
+            self.on_commit(emotion, self.get_distribution().get(emotion, 0.0), False)
+        return emotion
@@ -0,0 +1,124 @@
+"""
+GestureEngine 처리량 측정 스크립트입니다.
+같은 프레임 목록을 여러 프로세스의 GestureEngine이 동시에 처리하게 하여
+프로세스 수별 전체 FPS, 프로세스당 FPS, CPU 1초(코어 하나)당 처리 프레임 수를 측정하고,
+한 프로세스에서 headless 모드와 화면 표시 모드(그리기, 프레임 복사 포함)의 처리량을 비교합니다.
+
+사용 예:
+    python -m src.gesture_engine_benchmark --video hands.mp4 --workers 1 2 4
+"""
+
+import os
+import sys
+import time
+import argparse
+import multiprocessing
+import numpy as np
+import cv2
+
+# 프로젝트 루트 경로를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.gesture_recognizer import GestureEngine
+
+
+def load_frames(args):
+    """측정용 프레임 목록 (동영상 > 이미지 > 무작위 잡음 순으로 사용)"""
+    frames = []
+    if args.video:
+        cap = cv2.VideoCapture(args.video)
+        while len(frames) < args.frames:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            frames.append(cv2.resize(frame, (args.width, args.height)))
+        cap.release()
+    elif args.image:
+        frame = cv2.resize(cv2.imread(args.image), (args.width, args.height))
+        frames = [frame] * args.frames
+    else:
+        # 손이 없는 프레임: 매 프레임 손바닥 감지 모델이 실행되는 가장 무거운 경우
+        rng = np.random.default_rng(0)
+        frames = [rng.integers(0, 256, (args.height, args.width, 3), dtype=np.uint8)] * args.frames
+
+    if not frames:
+        raise SystemExit("측정할 프레임을 읽지 못했습니다.")
+    return frames
+
+
+def process_frames(frames, headless, repeats):
+    """엔진 하나로 프레임 목록을 repeats번 처리 (처리 프레임 수, 경과 시간, CPU 시간, 감지 프레임 수)"""
+    engine = GestureEngine(headless=headless, flip_horizontal=True)
+    # 모델 로딩과 첫 추론은 측정에서 제외
+    engine.process_frame(frames[0])
+
+    detected = 0
+    start_time = time.perf_counter()
+    start_cpu = time.process_time()
+    for _ in range(repeats):
+        for frame in frames:
+            gesture_data, _ = engine.process_frame(frame)
+            detected += gesture_data['left_hand']['detected'] or gesture_data['right_hand']['detected']
+    elapsed = time.perf_counter() - start_time
+    cpu_time = time.process_time() - start_cpu
+    engine.close()
+    return len(frames) * repeats, elapsed, cpu_time, detected
+
+
+def _worker(task):
+    """프로세스 풀 작업 함수"""
+    frames, repeats = task
+    return process_frames(frames, True, repeats)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='GestureEngine 처리량 측정')
+    parser.add_argument('--video', type=str, default=None,
+                        help='측정에 사용할 동영상 파일')
+    parser.add_argument('--image', type=str, default=None,
+                        help='측정에 사용할 이미지 파일 (반복 사용)')
+    parser.add_argument('--frames', type=int, default=300,
+                        help='프로세스당 처리할 프레임 수 (기본값: 300)')
+    parser.add_argument('--repeats', type=int, default=1,
+                        help='프레임 목록 반복 횟수 (기본값: 1)')
+    parser.add_argument('--width', type=int, default=640,
+                        help='프레임 너비 (기본값: 640)')
+    parser.add_argument('--height', type=int, default=480,
+                        help='프레임 높이 (기본값: 480)')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4],
+                        help='동시에 실행할 엔진 프로세스 수 목록 (기본값: 1 2 4)')
+    args = parser.parse_args()
+
+    frames = load_frames(args)
+    cores = os.cpu_count() or 1
+    print(f"프레임 {len(frames)}개 x {args.repeats}회, {args.width}x{args.height}, CPU 코어 {cores}개")
+
+    # 한 프로세스: 화면 표시 모드 vs headless 모드
+    print("\n[단일 엔진]")
+    for headless in (False, True):
+        count, elapsed, cpu_time, detected = process_frames(frames, headless, args.repeats)
+        mode = "headless" if headless else "화면 표시"
+        print(f"  {mode:<9} {count / elapsed:>7.1f} FPS, CPU 1초당 {count / cpu_time:>7.1f} 프레임, "
+              f"손 감지 {detected}/{count}")
+
+    # 여러 프로세스 (각자 GestureEngine 하나, headless)
+    print("\n[프로세스별 headless 엔진]")
+    context = multiprocessing.get_context("spawn")
+    for workers in args.workers:
+        with context.Pool(workers) as pool:
+            start_time = time.perf_counter()
+            results = pool.map(_worker, [(frames, args.repeats)] * workers)
+            wall_time = time.perf_counter() - start_time
+
+        total = sum(result[0] for result in results)
+        per_worker = [result[0] / result[1] for result in results]
+        cpu_time = sum(result[2] for result in results)
+        print(f"  {workers}개: 전체 {total / wall_time:>7.1f} FPS (모델 로딩 포함), "
+              f"프로세스당 {np.mean(per_worker):>6.1f} FPS, "
+              f"코어당 {total / wall_time / min(workers, cores):>6.1f} FPS, "
+              f"CPU 1초당 {total / cpu_time:>6.1f} 프레임")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+"""
+제스처-MIDI 매핑 모듈 - 제스처 값을 MIDI CC/피치 벤드 메시지로 변환하여 전송함
+양자화한 값이 바뀌지 않으면 보내지 않고, 컨트롤러마다 초당 전송 횟수를 제한하며
+제한에 걸린 값은 최신 값 하나만 남겨 두었다가 허용되는 시점에 보냄
+프레임 캡처부터 포트 전송까지의 지연을 기록함
+"""
+
+import time
+import threading
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import mido
+
+
+class ControlMapping:
+    """제스처 값 하나를 MIDI 컨트롤러 하나에 연결하는 설정"""
+
+    def __init__(self, source: str, kind: str = "cc", control: int = 1, channel: int = 0,
+                 input_range: Tuple[float, float] = (0.0, 1.0), invert: bool = False,
+                 max_rate: float = 60.0):
+        """
+        ControlMapping 초기화
+
+        Args:
+            source: 제스처 값 경로 ("right_hand.thumb_index_distance", "hands_distance" 등)
+            kind: "cc"(컨트롤 체인지, 0~127) 또는 "pitchwheel"(피치 벤드, -8192~8191)
+            control: CC 번호 (kind가 "cc"일 때)
+            channel: MIDI 채널 (0~15)
+            input_range: 제스처 값의 (최소, 최대) 범위 (범위 밖은 끝 값으로 제한)
+            invert: 값 방향 반전 여부 (예: 화면 위쪽일수록 큰 값)
+            max_rate: 이 컨트롤러의 초당 최대 전송 횟수
+        """
+        if kind not in ("cc", "pitchwheel"):
+            raise ValueError(f"지원하지 않는 MIDI 컨트롤 종류입니다: {kind}")
+
+        self.source = source
+        self.kind = kind
+        self.control = control
+        self.channel = channel
+        self.input_range = input_range
+        self.invert = invert
+        self.min_interval = 1.0 / max_rate if max_rate > 0 else 0.0
+
+        # "right_hand.x_position" -> ("right_hand", "x_position"), "hands_distance" -> (None, "hands_distance")
+        hand, _, field = source.rpartition(".")
+        self.hand = hand or None
+        self.field = field
+        self.name = f"{kind}{control if kind == 'cc' else ''}@{channel}"
+
+    def read(self, gesture_data: Dict) -> Optional[float]:
+        """
+        제스처 데이터에서 값 읽기
+
+        Args:
+            gesture_data: gesture_recognizer.process_hand_landmarks()의 결과
+
+        Returns:
+            제스처 값 (손이 감지되지 않았으면 None)
+        """
+        if self.hand is None:
+            if self.field == "hands_distance" and not gesture_data.get("both_hands_detected"):
+                return None
+            return gesture_data.get(self.field)
+
+        hand_data = gesture_data.get(self.hand)
+        if not hand_data or not hand_data.get("detected"):
+            return None
+        return hand_data.get(self.field)
+
+    def quantize(self, value: float) -> int:
+        """
+        제스처 값을 MIDI 값으로 양자화
+
+        Args:
+            value: 제스처 값
+
+        Returns:
+            CC 값(0~127) 또는 피치 벤드 값(-8192~8191)
+        """
+        low, high = self.input_range
+        normalized = min(1.0, max(0.0, (value - low) / (high - low)))
+        if self.invert:
+            normalized = 1.0 - normalized
+        if self.kind == "cc":
+            return int(round(normalized * 127))
+        return int(round(normalized * 16383)) - 8192
+
+    def make_message(self, midi_value: int) -> mido.Message:
+        """양자화된 값으로 MIDI 메시지 생성"""
+        if self.kind == "cc":
+            return mido.Message('control_change', channel=self.channel, control=self.control, value=midi_value)
+        return mido.Message('pitchwheel', channel=self.channel, pitch=midi_value)
+
+
+# 기본 매핑: 오른손 엄지-검지 거리 -> 필터(CC74), 오른손 높이 -> 모듈레이션(CC1),
+# 왼손 좌우 위치 -> 피치 벤드, 양손 거리 -> 익스프레션(CC11)
+DEFAULT_MAPPINGS = (
+    ("right_hand.thumb_index_distance", "cc", 74, (0.02, 0.30), False),
+    ("right_hand.y_position", "cc", 1, (0.10, 0.90), True),
+    ("left_hand.x_position", "pitchwheel", 0, (0.10, 0.50), False),
+    ("hands_distance", "cc", 11, (0.10, 0.80), False),
+)
+
+
+class _ControlState:
+    """컨트롤러별 전송 상태"""
+    __slots__ = ("last_value", "last_send_time", "pending_value", "pending_capture_time")
+
+    def __init__(self):
+        self.last_value = None
+        self.last_send_time = float("-inf")
+        self.pending_value = None
+        self.pending_capture_time = None
+
+
+class GestureMidiMapper:
+    """제스처 값을 MIDI 컨트롤 메시지 스트림으로 변환하는 클래스"""
+
+    def __init__(self, send: Callable[[mido.Message], object],
+                 mappings: Optional[List[ControlMapping]] = None,
+                 max_rate: float = 60.0, history_size: int = 2000):
+        """
+        GestureMidiMapper 초기화
+
+        Args:
+            send: 메시지 하나를 포트로 보내는 함수 (예: MidiOutput.send_message)
+            mappings: ControlMapping 목록 (None이면 DEFAULT_MAPPINGS)
+            max_rate: 기본 매핑의 컨트롤러별 초당 최대 전송 횟수
+            history_size: 지연 백분위 계산에 보관할 최근 전송 수
+        """
+        self.send = send
+        if mappings is None:
+            mappings = [
+                ControlMapping(source, kind, control, input_range=input_range, invert=invert, max_rate=max_rate)
+                for source, kind, control, input_range, invert in DEFAULT_MAPPINGS
+            ]
+        self.mappings = list(mappings)
+        self._states = [_ControlState() for _ in self.mappings]
+
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=history_size)
+        self.frames = 0
+        self.sent = 0
+        self.unchanged = 0
+        self.coalesced = 0
+
+    def process(self, gesture_data: Dict, capture_time: Optional[float] = None) -> int:
+        """
+        제스처 데이터 한 프레임을 처리하여 필요한 메시지 전송
+
+        Args:
+            gesture_data: gesture_recognizer.process_hand_landmarks()의 결과
+            capture_time: 프레임 캡처 시각 (time.perf_counter, None이면 gesture_data['capture_time'])
+
+        Returns:
+            이번 프레임에서 보낸 메시지 수
+        """
+        if capture_time is None:
+            capture_time = gesture_data.get("capture_time")
+
+        sent = 0
+        with self._lock:
+            self.frames += 1
+            now = time.perf_counter()
+            for mapping, state in zip(self.mappings, self._states):
+                value = mapping.read(gesture_data)
+                if value is not None:
+                    midi_value = mapping.quantize(value)
+                    if midi_value == state.last_value:
+                        # 양자화한 값이 그대로면 보내지 않음 (보류 중인 값도 필요 없어짐)
+                        state.pending_value = None
+                        self.unchanged += 1
+                    else:
+                        if state.pending_value is not None:
+                            self.coalesced += 1
+                        state.pending_value = midi_value
+                        state.pending_capture_time = capture_time
+
+                sent += self._send_pending(mapping, state, now)
+        return sent
+
+    def flush(self) -> int:
+        """
+        전송 간격이 지난 보류 값을 전송 (프레임이 없을 때 주기적으로 호출 가능)
+
+        Returns:
+            보낸 메시지 수
+        """
+        sent = 0
+        with self._lock:
+            now = time.perf_counter()
+            for mapping, state in zip(self.mappings, self._states):
+                sent += self._send_pending(mapping, state, now)
+        return sent
+
+    def _send_pending(self, mapping: ControlMapping, state: _ControlState, now: float) -> int:
+        """보류 값이 있고 전송 간격이 지났으면 전송 (잠금 안에서 호출)"""
+        if state.pending_value is None or now - state.last_send_time < mapping.min_interval:
+            return 0
+
+        self.send(mapping.make_message(state.pending_value))
+        send_time = time.perf_counter()
+        if state.pending_capture_time is not None:
+            self._latencies.append(send_time - state.pending_capture_time)
+
+        state.last_value = state.pending_value
+        state.last_send_time = now
+        state.pending_value = None
+        self.sent += 1
+        return 1
+
+    def reset(self) -> None:
+        """마지막 전송 값을 잊음 (다음 프레임에서 모든 값을 다시 보냄)"""
+        with self._lock:
+            self._states = [_ControlState() for _ in self.mappings]
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        전송 통계 반환
+
+        Returns:
+            프레임 수, 전송/변화 없음/합쳐진 값 수, 캡처-전송 지연 p50/p95/p99/최대 (ms)
+        """
+        with self._lock:
+            latencies = np.array(self._latencies) * 1000
+            stats = {
+                "frames": self.frames,
+                "sent": self.sent,
+                "unchanged": self.unchanged,
+                "coalesced": self.coalesced,
+            }
+
+        for name, q in (("p50_ms", 50), ("p95_ms", 95), ("p99_ms", 99)):
+            stats[name] = float(np.percentile(latencies, q)) if len(latencies) else 0.0
+        stats["max_ms"] = float(latencies.max()) if len(latencies) else 0.0
+        return stats
+
+
+def run_gesture_midi(midi_output, mapper: Optional[GestureMidiMapper] = None,
+                     show_window: bool = True, engine=None) -> GestureMidiMapper:
+    """
+    웹캠 제스처를 MIDI 컨트롤 메시지로 실시간 전송 ('q' 키로 종료)
+
+    Args:
+        midi_output: 포트가 열린 MidiOutput
+        mapper: 사용할 GestureMidiMapper (None이면 기본 매핑)
+        show_window: 카메라 창 표시 여부
+        engine: 사용할 GestureEngine (None이면 기본 설정으로 생성)
+
+    Returns:
+        사용한 GestureMidiMapper (종료 후 get_stats()로 지연 확인)
+    """
+    # 카메라 의존성(cv2, mediapipe)은 실제로 실행할 때만 불러옴
+    from src.gesture_recognizer import GestureEngine
+
+    if mapper is None:
+        mapper = GestureMidiMapper(midi_output.send_message)
+    if engine is None:
+        engine = GestureEngine()
+
+    engine.run(show_window=show_window, callback=mapper.process)
+    return mapper
+
+
+if __name__ == "__main__":
+    from src.midi_output import MidiOutput
+
+    midi_output = MidiOutput()
+    if not midi_output.open_virtual_port("HandTune Gesture"):
+        ports = midi_output.list_output_ports()
+        if not ports or not midi_output.open_port(ports[0]):
+            raise SystemExit("MIDI 출력 포트를 열 수 없습니다.")
+
+    try:
+        stats = run_gesture_midi(midi_output).get_stats()
+        print(f"프레임 {stats['frames']}개, 전송 {stats['sent']}개 "
+              f"(변화 없음 {stats['unchanged']}, 합쳐짐 {stats['coalesced']})")
+        print(f"캡처-전송 지연 p50 {stats['p50_ms']:.2f}ms, p95 {stats['p95_ms']:.2f}ms, "
+              f"최대 {stats['max_ms']:.2f}ms")
+    finally:
+        midi_output.close_port()
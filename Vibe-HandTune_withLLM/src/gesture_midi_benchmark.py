@@ -0,0 +1,107 @@
+"""
+제스처-MIDI 전송량과 지연 측정 스크립트입니다.
+카메라 없이 합성 제스처 데이터(천천히 움직이는 손 + 랜드마크 떨림)를 프레임 속도에 맞춰 만들고,
+매 프레임 모든 컨트롤러를 보내는 방식과 GestureMidiMapper의 전송 수, 캡처-전송 지연을 비교합니다.
+"""
+
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+# 프로젝트 루트 경로를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.gesture_midi import GestureMidiMapper
+
+
+class LoopbackPort:
+    """보낸 메시지 수만 세는 대역 출력 포트"""
+
+    def __init__(self):
+        self.count = 0
+
+    def send(self, message):
+        self.count += 1
+
+
+def make_frames(seconds, fps, noise, seed=0):
+    """합성 제스처 프레임 목록 생성"""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * fps)) / fps
+    right_pinch = 0.16 + 0.12 * np.sin(2 * np.pi * 0.3 * t) + rng.normal(0.0, noise, len(t))
+    right_y = 0.5 + 0.3 * np.sin(2 * np.pi * 0.1 * t) + rng.normal(0.0, noise, len(t))
+    left_x = 0.3 + 0.15 * np.sin(2 * np.pi * 0.2 * t) + rng.normal(0.0, noise, len(t))
+    # 6초마다 2초씩 엄지-검지를 움직이지 않는 구간
+    still = (t % 6.0) > 4.0
+    right_pinch[still] = 0.2
+
+    frames = []
+    for i in range(len(t)):
+        frames.append({
+            'left_hand': {'detected': True, 'x_position': left_x[i], 'y_position': 0.5,
+                          'thumb_index_distance': 0.1},
+            'right_hand': {'detected': True, 'x_position': 0.7, 'y_position': right_y[i],
+                           'thumb_index_distance': right_pinch[i]},
+            'hands_distance': abs(0.7 - left_x[i]),
+            'both_hands_detected': True,
+        })
+    return frames
+
+
+def run_naive(frames, mapper, port):
+    """매 프레임 모든 컨트롤러를 보내는 방식"""
+    for gesture_data in frames:
+        for mapping in mapper.mappings:
+            value = mapping.read(gesture_data)
+            if value is not None:
+                port.send(mapping.make_message(mapping.quantize(value)))
+    return port.count
+
+
+def run_mapper(frames, mapper, fps):
+    """프레임 속도에 맞춰 GestureMidiMapper로 처리"""
+    interval = 1.0 / fps
+    next_time = time.perf_counter()
+    for gesture_data in frames:
+        next_time += interval
+        delay = next_time - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        mapper.process(gesture_data, capture_time=time.perf_counter())
+    return mapper.get_stats()
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='제스처-MIDI 전송량과 지연 측정')
+    parser.add_argument('--seconds', type=float, default=10.0,
+                        help='측정 시간 (초, 기본값: 10)')
+    parser.add_argument('--fps', type=float, default=60.0,
+                        help='카메라 프레임 속도 (기본값: 60)')
+    parser.add_argument('--max-rate', type=float, default=30.0,
+                        help='컨트롤러별 초당 최대 전송 횟수 (기본값: 30)')
+    parser.add_argument('--noise', type=float, default=0.002,
+                        help='랜드마크 떨림 표준편차 (정규화 좌표, 기본값: 0.002)')
+    args = parser.parse_args()
+
+    frames = make_frames(args.seconds, args.fps, args.noise)
+
+    naive_port = LoopbackPort()
+    naive_sent = run_naive(frames, GestureMidiMapper(naive_port.send), naive_port)
+
+    port = LoopbackPort()
+    mapper = GestureMidiMapper(port.send, max_rate=args.max_rate)
+    stats = run_mapper(frames, mapper, args.fps)
+
+    print(f"프레임 {len(frames)}개 ({args.fps:.0f}fps, {args.seconds:.0f}초), 컨트롤러 {len(mapper.mappings)}개")
+    print(f"  매 프레임 전송: {naive_sent}개 ({naive_sent / args.seconds:.0f}/초)")
+    print(f"  GestureMidiMapper: {stats['sent']}개 ({stats['sent'] / args.seconds:.0f}/초), "
+          f"변화 없음 {stats['unchanged']}, 합쳐짐 {stats['coalesced']}")
+    print(f"  캡처-전송 지연: p50 {stats['p50_ms'] * 1000:.0f}us, p95 {stats['p95_ms'] * 1000:.0f}us, "
+          f"p99 {stats['p99_ms'] * 1000:.0f}us, 최대 {stats['max_ms'] * 1000:.0f}us")
+
+
+if __name__ == "__main__":
+    main()
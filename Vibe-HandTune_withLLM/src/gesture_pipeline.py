@@ -0,0 +1,246 @@
+"""
+제스처 처리 파이프라인 모듈 - 캡처, 추론, 표시/콜백 단계를 각자의 스레드에서 실행함
+단계 사이는 칸이 하나인 버퍼로 연결하여 항상 가장 최근 프레임만 넘기고,
+다음 단계가 아직 가져가지 않은 오래된 프레임은 쌓지 않고 버림
+같은 단계를 한 스레드에서 차례로 실행하는 직렬 모드도 제공하여 단계별 FPS와 지연을 비교할 수 있음
+"""
+
+import time
+import threading
+from collections import deque
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+
+class LatestSlot:
+    """가장 최근 항목 하나만 보관하는 버퍼"""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._item = None
+        self._has_item = False
+        self._closed = False
+
+    def put(self, item: Any) -> bool:
+        """
+        항목 저장 (가져가지 않은 이전 항목은 버림)
+
+        Returns:
+            이전 항목을 버렸으면 True
+        """
+        with self._cond:
+            dropped = self._has_item
+            self._item = item
+            self._has_item = True
+            self._cond.notify()
+            return dropped
+
+    def get(self, timeout: Optional[float] = None) -> Tuple[bool, Any]:
+        """
+        새 항목을 기다려 꺼냄
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            (항목이 있었는지 여부, 항목) - 닫혔거나 시간 초과면 (False, None)
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: self._has_item or self._closed, timeout)
+            if not self._has_item:
+                return False, None
+            item = self._item
+            self._item = None
+            self._has_item = False
+            return True, item
+
+    def close(self) -> None:
+        """기다리는 쪽을 모두 깨우고 이후 get()이 바로 돌아오게 함"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+class StageStats:
+    """파이프라인 단계 하나의 처리량과 지연 집계 (스레드 안전)"""
+
+    def __init__(self, name: str, window: int = 120, history_size: int = 1000):
+        """
+        StageStats 초기화
+
+        Args:
+            name: 단계 이름
+            window: FPS 계산에 쓰는 최근 처리 시각 수
+            history_size: 지연 백분위 계산에 보관할 최근 처리 수
+        """
+        self.name = name
+        self.frames = 0
+        self._lock = threading.Lock()
+        self._times = deque(maxlen=window)
+        self._latencies = deque(maxlen=history_size)
+
+    def record(self, latency: float) -> None:
+        """프레임 하나 처리 기록 (latency: 이 단계에 걸린 시간, 초)"""
+        with self._lock:
+            self.frames += 1
+            self._times.append(time.perf_counter())
+            self._latencies.append(latency)
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        단계 통계 반환
+
+        Returns:
+            처리 프레임 수, 최근 FPS, 지연 p50/p95/최대 (ms)
+        """
+        with self._lock:
+            times = list(self._times)
+            latencies = np.array(self._latencies) * 1000
+            frames = self.frames
+
+        fps = (len(times) - 1) / (times[-1] - times[0]) if len(times) > 1 and times[-1] > times[0] else 0.0
+        return {
+            "frames": frames,
+            "fps": fps,
+            "p50_ms": float(np.percentile(latencies, 50)) if len(latencies) else 0.0,
+            "p95_ms": float(np.percentile(latencies, 95)) if len(latencies) else 0.0,
+            "max_ms": float(latencies.max()) if len(latencies) else 0.0,
+        }
+
+
+class GesturePipeline:
+    """캡처 → 추론 → 표시/콜백 3단계 파이프라인"""
+
+    def __init__(self, capture: Callable[[], Any], infer: Callable[[Any, float], Any],
+                 deliver: Callable[[Any], bool]):
+        """
+        GesturePipeline 초기화
+
+        Args:
+            capture: 프레임 하나를 읽어 반환하는 함수 (읽기 실패 시 None, 캡처 스레드에서 호출)
+            infer: (프레임, 캡처 시각)을 받아 추론 결과를 반환하는 함수 (추론 스레드에서 호출)
+            deliver: 추론 결과를 표시하거나 콜백에 넘기는 함수, False를 반환하면 종료
+                     (run()을 호출한 스레드에서 호출 - 창 표시는 주 스레드에서 해야 하는 환경이 있음)
+        """
+        self.capture = capture
+        self.infer = infer
+        self.deliver = deliver
+
+        self.capture_stats = StageStats("capture")
+        self.inference_stats = StageStats("inference")
+        self.render_stats = StageStats("render")
+        self.end_to_end_stats = StageStats("end_to_end")  # 캡처 시각 ~ 표시/콜백 완료
+
+        self.frames_dropped = 0   # 추론하기 전에 새 프레임에 밀려 버린 캡처 프레임
+        self.results_dropped = 0  # 표시/콜백하기 전에 새 결과에 밀려 버린 추론 결과
+
+        self._frame_slot = LatestSlot()
+        self._result_slot = LatestSlot()
+        self._stop_event = threading.Event()
+        self._threads = []
+
+    def run(self) -> None:
+        """캡처/추론 스레드를 시작하고 현재 스레드에서 표시/콜백 단계를 실행 (종료될 때까지 반환하지 않음)"""
+        self._stop_event.clear()
+        self._frame_slot = LatestSlot()
+        self._result_slot = LatestSlot()
+        self._threads = [
+            threading.Thread(target=self._capture_loop, name="gesture-capture", daemon=True),
+            threading.Thread(target=self._inference_loop, name="gesture-inference", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+        try:
+            while not self._stop_event.is_set():
+                ok, item = self._result_slot.get(timeout=0.1)
+                if not ok:
+                    continue
+                result, capture_time = item
+                if not self._deliver(result, capture_time):
+                    break
+        finally:
+            self.stop()
+
+    def run_serial(self) -> None:
+        """같은 단계를 한 스레드에서 차례로 실행 (비교용 기존 방식)"""
+        self._stop_event.clear()
+        while not self._stop_event.is_set():
+            start_time = time.perf_counter()
+            frame = self.capture()
+            capture_time = time.perf_counter()
+            if frame is None:
+                print("프레임 읽기 실패")
+                break
+            self.capture_stats.record(capture_time - start_time)
+
+            result = self.infer(frame, capture_time)
+            self.inference_stats.record(time.perf_counter() - capture_time)
+
+            if not self._deliver(result, capture_time):
+                break
+
+    def stop(self) -> None:
+        """모든 단계 종료"""
+        self._stop_event.set()
+        self._frame_slot.close()
+        self._result_slot.close()
+        for thread in self._threads:
+            if thread is not threading.current_thread():
+                thread.join(timeout=1.0)
+        self._threads = []
+
+    def _deliver(self, result: Any, capture_time: float) -> bool:
+        """표시/콜백 단계 실행 후 지연 기록"""
+        start_time = time.perf_counter()
+        keep_running = self.deliver(result) is not False
+        end_time = time.perf_counter()
+        self.render_stats.record(end_time - start_time)
+        self.end_to_end_stats.record(end_time - capture_time)
+        return keep_running
+
+    def _capture_loop(self) -> None:
+        """캡처 스레드 본체"""
+        while not self._stop_event.is_set():
+            start_time = time.perf_counter()
+            frame = self.capture()
+            capture_time = time.perf_counter()
+            if frame is None:
+                print("프레임 읽기 실패")
+                self._stop_event.set()
+                self._result_slot.close()
+                break
+            self.capture_stats.record(capture_time - start_time)
+            if self._frame_slot.put((frame, capture_time)):
+                self.frames_dropped += 1
+
+    def _inference_loop(self) -> None:
+        """추론 스레드 본체"""
+        while not self._stop_event.is_set():
+            ok, item = self._frame_slot.get(timeout=0.1)
+            if not ok:
+                continue
+            frame, capture_time = item
+            start_time = time.perf_counter()
+            try:
+                result = self.infer(frame, capture_time)
+            except Exception as e:
+                print(f"제스처 추론 중 오류 발생: {e}")
+                continue
+            self.inference_stats.record(time.perf_counter() - start_time)
+            if self._result_slot.put((result, capture_time)):
+                self.results_dropped += 1
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        단계별 통계 반환
+
+        Returns:
+            {단계 이름: {frames, fps, p50_ms, p95_ms, max_ms}}, 버린 프레임 수
+        """
+        stats = {s.name: s.get_stats() for s in (self.capture_stats, self.inference_stats,
+                                                  self.render_stats, self.end_to_end_stats)}
+        stats["inference"]["dropped"] = self.frames_dropped
+        stats["render"]["dropped"] = self.results_dropped
+        return stats
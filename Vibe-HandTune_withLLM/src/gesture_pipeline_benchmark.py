@@ -0,0 +1,77 @@
+"""
+제스처 처리 방식 비교 스크립트입니다.
+카메라, MediaPipe 추론, 화면 표시를 걸리는 시간만 흉내 낸 단계로 바꾸어
+직렬 루프(GesturePipeline.run_serial)와 3단계 파이프라인(GesturePipeline.run)의
+단계별 FPS, 지연, 버린 프레임 수를 비교합니다.
+"""
+
+import os
+import sys
+import time
+import argparse
+
+# 프로젝트 루트 경로를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.gesture_pipeline import GesturePipeline
+
+
+class SimulatedCamera:
+    """정해진 프레임 속도로만 프레임을 내주는 카메라 (다음 프레임이 나올 때까지 read가 대기)"""
+
+    def __init__(self, fps):
+        self.interval = 1.0 / fps
+        self.next_time = time.perf_counter()
+
+    def read(self):
+        self.next_time = max(self.next_time + self.interval, time.perf_counter())
+        time.sleep(max(0.0, self.next_time - time.perf_counter()))
+        return object()
+
+
+def run_mode(name, args):
+    """한 가지 방식으로 정해진 시간 동안 실행 후 통계 반환"""
+    camera = SimulatedCamera(args.camera_fps)
+    end_time = time.perf_counter() + args.seconds
+
+    def infer(frame, capture_time):
+        time.sleep(args.infer_ms / 1000)  # MediaPipe 추론 (GIL을 놓고 실행됨)
+        return frame
+
+    def deliver(result):
+        time.sleep(args.render_ms / 1000)  # 그리기 + imshow + waitKey(5)
+        return time.perf_counter() < end_time
+
+    pipeline = GesturePipeline(camera.read, infer, deliver)
+    if name == "pipeline":
+        pipeline.run()
+    else:
+        pipeline.run_serial()
+    return pipeline.get_stats()
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='제스처 처리 방식 비교 (직렬 루프 vs 파이프라인)')
+    parser.add_argument('--seconds', type=float, default=5.0,
+                        help='방식별 측정 시간 (초, 기본값: 5)')
+    parser.add_argument('--camera-fps', type=float, default=60.0,
+                        help='카메라 프레임 속도 (기본값: 60)')
+    parser.add_argument('--infer-ms', type=float, default=12.0,
+                        help='프레임당 추론 시간 (ms, 기본값: 12)')
+    parser.add_argument('--render-ms', type=float, default=8.0,
+                        help='프레임당 그리기/표시 시간 (ms, 기본값: 8)')
+    args = parser.parse_args()
+
+    print(f"카메라 {args.camera_fps:.0f}fps, 추론 {args.infer_ms:.0f}ms, 표시 {args.render_ms:.0f}ms")
+    for name in ("serial", "pipeline"):
+        stats = run_mode(name, args)
+        print(f"\n[{name}]")
+        for stage, values in stats.items():
+            dropped = f", 버림 {values['dropped']}" if "dropped" in values else ""
+            print(f"  {stage:<11} {values['fps']:>6.1f} FPS, 지연 p50 {values['p50_ms']:>6.1f}ms, "
+                  f"p95 {values['p95_ms']:>6.1f}ms{dropped}")
+
+
+if __name__ == "__main__":
+    main()
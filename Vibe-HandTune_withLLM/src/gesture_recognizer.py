@@ -1,5 +1,8 @@
 """
 제스처 인식 모듈 - 웹캠을 통해 손 제스처를 감지하고 관련 데이터를 추출함
+카메라, MediaPipe Hands, 설정, 제스처 데이터, 스무딩 상태는 GestureEngine 인스턴스마다 따로 가지므로
+한 프로세스에서 여러 카메라/세션을 동시에 처리할 수 있음
+모듈 수준 함수(init_gesture_recognition, run_gesture_recognition 등)는 기본 엔진 하나를 사용함
 """
 
 import cv2
@@ -9,45 +12,30 @@ import time
 import platform
 from typing import Dict, List, Tuple, Optional, Union
 from src.config_loader import load_camera_settings
+from src.gesture_pipeline import GesturePipeline
+from src.hand_features import LandmarkProcessor
+from src.hand_roi import HandRoiTracker
 
-# 전역 변수들
+# MediaPipe 모듈 (상태가 없으므로 모든 엔진이 공유)
 _mp_hands = None
 _mp_drawing = None
 _mp_drawing_styles = None
-_hands = None
-_cap = None
-_settings = None
-_gesture_data = None
-_previous_values = {}
+
+# 모듈 수준 함수가 사용하는 기본 엔진
+_engine = None
 
 def _init_mediapipe():
     """MediaPipe 초기화"""
-    global _mp_hands, _mp_drawing, _mp_drawing_styles, _hands
-    
+    global _mp_hands, _mp_drawing, _mp_drawing_styles
+
     if _mp_hands is None:
         _mp_hands = mp.solutions.hands
         _mp_drawing = mp.solutions.drawing_utils
         _mp_drawing_styles = mp.solutions.drawing_styles
 
-def _init_hands(settings):
-    """Hands 객체 초기화"""
-    global _hands
-    
-    if _hands is None:
-        _init_mediapipe()
-        _hands = _mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=settings["max_hands"],
-            min_detection_confidence=settings["min_detection_confidence"],
-            min_tracking_confidence=settings["min_tracking_confidence"],
-            model_complexity=1
-        )
-
-def _reset_gesture_data():
-    """제스처 데이터 초기화"""
-    global _gesture_data
-    
-    _gesture_data = {
+def _empty_gesture_data():
+    """초기 제스처 데이터"""
+    return {
         'left_hand': {
             'landmarks': None,
             'thumb_index_distance': 0.0,
@@ -63,7 +51,8 @@ def _reset_gesture_data():
             'detected': False
         },
         'hands_distance': 0.0,
-        'both_hands_detected': False
+        'both_hands_detected': False,
+        'capture_time': None  # 프레임 캡처 시각 (time.perf_counter)
     }
 
 def detect_available_cameras():
@@ -80,10 +69,10 @@ def find_built_in_camera():
     """내장 웹캠 ID 찾기 (macOS 환경 기준)"""
     if platform.system() == 'Darwin':  # macOS
         available_cameras = detect_available_cameras()
-        
+
         if not available_cameras:
             return -1
-        
+
         for camera_id in available_cameras:
             cap = cv2.VideoCapture(camera_id)
             if cap.isOpened():
@@ -96,186 +85,19 @@ def find_built_in_camera():
                     except:
                         pass
                 cap.release()
-        
-        return available_cameras[0]
-    
-    return 0
-
-def init_gesture_recognition(settings_path=None, webcam_id=None, width=None, height=None, flip_horizontal=None):
-    """제스처 인식 시스템 초기화"""
-    global _settings
-    
-    # 설정 로드
-    _settings = load_camera_settings(settings_path)
-    
-    # 인자로 받은 값이 있으면 설정 덮어쓰기
-    if webcam_id is not None:
-        _settings["camera_id"] = webcam_id
-    if width is not None:
-        _settings["width"] = width
-    if height is not None:
-        _settings["height"] = height
-    if flip_horizontal is not None:
-        _settings["flip_horizontal"] = flip_horizontal
-    
-    # MediaPipe 및 Hands 초기화
-    _init_hands(_settings)
-    
-    # 제스처 데이터 초기화
-    _reset_gesture_data()
-    
-    return _settings
 
-def start_webcam():
-    """웹캠 시작"""
-    global _cap, _settings
-    
-    try:
-        webcam_id = _settings["camera_id"]
-        
-        # 자동 감지 모드인 경우
-        if webcam_id == -1:
-            camera_id = find_built_in_camera()
-            if camera_id == -1:
-                print("사용 가능한 카메라를 찾을 수 없습니다.")
-                camera_id = 0
-                print(f"기본 카메라 ID {camera_id}로 시도합니다...")
-            else:
-                print(f"카메라 ID {camera_id}를 사용합니다.")
-            
-            _settings["camera_id"] = camera_id
-            webcam_id = camera_id
-        
-        # 카메라 열기
-        _cap = cv2.VideoCapture(webcam_id)
-        
-        # 해상도 설정
-        _cap.set(cv2.CAP_PROP_FRAME_WIDTH, _settings["width"])
-        _cap.set(cv2.CAP_PROP_FRAME_HEIGHT, _settings["height"])
-        
-        # 성공적으로 열렸는지 확인
-        if not _cap.isOpened():
-            print(f"카메라 ID {webcam_id}를 열 수 없습니다.")
-            
-            # 다른 카메라 자동 시도
-            available_cameras = detect_available_cameras()
-            for cam_id in available_cameras:
-                if cam_id != webcam_id:
-                    print(f"카메라 ID {cam_id} 시도 중...")
-                    _cap = cv2.VideoCapture(cam_id)
-                    _cap.set(cv2.CAP_PROP_FRAME_WIDTH, _settings["width"])
-                    _cap.set(cv2.CAP_PROP_FRAME_HEIGHT, _settings["height"])
-                    
-                    if _cap.isOpened():
-                        print(f"카메라 ID {cam_id}를 사용합니다.")
-                        _settings["camera_id"] = cam_id
-                        ret, _ = _cap.read()
-                        if ret:
-                            return True
-            
-            return False
-        
-        # 테스트 프레임 읽기
-        ret, _ = _cap.read()
-        return ret
-        
-    except Exception as e:
-        print(f"웹캠 시작 중 오류 발생: {e}")
-        return False
+        return available_cameras[0]
 
-def release_webcam():
-    """웹캠 리소스 해제"""
-    global _cap
-    if _cap and _cap.isOpened():
-        _cap.release()
-    cv2.destroyAllWindows()
+    return 0
 
 def calculate_distance(p1, p2):
     """두 점 사이의 유클리드 거리 계산"""
     return np.linalg.norm(np.array(p1) - np.array(p2))
 
-def smooth_value(key, value):
-    """값에 스무딩 적용"""
-    global _previous_values, _settings
-    
-    if not _settings.get("smooth_landmarks", True):
-        return value
-        
-    if key not in _previous_values:
-        _previous_values[key] = value
-        return value
-        
-    smooth_factor = 0.8
-    smoothed = _previous_values[key] * smooth_factor + value * (1 - smooth_factor)
-    _previous_values[key] = smoothed
-    
-    return smoothed
-
-def process_hand_landmarks(results):
-    """MediaPipe 손 랜드마크 결과 처리"""
-    global _gesture_data, _settings
-    
-    # 제스처 데이터 초기화
-    _gesture_data['left_hand']['detected'] = False
-    _gesture_data['right_hand']['detected'] = False
-    _gesture_data['both_hands_detected'] = False
-    
-    if not results.multi_hand_landmarks:
-        return _gesture_data
-        
-    # 감지된 각 손 처리
-    for idx, (hand_landmarks, handedness) in enumerate(
-        zip(results.multi_hand_landmarks, results.multi_handedness)
-    ):
-        hand_label = handedness.classification[0].label
-        
-        # 좌우반전 적용 여부 확인
-        if _settings["flip_horizontal"]:
-            hand_type = 'right_hand' if hand_label == 'Left' else 'left_hand'
-        else:
-            hand_type = 'left_hand' if hand_label == 'Left' else 'right_hand'
-            
-        # 랜드마크 좌표 추출
-        landmarks_list = []
-        for landmark in hand_landmarks.landmark:
-            landmarks_list.append([landmark.x, landmark.y, landmark.z])
-        
-        # 손 데이터 업데이트
-        _gesture_data[hand_type]['landmarks'] = landmarks_list
-        _gesture_data[hand_type]['detected'] = True
-        
-        # 엄지-검지 사이 거리 계산
-        thumb_tip = landmarks_list[4]
-        index_tip = landmarks_list[8]
-        thumb_index_dist = calculate_distance(thumb_tip, index_tip)
-        
-        # 손목 위치
-        wrist = landmarks_list[0]
-        
-        # 손 데이터 업데이트 (스무딩 적용)
-        _gesture_data[hand_type]['thumb_index_distance'] = smooth_value(f"{hand_type}_thumb_index", thumb_index_dist)
-        _gesture_data[hand_type]['x_position'] = smooth_value(f"{hand_type}_x", wrist[0])
-        _gesture_data[hand_type]['y_position'] = smooth_value(f"{hand_type}_y", wrist[1])
-    
-    # 양손 감지 여부 확인
-    if _gesture_data['left_hand']['detected'] and _gesture_data['right_hand']['detected']:
-        left_wrist = _gesture_data['left_hand']['landmarks'][0]
-        right_wrist = _gesture_data['right_hand']['landmarks'][0]
-        hands_dist = calculate_distance(left_wrist, right_wrist)
-        
-        _gesture_data['hands_distance'] = smooth_value("hands_distance", hands_dist)
-        _gesture_data['both_hands_detected'] = True
-    
-    return _gesture_data
-
-def get_hand_landmarks():
-    """현재 제스처 데이터 반환"""
-    return _gesture_data
-
 def draw_landmarks(image, results):
     """손 랜드마크 시각화"""
-    global _mp_drawing, _mp_drawing_styles, _mp_hands
-    
+    _init_mediapipe()
+
     if results.multi_hand_landmarks:
         for hand_landmarks in results.multi_hand_landmarks:
             _mp_drawing.draw_landmarks(
@@ -286,107 +108,378 @@ def draw_landmarks(image, results):
                 _mp_drawing_styles.get_default_hand_connections_style()
             )
 
-def draw_gesture_data(image):
-    """제스처 데이터 텍스트 시각화"""
-    global _gesture_data, _settings
-    
-    # 왼손 정보
-    if _gesture_data['left_hand']['detected']:
-        left_dist = _gesture_data['left_hand']['thumb_index_distance']
-        left_y = _gesture_data['left_hand']['y_position']
-        left_x = _gesture_data['left_hand']['x_position']
-        
-        cv2.putText(image, f"Left Hand:", (10, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
-        cv2.putText(image, f"Thumb-Index: {left_dist:.2f}", (10, 40), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
-        cv2.putText(image, f"Y-pos: {left_y:.2f}", (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
-        cv2.putText(image, f"X-pos: {left_x:.2f}", (10, 80), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
-    
-    # 오른손 정보
-    if _gesture_data['right_hand']['detected']:
-        right_dist = _gesture_data['right_hand']['thumb_index_distance']
-        right_y = _gesture_data['right_hand']['y_position']
-        right_x = _gesture_data['right_hand']['x_position']
-        
-        cv2.putText(image, f"Right Hand:", (image.shape[1] - 170, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 255), 1)
-        cv2.putText(image, f"Thumb-Index: {right_dist:.2f}", (image.shape[1] - 170, 40), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 255), 1)
-        cv2.putText(image, f"Y-pos: {right_y:.2f}", (image.shape[1] - 170, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 255), 1)
-        cv2.putText(image, f"X-pos: {right_x:.2f}", (image.shape[1] - 170, 80), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 255), 1)
-    
-    # 양손 정보
-    if _gesture_data['both_hands_detected']:
-        hands_dist = _gesture_data['hands_distance']
-        cv2.putText(image, f"Hands Distance: {hands_dist:.2f}", (image.shape[1]//2 - 80, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 0, 0), 1)
-    
-    # 카메라 ID 및 좌우반전 상태 표시
-    flip_status = "On" if _settings["flip_horizontal"] else "Off"
-    cv2.putText(image, f"Camera ID: {_settings['camera_id']} | Flip: {flip_status}", 
-               (10, image.shape[0] - 10), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
-
-def process_frame(frame):
-    """단일 프레임 처리"""
-    global _hands, _settings
-    
-    # 좌우반전 적용
-    if _settings["flip_horizontal"]:
-        frame = cv2.flip(frame, 1)
-    
-    # 이미지 색상 변환 (BGR -> RGB)
-    rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-    
-    # 이미지 처리
-    results = _hands.process(rgb_frame)
-    
-    # 손 랜드마크 처리
-    process_hand_landmarks(results)
-    
-    # 랜드마크 시각화
-    annotated_frame = frame.copy()
-    draw_landmarks(annotated_frame, results)
-    draw_gesture_data(annotated_frame)
-    
-    return _gesture_data, annotated_frame
-
-def run_gesture_recognition(show_window=True, callback=None):
-    """실시간 웹캠 처리 루프"""
-    global _cap
-    
-    if not start_webcam():
-        print("웹캠을 시작할 수 없습니다.")
-        print("사용 가능한 카메라:", detect_available_cameras())
-        return
-    
-    try:
-        while _cap.isOpened():
-            ret, frame = _cap.read()
-            if not ret:
-                print("프레임 읽기 실패")
-                break
-            
-            # 프레임 처리
-            gesture_data, annotated_frame = process_frame(frame)
-            
+
+class GestureEngine:
+    """카메라 하나(또는 프레임 스트림 하나)의 손 제스처 인식 엔진"""
+
+    def __init__(self, settings_path=None, webcam_id=None, width=None, height=None, flip_horizontal=None,
+                 max_hands=None, min_detection_confidence=None, min_tracking_confidence=None,
+                 smooth_landmarks=None, roi_tracking=None, headless=False):
+        """
+        GestureEngine 초기화 (인자로 받은 값은 camera_settings.json 값을 덮어씀)
+
+        Args:
+            settings_path: 카메라 설정 파일 경로 (None이면 config/camera_settings.json)
+            webcam_id: 사용할 웹캠 ID (-1: 자동 감지)
+            width: 프레임 너비
+            height: 프레임 높이
+            flip_horizontal: 좌우반전 여부
+            max_hands: 최대 손 개수
+            min_detection_confidence: 감지 신뢰도 임계값
+            min_tracking_confidence: 추적 신뢰도 임계값
+            smooth_landmarks: 스무딩 적용 여부
+            roi_tracking: 이전 프레임의 손 주변만 잘라 감지할지 여부 (설정은 camera_settings.json의 "roi")
+            headless: True이면 화면 표시용 처리(그리기, 프레임 복사, 좌우반전 이미지 생성)를 하지 않음
+        """
+        self.settings = load_camera_settings(settings_path)
+
+        overrides = {
+            "camera_id": webcam_id,
+            "width": width,
+            "height": height,
+            "flip_horizontal": flip_horizontal,
+            "max_hands": max_hands,
+            "min_detection_confidence": min_detection_confidence,
+            "min_tracking_confidence": min_tracking_confidence,
+            "smooth_landmarks": smooth_landmarks,
+            "roi_tracking": roi_tracking,
+        }
+        for key, value in overrides.items():
+            if value is not None:
+                self.settings[key] = value
+
+        self.headless = headless
+        self.cap = None
+        self.gesture_data = _empty_gesture_data()
+
+        # 손 슬롯별 랜드마크 배열과 스무딩 상태 (프레임마다 새로 만들지 않음)
+        self.landmark_processor = LandmarkProcessor(smooth=self.settings.get("smooth_landmarks", True),
+                                                    smoothing=self.settings.get("smoothing"))
+
+        # MediaPipe Hands 초기화 (엔진마다 따로 추적 상태를 가짐)
+        # ROI 추적 중에는 HandRoiTracker가 손 개수와 입력 영역에 맞는 인스턴스를 만들어 사용함
+        _init_mediapipe()
+        self.roi_tracker = None
+        self.hands = None
+        if self.settings.get("roi_tracking", False):
+            self.roi_tracker = HandRoiTracker(self._create_hands, max_hands=self.settings["max_hands"],
+                                              **self.settings.get("roi", {}))
+        else:
+            self.hands = self._create_hands(False, self.settings["max_hands"])
+
+    def _create_hands(self, static_image_mode, max_num_hands):
+        """설정값으로 MediaPipe Hands 인스턴스 생성"""
+        return _mp_hands.Hands(
+            static_image_mode=static_image_mode,
+            max_num_hands=max_num_hands,
+            min_detection_confidence=self.settings["min_detection_confidence"],
+            min_tracking_confidence=self.settings["min_tracking_confidence"],
+            model_complexity=1
+        )
+
+    @staticmethod
+    def detect_available_cameras():
+        """사용 가능한 카메라 목록 감지"""
+        return detect_available_cameras()
+
+    def reset(self):
+        """제스처 데이터, 스무딩 상태, ROI 추적 상태 초기화"""
+        self.gesture_data = _empty_gesture_data()
+        self.landmark_processor.reset()
+        if self.roi_tracker is not None:
+            self.roi_tracker.reset()
+
+    def start_webcam(self):
+        """웹캠 시작"""
+        settings = self.settings
+
+        try:
+            webcam_id = settings["camera_id"]
+
+            # 자동 감지 모드인 경우
+            if webcam_id == -1:
+                camera_id = find_built_in_camera()
+                if camera_id == -1:
+                    print("사용 가능한 카메라를 찾을 수 없습니다.")
+                    camera_id = 0
+                    print(f"기본 카메라 ID {camera_id}로 시도합니다...")
+                else:
+                    print(f"카메라 ID {camera_id}를 사용합니다.")
+
+                settings["camera_id"] = camera_id
+                webcam_id = camera_id
+
+            # 카메라 열기
+            self.cap = cv2.VideoCapture(webcam_id)
+
+            # 해상도 설정
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, settings["width"])
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, settings["height"])
+
+            # 성공적으로 열렸는지 확인
+            if not self.cap.isOpened():
+                print(f"카메라 ID {webcam_id}를 열 수 없습니다.")
+
+                # 다른 카메라 자동 시도
+                available_cameras = detect_available_cameras()
+                for cam_id in available_cameras:
+                    if cam_id != webcam_id:
+                        print(f"카메라 ID {cam_id} 시도 중...")
+                        self.cap = cv2.VideoCapture(cam_id)
+                        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, settings["width"])
+                        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, settings["height"])
+
+                        if self.cap.isOpened():
+                            print(f"카메라 ID {cam_id}를 사용합니다.")
+                            settings["camera_id"] = cam_id
+                            ret, _ = self.cap.read()
+                            if ret:
+                                return True
+
+                return False
+
+            # 테스트 프레임 읽기
+            ret, _ = self.cap.read()
+            return ret
+
+        except Exception as e:
+            print(f"웹캠 시작 중 오류 발생: {e}")
+            return False
+
+    def release_webcam(self):
+        """웹캠 리소스 해제"""
+        if self.cap and self.cap.isOpened():
+            self.cap.release()
+        if not self.headless:
+            cv2.destroyAllWindows()
+
+    def close(self):
+        """웹캠과 MediaPipe 리소스 해제"""
+        self.release_webcam()
+        if self.roi_tracker is not None:
+            self.roi_tracker.close()
+        else:
+            self.hands.close()
+
+    def process_hand_landmarks(self, results, mirror=False, timestamp=None):
+        """
+        MediaPipe 손 랜드마크 결과 처리 (LandmarkProcessor 참고)
+
+        mirror가 True이면 좌우반전하지 않은 이미지의 결과를 좌우반전한 이미지의 결과처럼 해석함
+        (x 좌표만 반전하고, 왼손/오른손은 MediaPipe가 이미 반대로 판별하므로 그대로 사용)
+        timestamp는 프레임 촬영 시각이며 스무딩 필터의 시간 간격 계산에 사용함 (None이면 현재 시각)
+        """
+        swap_hands = self.settings["flip_horizontal"] and not mirror
+        return self.landmark_processor.process(results, self.gesture_data, swap_hands, mirror, timestamp)
+
+    def snapshot(self):
+        """
+        현재 제스처 데이터 복사본 (다른 스레드가 다음 프레임으로 갱신해도 바뀌지 않음)
+
+        배열 값(랜드마크, 특징)은 프레임마다 새로 만들어지므로 딕셔너리만 복사함
+        """
+        return {key: dict(value) if isinstance(value, dict) else value
+                for key, value in self.gesture_data.items()}
+
+    def infer_frame(self, frame, capture_time=None):
+        """
+        프레임에서 손을 인식하여 제스처 데이터 갱신 (추론 단계)
+
+        Returns:
+            (좌우반전이 적용된 프레임, MediaPipe 결과, 제스처 데이터 복사본)
+            headless 모드에서는 좌우반전 이미지를 만들지 않으므로 입력 프레임을 그대로 반환함
+        """
+        self.gesture_data['capture_time'] = capture_time if capture_time is not None else time.perf_counter()
+
+        # 좌우반전 적용 (headless 모드에서는 이미지를 뒤집는 대신 좌표를 반전)
+        mirror = self.headless and self.settings["flip_horizontal"]
+        if self.settings["flip_horizontal"] and not mirror:
+            frame = cv2.flip(frame, 1)
+
+        # 이미지 처리 (ROI 추적 중이면 손 주변만 잘라 색상 변환 후 감지)
+        if self.roi_tracker is not None:
+            results = self.roi_tracker.detect(frame)
+        else:
+            results = self.hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+
+        # 손 랜드마크 처리
+        self.process_hand_landmarks(results, mirror, self.gesture_data['capture_time'])
+
+        return frame, results, self.snapshot()
+
+    def get_roi_stats(self):
+        """ROI 추적 통계 (HandRoiTracker.get_stats(), ROI 추적을 사용하지 않으면 None)"""
+        return self.roi_tracker.get_stats() if self.roi_tracker is not None else None
+
+    def draw_gesture_data(self, image, gesture_data=None):
+        """제스처 데이터 텍스트 시각화 (gesture_data가 없으면 현재 제스처 데이터)"""
+        if gesture_data is None:
+            gesture_data = self.gesture_data
+
+        # 왼손 정보
+        if gesture_data['left_hand']['detected']:
+            left_dist = gesture_data['left_hand']['thumb_index_distance']
+            left_y = gesture_data['left_hand']['y_position']
+            left_x = gesture_data['left_hand']['x_position']
+
+            cv2.putText(image, f"Left Hand:", (10, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
+            cv2.putText(image, f"Thumb-Index: {left_dist:.2f}", (10, 40), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
+            cv2.putText(image, f"Y-pos: {left_y:.2f}", (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
+            cv2.putText(image, f"X-pos: {left_x:.2f}", (10, 80), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
+
+        # 오른손 정보
+        if gesture_data['right_hand']['detected']:
+            right_dist = gesture_data['right_hand']['thumb_index_distance']
+            right_y = gesture_data['right_hand']['y_position']
+            right_x = gesture_data['right_hand']['x_position']
+
+            cv2.putText(image, f"Right Hand:", (image.shape[1] - 170, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 255), 1)
+            cv2.putText(image, f"Thumb-Index: {right_dist:.2f}", (image.shape[1] - 170, 40), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 255), 1)
+            cv2.putText(image, f"Y-pos: {right_y:.2f}", (image.shape[1] - 170, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 255), 1)
+            cv2.putText(image, f"X-pos: {right_x:.2f}", (image.shape[1] - 170, 80), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 255), 1)
+
+        # 양손 정보
+        if gesture_data['both_hands_detected']:
+            hands_dist = gesture_data['hands_distance']
+            cv2.putText(image, f"Hands Distance: {hands_dist:.2f}", (image.shape[1]//2 - 80, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 0, 0), 1)
+
+        # 카메라 ID 및 좌우반전 상태 표시
+        flip_status = "On" if self.settings["flip_horizontal"] else "Off"
+        cv2.putText(image, f"Camera ID: {self.settings['camera_id']} | Flip: {flip_status}",
+                   (10, image.shape[0] - 10), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+
+    def render_frame(self, frame, results, gesture_data):
+        """랜드마크와 제스처 데이터를 프레임에 그림 (표시 단계, 프레임을 직접 수정함)"""
+        draw_landmarks(frame, results)
+        self.draw_gesture_data(frame, gesture_data)
+        return frame
+
+    def process_frame(self, frame, capture_time=None):
+        """
+        단일 프레임 처리 (capture_time: 프레임 캡처 시각, 지연 측정용)
+
+        Returns:
+            (제스처 데이터, 시각화된 프레임) - headless 모드에서는 시각화된 프레임 대신 None
+        """
+        frame, results, gesture_data = self.infer_frame(frame, capture_time)
+        if self.headless:
+            return gesture_data, None
+
+        # 랜드마크 시각화
+        annotated_frame = self.render_frame(frame.copy(), results, gesture_data)
+
+        return gesture_data, annotated_frame
+
+    def run(self, show_window=True, callback=None, pipelined=True):
+        """
+        실시간 웹캠 처리 루프 (창을 표시하면 'q' 키로 종료)
+
+        pipelined가 True이면 캡처와 추론을 각자의 스레드에서 실행하고 이 스레드에서는
+        콜백 호출과 화면 표시만 함 (밀린 프레임은 쌓지 않고 가장 최근 프레임만 처리)
+        콜백이 False를 반환해도 종료하며, headless 모드에서는 창을 표시하지 않음
+
+        Returns:
+            단계별 FPS와 지연 통계 (GesturePipeline.get_stats()), 웹캠을 열지 못하면 None
+        """
+        if not self.start_webcam():
+            print("웹캠을 시작할 수 없습니다.")
+            print("사용 가능한 카메라:", detect_available_cameras())
+            return None
+
+        def capture():
+            ret, frame = self.cap.read()
+            return frame if ret else None
+
+        def deliver(result):
+            frame, results, gesture_data = result
+
             # 콜백 함수 호출
+            keep_running = True
             if callback:
-                callback(gesture_data)
-            
+                keep_running = callback(gesture_data) is not False
+
+            if self.headless:
+                return keep_running
+
             # 결과 표시
             if show_window:
-                cv2.imshow('Hand Gesture Recognition', annotated_frame)
-            
+                cv2.imshow('Hand Gesture Recognition', self.render_frame(frame, results, gesture_data))
+
             # 종료 조건
-            if cv2.waitKey(5) & 0xFF == ord('q'):
-                break
-                
-    finally:
-        release_webcam()
+            return keep_running and not (cv2.waitKey(5) & 0xFF == ord('q'))
+
+        pipeline = GesturePipeline(capture, self.infer_frame, deliver)
+        try:
+            if pipelined:
+                pipeline.run()
+            else:
+                pipeline.run_serial()
+        finally:
+            self.release_webcam()
+
+        return pipeline.get_stats()
+
+
+def _get_engine():
+    """기본 엔진 반환 (없으면 기본 설정으로 생성)"""
+    global _engine
+    if _engine is None:
+        _engine = GestureEngine()
+    return _engine
+
+def init_gesture_recognition(settings_path=None, webcam_id=None, width=None, height=None, flip_horizontal=None):
+    """제스처 인식 시스템 초기화 (기본 엔진 생성)"""
+    global _engine
+
+    if _engine is not None:
+        _engine.close()
+    _engine = GestureEngine(settings_path, webcam_id, width, height, flip_horizontal)
+
+    return _engine.settings
+
+def start_webcam():
+    """웹캠 시작"""
+    return _get_engine().start_webcam()
+
+def release_webcam():
+    """웹캠 리소스 해제"""
+    _get_engine().release_webcam()
+
+def process_hand_landmarks(results):
+    """MediaPipe 손 랜드마크 결과 처리"""
+    return _get_engine().process_hand_landmarks(results)
+
+def get_hand_landmarks():
+    """현재 제스처 데이터 반환"""
+    return _get_engine().gesture_data
+
+def draw_gesture_data(image, gesture_data=None):
+    """제스처 데이터 텍스트 시각화 (gesture_data가 없으면 현재 제스처 데이터)"""
+    _get_engine().draw_gesture_data(image, gesture_data)
+
+def infer_frame(frame, capture_time=None):
+    """프레임에서 손을 인식하여 제스처 데이터 갱신 (추론 단계)"""
+    return _get_engine().infer_frame(frame, capture_time)
+
+def render_frame(frame, results, gesture_data):
+    """랜드마크와 제스처 데이터를 프레임에 그림 (표시 단계)"""
+    return _get_engine().render_frame(frame, results, gesture_data)
+
+def process_frame(frame, capture_time=None):
+    """단일 프레임 처리 (capture_time: 프레임 캡처 시각, 지연 측정용)"""
+    return _get_engine().process_frame(frame, capture_time)
+
+def run_gesture_recognition(show_window=True, callback=None, pipelined=True):
+    """실시간 웹캠 처리 루프 ('q' 키로 종료, GestureEngine.run 참고)"""
+    return _get_engine().run(show_window, callback, pipelined)
 
 def test_gesture_recognition():
     """제스처 인식 테스트"""
     print("사용 가능한 카메라:", detect_available_cameras())
-    
+
     settings = init_gesture_recognition()
     print(f"현재 설정: {settings}")
-    
+
     def print_gesture_values(gesture_data):
         if gesture_data['left_hand']['detected']:
             print(f"왼손 엄지-검지 거리: {gesture_data['left_hand']['thumb_index_distance']:.2f}")
@@ -395,9 +488,18 @@ def test_gesture_recognition():
         if gesture_data['both_hands_detected']:
             print(f"양손 간 거리: {gesture_data['hands_distance']:.2f}")
         print("---")
-    
+
     print("제스처 인식을 시작합니다... (종료하려면 'q' 키를 누르세요)")
-    run_gesture_recognition(show_window=True, callback=print_gesture_values)
+    stats = run_gesture_recognition(show_window=True, callback=print_gesture_values)
+
+    if stats:
+        for stage, values in stats.items():
+            print(f"{stage}: {values['fps']:.1f} FPS, 지연 p50 {values['p50_ms']:.1f}ms, p95 {values['p95_ms']:.1f}ms")
+
+    roi_stats = _get_engine().get_roi_stats()
+    if roi_stats:
+        print(f"ROI 추적: ROI {roi_stats['roi_frames']}프레임, 전체 이미지 {roi_stats['full_frames']}프레임, "
+              f"추적 실패율 {roi_stats['tracking_loss_rate'] * 100:.1f}%, 감지 {roi_stats['mean_detect_ms']:.1f}ms/프레임")
 
 if __name__ == "__main__":
-    test_gesture_recognition()
\ No newline at end of file
+    test_gesture_recognition()
@@ -12,11 +12,11 @@ import argparse
 # 프로젝트 루트 경로를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.gesture_recognizer import GestureRecognizer
+from src.gesture_recognizer import GestureEngine
 
 def test_gesture_recognition(webcam_id=-1):
     """
-    GestureRecognizer 모듈 테스트 및 데모
+    GestureEngine 모듈 테스트 및 데모
     
     Args:
         webcam_id: 사용할 웹캠 ID (-1: 자동 감지)
@@ -29,10 +29,8 @@ def test_gesture_recognition(webcam_id=-1):
     print("=" * 35)
     
     # 사용 가능한 카메라 확인
-    temp_recognizer = GestureRecognizer()
-    available_cameras = temp_recognizer.detect_available_cameras()
+    available_cameras = GestureEngine.detect_available_cameras()
     print(f"사용 가능한 카메라 ID: {available_cameras}")
-    del temp_recognizer
     
     # 최근 값 추적용 변수
     recent_values = {
@@ -80,7 +78,7 @@ def test_gesture_recognition(webcam_id=-1):
         print()
     
     # 제스처 인식기 초기화 및 실행
-    recognizer = GestureRecognizer(
+    recognizer = GestureEngine(
         max_hands=2,                   # 최대 2개 손 감지
         min_detection_confidence=0.7,  # 감지 신뢰도 임계값
         min_tracking_confidence=0.5,   # 추적 신뢰도 임계값
@@ -127,12 +125,10 @@ def main():
         
         # 오류 발생 시 카메라 ID 정보 출력
         try:
-            temp_recognizer = GestureRecognizer()
-            available_cameras = temp_recognizer.detect_available_cameras()
+            available_cameras = GestureEngine.detect_available_cameras()
             print(f"\n사용 가능한 카메라 ID: {available_cameras}")
             print("\n다른 카메라 ID로 시도해보세요:")
             print(f"python src/gesture_test.py --camera <ID>")
-            del temp_recognizer
         except:
             pass
 
@@ -0,0 +1,208 @@
+"""
+손 랜드마크 특징 계산 모듈 - (손, 21, 3) 배열에서 제스처 특징을 한 번의 벡터 연산으로 계산함
+손가락 끝 사이 거리, 손목 위치, 손 뼘(엄지 끝~새끼 끝), 손바닥 방향을 모든 손에 대해 동시에 구하고,
+스무딩 필터(landmark_filters)도 배열로 상태를 보관하여 프레임마다 파이썬 반복문 없이 갱신함
+"""
+
+import time
+from typing import Any, Dict, NamedTuple, Optional
+
+import numpy as np
+
+from src.landmark_filters import create_filter
+
+# 손 슬롯 순서 (랜드마크 배열의 첫 번째 축)
+HAND_SLOTS = ('left_hand', 'right_hand')
+NUM_LANDMARKS = 21
+
+# MediaPipe 손 랜드마크 번호
+WRIST = 0
+INDEX_MCP = 5
+MIDDLE_MCP = 9
+PINKY_MCP = 17
+FINGERTIPS = (4, 8, 12, 16, 20)  # 엄지, 검지, 중지, 약지, 새끼
+
+# 손가락 끝 쌍 (엄지-검지, 엄지-중지, ..., 약지-새끼 순서의 10쌍)
+_PAIR_A, _PAIR_B = np.triu_indices(len(FINGERTIPS), k=1)
+FINGERTIP_PAIRS = tuple((FINGERTIPS[a], FINGERTIPS[b]) for a, b in zip(_PAIR_A, _PAIR_B))
+THUMB_INDEX_PAIR = FINGERTIP_PAIRS.index((4, 8))
+THUMB_PINKY_PAIR = FINGERTIP_PAIRS.index((4, 20))
+
+# 특징 계산에 필요한 벡터를 랜드마크 배열 하나의 행렬 곱으로 얻기 위한 계수 (행마다 랜드마크 가중합)
+#   0~9: 손가락 끝 쌍의 차이 벡터, 10: 손목, 11~13: 손목에서 검지/중지/새끼 MCP까지의 벡터
+_FEATURE_MATRIX = np.zeros((len(FINGERTIP_PAIRS) + 4, NUM_LANDMARKS))
+for _row, (_a, _b) in enumerate(FINGERTIP_PAIRS):
+    _FEATURE_MATRIX[_row, _a], _FEATURE_MATRIX[_row, _b] = 1.0, -1.0
+_WRIST_ROW = len(FINGERTIP_PAIRS)
+_FEATURE_MATRIX[_WRIST_ROW, WRIST] = 1.0
+for _row, _mcp in enumerate((INDEX_MCP, MIDDLE_MCP, PINKY_MCP), _WRIST_ROW + 1):
+    _FEATURE_MATRIX[_row, _mcp], _FEATURE_MATRIX[_row, WRIST] = 1.0, -1.0
+
+# 외적용 레비-치비타 기호 (작은 배열에서는 np.cross보다 einsum이 빠름)
+_LEVI_CIVITA = np.zeros((3, 3, 3))
+_LEVI_CIVITA[0, 1, 2] = _LEVI_CIVITA[1, 2, 0] = _LEVI_CIVITA[2, 0, 1] = 1.0
+_LEVI_CIVITA[0, 2, 1] = _LEVI_CIVITA[2, 1, 0] = _LEVI_CIVITA[1, 0, 2] = -1.0
+
+
+class HandFeatures(NamedTuple):
+    """손별 특징 (첫 번째 축 = 손 슬롯)"""
+    fingertip_distances: np.ndarray  # (손, 10) FINGERTIP_PAIRS 순서의 3차원 거리
+    wrist: np.ndarray                # (손, 3) 손목 좌표
+    hand_span: np.ndarray            # (손,) 엄지 끝 ~ 새끼 끝 거리
+    palm_normal: np.ndarray          # (손, 3) 손바닥 평면의 단위 법선 (손목, 검지 MCP, 새끼 MCP 기준)
+    palm_angle: np.ndarray           # (손,) 손목 -> 중지 MCP 방향의 화면상 기울기 (라디안, 0 = 위쪽)
+
+
+def fill_landmarks(out: np.ndarray, hand_landmarks, mirror: bool = False) -> None:
+    """
+    MediaPipe 랜드마크를 미리 할당한 (21, 3) 배열에 채움
+
+    Args:
+        out: 채울 배열 (랜드마크 배열의 손 슬롯 하나)
+        hand_landmarks: MediaPipe NormalizedLandmarkList
+        mirror: x 좌표 좌우 반전 여부
+    """
+    out.reshape(-1)[:] = [value for landmark in hand_landmarks.landmark
+                          for value in (landmark.x, landmark.y, landmark.z)]
+    if mirror:
+        out[:, 0] = 1.0 - out[:, 0]
+
+
+def compute_hand_features(landmarks: np.ndarray) -> HandFeatures:
+    """
+    모든 손의 특징을 한 번에 계산
+
+    Args:
+        landmarks: (손, 21, 3) 랜드마크 배열
+
+    Returns:
+        HandFeatures (감지되지 않은 슬롯의 값은 의미 없음)
+    """
+    vectors = _FEATURE_MATRIX @ landmarks
+    diff = vectors[:, :_WRIST_ROW]
+    fingertip_distances = np.sqrt(np.einsum('hpk,hpk->hp', diff, diff))
+
+    wrist = vectors[:, _WRIST_ROW]
+    index_vec, middle_vec, pinky_vec = vectors[:, _WRIST_ROW + 1], vectors[:, _WRIST_ROW + 2], vectors[:, _WRIST_ROW + 3]
+
+    normal = np.einsum('ijk,hj,hk->hi', _LEVI_CIVITA, index_vec, pinky_vec)
+    norm = np.sqrt(np.einsum('hi,hi->h', normal, normal))
+    palm_normal = normal / np.maximum(norm, 1e-12)[:, None]
+
+    # 이미지 y축은 아래쪽이 양수이므로 손가락이 위를 향하면 0
+    palm_angle = np.arctan2(middle_vec[:, 0], -middle_vec[:, 1])
+
+    return HandFeatures(
+        fingertip_distances=fingertip_distances,
+        wrist=wrist,
+        hand_span=fingertip_distances[:, THUMB_PINKY_PAIR],
+        palm_normal=palm_normal,
+        palm_angle=palm_angle
+    )
+
+
+class LandmarkProcessor:
+    """MediaPipe 결과를 제스처 데이터로 바꾸는 프레임 처리기 (랜드마크와 스무딩 상태를 배열로 보관)"""
+
+    # 스무딩 값 배열 구성: 손 슬롯마다 HAND_VALUES, 마지막은 양손 거리
+    HAND_VALUES = ('thumb_index_distance', 'x_position', 'y_position')
+    VALUE_NAMES = HAND_VALUES * len(HAND_SLOTS) + ('hands_distance',)
+    _VALUES_PER_HAND = len(HAND_VALUES)
+
+    def __init__(self, smooth: bool = True, smoothing: Optional[Dict[str, Any]] = None):
+        """
+        LandmarkProcessor 초기화
+
+        Args:
+            smooth: 엄지-검지 거리, 손목 위치, 양손 거리에 스무딩 적용 여부
+            smoothing: 스무딩 필터 설정 (camera_settings.json의 "smoothing", landmark_filters.create_filter 참고)
+        """
+        self.smooth = smooth
+        self.landmarks = np.zeros((len(HAND_SLOTS), NUM_LANDMARKS, 3), dtype=np.float32)
+        self.detected = np.zeros(len(HAND_SLOTS), dtype=bool)
+
+        size = len(self.VALUE_NAMES)
+        self._values = np.zeros(size)
+        self._mask = np.zeros(size, dtype=bool)
+        self._filter = create_filter(smoothing, self.VALUE_NAMES)
+
+    def reset(self) -> None:
+        """스무딩 상태 초기화"""
+        self._filter.reset()
+
+    def process(self, results, gesture_data: dict, swap_hands: bool = False, mirror: bool = False,
+                timestamp: Optional[float] = None) -> dict:
+        """
+        MediaPipe 결과 한 프레임으로 제스처 데이터 갱신
+
+        랜드마크를 손 슬롯별 배열에 채운 뒤 모든 손의 특징과 스무딩을 한 번의 벡터 연산으로 계산함
+
+        Args:
+            results: MediaPipe Hands 결과
+            gesture_data: 갱신할 제스처 데이터 (gesture_recognizer의 형식)
+            swap_hands: MediaPipe의 왼손/오른손 판별을 바꾸어 사용할지 여부 (좌우반전한 이미지)
+            mirror: x 좌표 좌우 반전 여부
+            timestamp: 프레임 촬영 시각 (초, None이면 현재 시각, 시간 기반 필터에 사용)
+
+        Returns:
+            갱신된 gesture_data
+        """
+        detected = self.detected
+
+        # 제스처 데이터 초기화
+        detected[:] = False
+        gesture_data['left_hand']['detected'] = False
+        gesture_data['right_hand']['detected'] = False
+        gesture_data['both_hands_detected'] = False
+
+        if not results.multi_hand_landmarks:
+            return gesture_data
+
+        # 감지된 각 손의 랜드마크를 슬롯에 채움
+        slots = []
+        for hand_landmarks, handedness in zip(results.multi_hand_landmarks, results.multi_handedness):
+            is_left = handedness.classification[0].label == 'Left'
+            slot = 0 if is_left != swap_hands else 1
+            fill_landmarks(self.landmarks[slot], hand_landmarks, mirror)
+            detected[slot] = True
+            slots.append(slot)
+        both_hands = len(set(slots)) == len(HAND_SLOTS)
+
+        # 특징 계산 (손가락 끝 거리, 손목 위치, 손 뼘, 손바닥 방향)
+        features = compute_hand_features(self.landmarks)
+
+        # 스무딩할 값을 한 배열에 모아 한 번에 갱신
+        values, mask = self._values, self._mask
+        per_hand = values[:-1].reshape(len(HAND_SLOTS), self._VALUES_PER_HAND)
+        per_hand[:, 0] = features.fingertip_distances[:, THUMB_INDEX_PAIR]
+        per_hand[:, 1:] = features.wrist[:, :2]
+        mask[:-1].reshape(per_hand.shape)[:] = detected[:, None]
+        mask[-1] = both_hands
+        if both_hands:
+            wrist_diff = features.wrist[0] - features.wrist[1]
+            values[-1] = np.sqrt(wrist_diff @ wrist_diff)
+        if self.smooth:
+            values = self._filter.update(values, time.perf_counter() if timestamp is None else timestamp, mask)
+
+        values = values.tolist()
+        hand_spans = features.hand_span.tolist()
+        palm_angles = features.palm_angle.tolist()
+        for slot in set(slots):
+            hand_data = gesture_data[HAND_SLOTS[slot]]
+            offset = slot * self._VALUES_PER_HAND
+            hand_data['landmarks'] = self.landmarks[slot].copy()  # 다음 프레임이 슬롯 배열을 덮어써도 유지
+            hand_data['detected'] = True
+            hand_data['thumb_index_distance'] = values[offset]
+            hand_data['x_position'] = values[offset + 1]
+            hand_data['y_position'] = values[offset + 2]
+            hand_data['fingertip_distances'] = features.fingertip_distances[slot]
+            hand_data['hand_span'] = hand_spans[slot]
+            hand_data['palm_normal'] = features.palm_normal[slot]
+            hand_data['palm_angle'] = palm_angles[slot]
+
+        # 양손 거리 (손목 사이)
+        if both_hands:
+            gesture_data['hands_distance'] = values[-1]
+            gesture_data['both_hands_detected'] = True
+
+        return gesture_data
@@ -0,0 +1,155 @@
+"""
+손 랜드마크 처리 비용 비교 스크립트입니다.
+MediaPipe 결과와 같은 모양의 합성 결과로 기존 방식(손마다 [x, y, z] 리스트를 만들고
+거리마다 np.array로 감싸며 문자열 키 딕셔너리로 스무딩)과 LandmarkProcessor의
+프레임당 처리 시간을 비교하고, 두 방식의 제스처 값이 같은지 확인합니다.
+LandmarkProcessor는 손가락 끝 거리 10쌍, 손 뼘, 손바닥 방향까지 계산하므로
+기존 방식으로 같은 특징을 계산한 경우도 함께 측정합니다.
+"""
+
+import os
+import sys
+import time
+import argparse
+from types import SimpleNamespace
+import numpy as np
+
+# 프로젝트 루트 경로를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.hand_features import FINGERTIP_PAIRS, LandmarkProcessor
+
+
+def make_results(rng, hands):
+    """합성 MediaPipe Hands 결과 (손마다 랜드마크 21개)"""
+    multi_hand_landmarks = []
+    multi_handedness = []
+    for label in ('Left', 'Right')[:hands]:
+        points = rng.random((21, 3))
+        landmark = [SimpleNamespace(x=float(x), y=float(y), z=float(z)) for x, y, z in points]
+        multi_hand_landmarks.append(SimpleNamespace(landmark=landmark))
+        multi_handedness.append(SimpleNamespace(classification=[SimpleNamespace(label=label)]))
+    return SimpleNamespace(multi_hand_landmarks=multi_hand_landmarks or None, multi_handedness=multi_handedness)
+
+
+def empty_gesture_data():
+    """빈 제스처 데이터"""
+    hand = {'landmarks': None, 'thumb_index_distance': 0.0, 'x_position': 0.0, 'y_position': 0.0, 'detected': False}
+    return {'left_hand': dict(hand), 'right_hand': dict(hand), 'hands_distance': 0.0, 'both_hands_detected': False}
+
+
+class ReferenceProcessor:
+    """기존 방식의 랜드마크 처리 (비교용, extended이면 같은 방식으로 LandmarkProcessor의 추가 특징도 계산)"""
+
+    def __init__(self, extended=False):
+        self.extended = extended
+        self.previous_values = {}
+
+    def smooth_value(self, key, value):
+        if key not in self.previous_values:
+            self.previous_values[key] = value
+            return value
+        smoothed = self.previous_values[key] * 0.8 + value * 0.2
+        self.previous_values[key] = smoothed
+        return smoothed
+
+    def process(self, results, gesture_data, swap_hands):
+        gesture_data['left_hand']['detected'] = False
+        gesture_data['right_hand']['detected'] = False
+        gesture_data['both_hands_detected'] = False
+        if not results.multi_hand_landmarks:
+            return gesture_data
+
+        for hand_landmarks, handedness in zip(results.multi_hand_landmarks, results.multi_handedness):
+            hand_label = handedness.classification[0].label
+            if swap_hands:
+                hand_type = 'right_hand' if hand_label == 'Left' else 'left_hand'
+            else:
+                hand_type = 'left_hand' if hand_label == 'Left' else 'right_hand'
+
+            landmarks_list = []
+            for landmark in hand_landmarks.landmark:
+                landmarks_list.append([landmark.x, landmark.y, landmark.z])
+            gesture_data[hand_type]['landmarks'] = landmarks_list
+            gesture_data[hand_type]['detected'] = True
+
+            thumb_index_dist = np.linalg.norm(np.array(landmarks_list[4]) - np.array(landmarks_list[8]))
+            wrist = landmarks_list[0]
+            gesture_data[hand_type]['thumb_index_distance'] = self.smooth_value(f"{hand_type}_thumb_index", thumb_index_dist)
+            gesture_data[hand_type]['x_position'] = self.smooth_value(f"{hand_type}_x", wrist[0])
+            gesture_data[hand_type]['y_position'] = self.smooth_value(f"{hand_type}_y", wrist[1])
+
+            if self.extended:
+                distances = [np.linalg.norm(np.array(landmarks_list[a]) - np.array(landmarks_list[b]))
+                             for a, b in FINGERTIP_PAIRS]
+                normal = np.cross(np.array(landmarks_list[5]) - np.array(wrist),
+                                  np.array(landmarks_list[17]) - np.array(wrist))
+                gesture_data[hand_type]['fingertip_distances'] = distances
+                gesture_data[hand_type]['hand_span'] = distances[FINGERTIP_PAIRS.index((4, 20))]
+                gesture_data[hand_type]['palm_normal'] = normal / max(np.linalg.norm(normal), 1e-12)
+                gesture_data[hand_type]['palm_angle'] = float(np.arctan2(landmarks_list[9][0] - wrist[0],
+                                                                         wrist[1] - landmarks_list[9][1]))
+
+        if gesture_data['left_hand']['detected'] and gesture_data['right_hand']['detected']:
+            hands_dist = np.linalg.norm(np.array(gesture_data['left_hand']['landmarks'][0])
+                                        - np.array(gesture_data['right_hand']['landmarks'][0]))
+            gesture_data['hands_distance'] = self.smooth_value("hands_distance", hands_dist)
+            gesture_data['both_hands_detected'] = True
+        return gesture_data
+
+
+def measure(process, frames):
+    """프레임 목록 처리 시간 (프레임당 µs)"""
+    start_time = time.perf_counter()
+    for results in frames:
+        process(results)
+    return (time.perf_counter() - start_time) / len(frames) * 1e6
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='손 랜드마크 처리 비용 비교')
+    parser.add_argument('--frames', type=int, default=5000,
+                        help='측정할 프레임 수 (기본값: 5000)')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    for hands in (1, 2):
+        frames = [make_results(rng, hands) for _ in range(200)]
+        frames = (frames * (args.frames // len(frames) + 1))[:args.frames]
+
+        reference, reference_data = ReferenceProcessor(), empty_gesture_data()
+        processor, processor_data = LandmarkProcessor(smoothing={'filter': 'ema'}), empty_gesture_data()
+
+        # 값 비교 (float32 랜드마크이므로 작은 오차 허용)
+        max_error = 0.0
+        for results in frames[:200]:
+            expected = reference.process(results, reference_data, True)
+            actual = processor.process(results, processor_data, True)
+            for hand_type in ('left_hand', 'right_hand'):
+                if expected[hand_type]['detected']:
+                    for key in ('thumb_index_distance', 'x_position', 'y_position'):
+                        max_error = max(max_error, abs(expected[hand_type][key] - actual[hand_type][key]))
+            if expected['both_hands_detected']:
+                max_error = max(max_error, abs(expected['hands_distance'] - actual['hands_distance']))
+
+        # 이전 프레임에서 받은 랜드마크가 다음 프레임 처리 후에도 그대로인지 확인
+        kept = {hand_type: hand['landmarks'] for hand_type, hand in
+                processor.process(frames[0], processor_data, True).items()
+                if isinstance(hand, dict) and hand['detected']}
+        expected_kept = {hand_type: landmarks.copy() for hand_type, landmarks in kept.items()}
+        processor.process(frames[1], processor_data, True)
+        landmarks_kept = all(np.array_equal(kept[hand_type], expected_kept[hand_type]) for hand_type in kept)
+
+        extended, extended_data = ReferenceProcessor(extended=True), empty_gesture_data()
+        old_us = measure(lambda results: reference.process(results, reference_data, True), frames)
+        extended_us = measure(lambda results: extended.process(results, extended_data, True), frames)
+        new_us = measure(lambda results: processor.process(results, processor_data, True), frames)
+        print(f"손 {hands}개: 기존(엄지-검지 거리, 손목) {old_us:6.1f}us, "
+              f"기존 방식으로 같은 특징 {extended_us:6.1f}us, LandmarkProcessor {new_us:6.1f}us "
+              f"(프레임당), 최대 오차 {max_error:.2e}, "
+              f"이전 프레임 랜드마크 {'유지' if landmarks_kept else '변경됨'}")
+
+
+if __name__ == "__main__":
+    main()
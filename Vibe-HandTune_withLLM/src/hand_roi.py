@@ -0,0 +1,227 @@
+"""
+손 관심 영역(ROI) 추적 모듈 - 이전 프레임의 손 위치 주변만 잘라 MediaPipe에 넣음
+손 경계 상자에 여유를 둔 정사각형 영역을 잘라내고, 영역이 크면 입력 크기를 줄임
+ROI는 추적 중인 손 개수만큼만 찾는 인스턴스로 감지하여, 손이 최대 손 개수보다 적을 때
+MediaPipe가 매 프레임 손바닥 감지를 다시 하지 않도록 함 (프레임당 CPU 시간의 대부분)
+영역 안에서 손을 놓치면 같은 프레임을 전체 이미지로 다시 감지하고,
+추적 중인 손이 최대 손 개수보다 적으면 새로 들어온 손을 찾기 위해 주기적으로 전체 이미지를 감지함
+"""
+
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+# (x0, y0, x1, y1) 픽셀 좌표, x1/y1은 포함하지 않음
+Box = Tuple[int, int, int, int]
+
+
+class HandRoiTracker:
+    """손 ROI 선택, 잘라내기/축소, MediaPipe 인스턴스 관리, 좌표 복원, 추적 통계"""
+
+    def __init__(self, create_hands: Callable[[bool, int], object], max_hands: int = 2, margin: float = 0.6,
+                 max_input_size: int = 256, min_roi_size: int = 96, max_roi_area: float = 0.5,
+                 full_frame_interval: int = 15):
+        """
+        HandRoiTracker 초기화
+
+        Args:
+            create_hands: (static_image_mode, max_num_hands)를 받아 MediaPipe Hands 인스턴스를 만드는 함수
+            max_hands: 최대 손 개수 (추적 중인 손이 이보다 적으면 주기적으로 전체 이미지 감지)
+            margin: 손 경계 상자 크기 대비 사방 여유 비율 (클수록 빠른 움직임에도 ROI를 덜 옮김)
+            max_input_size: MediaPipe 입력 한 변의 최대 크기 (픽셀, ROI가 더 크면 축소)
+            min_roi_size: ROI 한 변의 최소 크기 (픽셀, 작은 손도 주변을 포함하도록)
+            max_roi_area: 프레임 면적 대비 ROI 면적이 이보다 크면 축소한 전체 이미지를 ROI로 사용
+            full_frame_interval: 새 손을 찾기 위해 전체 이미지를 감지하는 프레임 간격 (0이면 하지 않음)
+        """
+        self.create_hands = create_hands
+        self.max_hands = max_hands
+        self.margin = margin
+        self.max_input_size = max_input_size
+        self.min_roi_size = min_roi_size
+        self.max_roi_area = max_roi_area
+        self.full_frame_interval = full_frame_interval
+
+        # 손 개수별 추적 모드 인스턴스와 마지막 입력 영역, 전체 이미지 감지용 정지 이미지 모드 인스턴스
+        # (필요할 때 생성)
+        self._tracking_hands: Dict[int, object] = {}
+        self._tracking_inputs: Dict[int, Optional[Tuple]] = {}
+        self._full_frame_hands = None
+        self.reset()
+
+    def reset(self) -> None:
+        """추적 상태와 통계 초기화"""
+        self.box: Optional[Box] = None
+        self.tracked_hands = 0
+        self._frames_since_full = 0
+        # 다음에 사용할 때 MediaPipe 추적 상태도 초기화하도록 입력 영역을 지움
+        self._tracking_inputs = dict.fromkeys(self._tracking_hands)
+
+        self.frames = 0
+        self.roi_frames = 0
+        self.full_frames = 0
+        self.tracking_lost = 0
+        self.tracking_restarts = 0
+        self._input_pixels = 0
+        self._detect_time = 0.0
+
+    def close(self) -> None:
+        """MediaPipe 인스턴스 해제"""
+        for hands in self._tracking_hands.values():
+            hands.close()
+        self._tracking_hands.clear()
+        self._tracking_inputs.clear()
+        if self._full_frame_hands is not None:
+            self._full_frame_hands.close()
+            self._full_frame_hands = None
+
+    def detect(self, frame: np.ndarray):
+        """
+        ROI(또는 전체 이미지)에서 손 감지
+
+        ROI는 추적 중인 손 개수만큼만 찾는 추적 모드 인스턴스로 처리함
+        (찾을 손이 모두 추적되는 동안 MediaPipe가 손바닥 감지를 건너뛰므로 프레임당 CPU 시간이 줄어듦)
+        MediaPipe의 프레임 간 추적은 입력 좌표계가 매 프레임 같다고 가정하므로,
+        ROI가 바뀌면 해당 인스턴스의 추적 상태를 초기화함 (ROI는 손이 안쪽에 머무는 동안 고정)
+        새 손 찾기와 추적 실패 후 재감지는 추적 상태가 없는 정지 이미지 모드 인스턴스로 전체 이미지를 감지함
+
+        Args:
+            frame: BGR 프레임 (좌우반전을 적용한 경우 적용한 뒤의 프레임)
+
+        Returns:
+            MediaPipe 결과 (랜드마크 좌표는 frame 전체 기준으로 복원됨)
+        """
+        start_time = time.perf_counter()
+        self.frames += 1
+        height, width = frame.shape[:2]
+
+        results = None
+        if self.box is not None:
+            image = self._crop(frame, self.box)
+            results = self._process_roi(image)
+            self._input_pixels += image.shape[0] * image.shape[1]
+            if results.multi_hand_landmarks:
+                self._map_to_frame(results, self.box, width, height)
+                self.roi_frames += 1
+            else:
+                # 추적 실패: 같은 프레임을 전체 이미지로 다시 감지
+                self.tracking_lost += 1
+                results = None
+
+        if results is None or self._probe_due():
+            full_results = self._process_full_frame(frame)
+            self._input_pixels += width * height
+            self.full_frames += 1
+            self._frames_since_full = 0
+            # 새 손을 찾는 주기적 감지에서는 손을 더 많이 찾은 경우에만 ROI 결과를 대신함
+            if results is None or len(full_results.multi_hand_landmarks or ()) > len(results.multi_hand_landmarks):
+                results = full_results
+        else:
+            self._frames_since_full += 1
+
+        self._update_box(results, width, height)
+        self._detect_time += time.perf_counter() - start_time
+        return results
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        추적 통계 반환
+
+        Returns:
+            처리 프레임 수, ROI 감지 성공 프레임 수, 전체 이미지 감지 횟수, 추적 실패 수와 비율(ROI 시도 대비),
+            ROI가 바뀌어 MediaPipe 추적 상태를 초기화한 횟수, 프레임당 평균 입력 픽셀 수, 프레임당 평균 감지 시간 (ms)
+        """
+        attempts = self.roi_frames + self.tracking_lost
+        frames = max(self.frames, 1)
+        return {
+            "frames": self.frames,
+            "roi_frames": self.roi_frames,
+            "full_frames": self.full_frames,
+            "tracking_lost": self.tracking_lost,
+            "tracking_loss_rate": self.tracking_lost / attempts if attempts else 0.0,
+            "tracking_restarts": self.tracking_restarts,
+            "mean_input_pixels": self._input_pixels / frames,
+            "mean_detect_ms": self._detect_time / frames * 1000,
+        }
+
+    def _probe_due(self) -> bool:
+        """추적 중인 손이 최대 개수보다 적을 때 새 손을 찾기 위한 전체 이미지 감지 시점인지 여부"""
+        return (self.tracked_hands < self.max_hands and self.full_frame_interval > 0
+                and self._frames_since_full >= self.full_frame_interval)
+
+    def _process_roi(self, image: np.ndarray):
+        """추적 중인 손 개수용 추적 모드 인스턴스로 ROI 감지 (입력 영역이 바뀌었으면 추적 상태 초기화)"""
+        hands = self._tracking_hands.get(self.tracked_hands)
+        roi_input = (self.box, image.shape[:2])
+        if hands is None:
+            hands = self._tracking_hands[self.tracked_hands] = self.create_hands(False, self.tracked_hands)
+        elif self._tracking_inputs.get(self.tracked_hands) != roi_input:
+            hands.reset()
+            self.tracking_restarts += 1
+        self._tracking_inputs[self.tracked_hands] = roi_input
+        return hands.process(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
+
+    def _process_full_frame(self, frame: np.ndarray):
+        """정지 이미지 모드 인스턴스로 전체 이미지 감지"""
+        if self._full_frame_hands is None:
+            self._full_frame_hands = self.create_hands(True, self.max_hands)
+        return self._full_frame_hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+
+    def _crop(self, frame: np.ndarray, box: Box) -> np.ndarray:
+        """ROI를 잘라내고, 한 변이 max_input_size보다 크면 축소"""
+        x0, y0, x1, y1 = box
+        image = frame[y0:y1, x0:x1]
+        side = max(x1 - x0, y1 - y0)
+        if side > self.max_input_size:
+            scale = self.max_input_size / side
+            size = (max(1, round((x1 - x0) * scale)), max(1, round((y1 - y0) * scale)))
+            image = cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+        return image
+
+    @staticmethod
+    def _map_to_frame(results, box: Box, width: int, height: int) -> None:
+        """ROI 기준 정규화 좌표를 프레임 전체 기준으로 복원 (결과를 직접 수정)"""
+        x0, y0, x1, y1 = box
+        scale_x, scale_y = (x1 - x0) / width, (y1 - y0) / height
+        offset_x, offset_y = x0 / width, y0 / height
+        for hand_landmarks in results.multi_hand_landmarks:
+            for landmark in hand_landmarks.landmark:
+                landmark.x = offset_x + landmark.x * scale_x
+                landmark.y = offset_y + landmark.y * scale_y
+                landmark.z = landmark.z * scale_x  # z는 이미지 너비 기준 척도
+
+    def _update_box(self, results, width: int, height: int) -> None:
+        """감지된 손의 경계 상자로 다음 프레임의 ROI 갱신"""
+        if not results.multi_hand_landmarks:
+            self.box = None
+            self.tracked_hands = 0
+            return
+
+        points = np.array([(landmark.x, landmark.y)
+                           for hand_landmarks in results.multi_hand_landmarks
+                           for landmark in hand_landmarks.landmark]) * (width, height)
+        (left, top), (right, bottom) = points.min(axis=0), points.max(axis=0)
+        self.tracked_hands = len(results.multi_hand_landmarks)
+
+        # 손이 이전 ROI 안쪽에 머물고 크기도 비슷하면 ROI를 유지
+        # (ROI가 바뀌면 MediaPipe 추적 상태를 초기화해야 하므로 가능한 한 같은 영역을 사용)
+        side = max(right - left, bottom - top) * (1.0 + 2.0 * self.margin)
+        side = min(max(side, self.min_roi_size), width, height)
+        if self.box is not None:
+            x0, y0, x1, y1 = self.box
+            inset = (x1 - x0) * self.margin / (2.0 * (1.0 + 2.0 * self.margin))
+            if (x0 + inset <= left and right <= x1 - inset and y0 + inset <= top and bottom <= y1 - inset
+                    and x1 - x0 <= 1.5 * side):
+                return
+
+        if side * side > self.max_roi_area * width * height:
+            # 잘라내도 이득이 적으므로 축소한 전체 이미지를 ROI로 사용
+            self.box = (0, 0, width, height)
+            return
+
+        # 손 중심의 정사각형 영역 (프레임 밖으로 나가면 안쪽으로 밀어 넣음)
+        center_x, center_y = (left + right) / 2.0, (top + bottom) / 2.0
+        x0 = int(min(max(center_x - side / 2.0, 0), width - side))
+        y0 = int(min(max(center_y - side / 2.0, 0), height - side))
+        self.box = (x0, y0, x0 + int(side), y0 + int(side))
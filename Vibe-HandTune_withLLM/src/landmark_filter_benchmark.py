@@ -0,0 +1,204 @@
+"""
+스무딩 필터 지연/떨림 비교 스크립트입니다.
+녹화한 제스처 값 기록(스무딩 없이 저장한 엄지-검지 거리, 손목 위치, 양손 거리)을
+각 필터(landmark_filters)에 프레임 순서대로 다시 넣어 필터별 지연(ms)과 정지 상태 떨림을 비교합니다.
+기준 궤적은 기록 전체를 보고 앞뒤 프레임을 함께 평균한 값(지연 없는 오프라인 스무딩)을 사용하며,
+기록 파일이 없으면 실제 궤적을 아는 합성 기록을 사용합니다.
+
+사용 예:
+    python -m src.landmark_filter_benchmark --record traces/hands.npz --seconds 30
+    python -m src.landmark_filter_benchmark --trace traces/hands.npz
+"""
+
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+# 프로젝트 루트 경로를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config_loader import load_camera_settings
+from src.hand_features import HAND_SLOTS, LandmarkProcessor
+from src.landmark_filters import FILTERS, create_filter
+
+VALUE_NAMES = LandmarkProcessor.VALUE_NAMES
+
+
+def gesture_values(gesture_data):
+    """제스처 데이터에서 필터 입력 값과 감지 여부 (LandmarkProcessor.VALUE_NAMES 순서)"""
+    values, mask = [], []
+    for hand_type in HAND_SLOTS:
+        for name in LandmarkProcessor.HAND_VALUES:
+            values.append(gesture_data[hand_type][name])
+            mask.append(gesture_data[hand_type]['detected'])
+    values.append(gesture_data['hands_distance'])
+    mask.append(gesture_data['both_hands_detected'])
+    return values, mask
+
+
+def record_trace(path, seconds, video=None, settings_path=None):
+    """카메라(또는 동영상)에서 스무딩 없는 제스처 값을 기록하여 npz 파일로 저장"""
+    import cv2
+    from src.gesture_recognizer import GestureEngine
+
+    engine = GestureEngine(settings_path, smooth_landmarks=False, headless=True)
+    if video:
+        cap = cv2.VideoCapture(video)
+        fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    else:
+        if not engine.start_webcam():
+            raise SystemExit("웹캠을 열 수 없습니다.")
+        cap = engine.cap
+        fps = None
+
+    times, values, mask = [], [], []
+    start_time = time.perf_counter()
+    print(f"{seconds:.0f}초 동안 기록합니다. 손을 멈췄다 움직였다 해 주세요.")
+    while time.perf_counter() - start_time < seconds:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        # 동영상은 프레임 번호로 촬영 시각을 정함 (처리 속도와 무관)
+        capture_time = len(times) / fps if fps else time.perf_counter() - start_time
+        gesture_data, _ = engine.process_frame(frame, capture_time)
+        frame_values, frame_mask = gesture_values(gesture_data)
+        times.append(capture_time)
+        values.append(frame_values)
+        mask.append(frame_mask)
+
+    if video:
+        cap.release()
+    engine.close()
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    np.savez(path, times=np.array(times), values=np.array(values), mask=np.array(mask, dtype=bool))
+    print(f"{len(times)}프레임을 기록했습니다: {path}")
+
+
+def synthetic_trace(seconds, fps, noise, rng):
+    """정지와 빠른 이동을 반복하는 합성 기록 (촬영 시각, 측정값, 감지 여부, 실제 값)"""
+    count = int(seconds * fps)
+    times = np.cumsum(rng.normal(1.0 / fps, 0.002, count).clip(0.5 / fps))  # 프레임 간격 흔들림 2ms
+    truth = np.empty((count, len(VALUE_NAMES)))
+    for column in range(len(VALUE_NAMES)):
+        position, t = rng.uniform(0.3, 0.7), 0.0
+        knots_t, knots_v = [0.0], [position]
+        while t < times[-1]:
+            t += rng.uniform(0.8, 2.0)               # 정지
+            knots_t.append(t)
+            knots_v.append(position)
+            t += rng.uniform(0.15, 0.6)              # 이동
+            position = float(np.clip(position + rng.uniform(-0.35, 0.35), 0.05, 0.95))
+            knots_t.append(t)
+            knots_v.append(position)
+        # 구간마다 코사인 곡선으로 부드럽게 이동
+        segment = np.searchsorted(knots_t, times).clip(1, len(knots_t) - 1)
+        t0, t1 = np.array(knots_t)[segment - 1], np.array(knots_t)[segment]
+        v0, v1 = np.array(knots_v)[segment - 1], np.array(knots_v)[segment]
+        phase = ((times - t0) / (t1 - t0)).clip(0.0, 1.0)
+        truth[:, column] = v0 + (v1 - v0) * (1.0 - np.cos(np.pi * phase)) / 2.0
+    values = truth + rng.normal(0.0, noise, truth.shape)
+    return times, values, np.ones(truth.shape, dtype=bool), truth
+
+
+def offline_reference(values, mask, window):
+    """앞뒤 프레임을 함께 평균한 기준 궤적 (값마다 감지된 프레임만 사용, 지연 없음)"""
+    reference = np.full(values.shape, np.nan)
+    kernel = np.ones(window) / window
+    for column in range(values.shape[1]):
+        valid = mask[:, column]
+        if valid.sum() < window:
+            continue
+        padded = np.pad(values[valid, column], window // 2, mode='edge')
+        reference[valid, column] = np.convolve(padded, kernel, mode='valid')
+    return reference
+
+
+def run_filter(value_filter, times, values, mask):
+    """기록을 프레임 순서대로 필터에 넣은 결과와 프레임당 처리 시간 (µs)"""
+    output = np.empty(values.shape)
+    start_time = time.perf_counter()
+    for index in range(len(times)):
+        if value_filter is None:
+            output[index] = values[index]
+        else:
+            output[index] = value_filter.update(values[index], times[index], mask[index])
+    return output, (time.perf_counter() - start_time) / len(times) * 1e6
+
+
+def evaluate(times, output, reference, mask, rest_speed, motion_speed, max_lag_ms=200):
+    """값별 지연(ms)과 정지 상태 떨림(프레임 간 변화의 RMS)의 평균"""
+    lags, jitters = [], []
+    delays = np.arange(0.0, max_lag_ms + 1.0) / 1000.0
+    for column in range(output.shape[1]):
+        valid = mask[:, column] & ~np.isnan(reference[:, column])
+        if valid.sum() < 10:
+            continue
+        t, out, ref = times[valid], output[valid, column], reference[valid, column]
+        speed = np.abs(np.gradient(ref, t))
+
+        # 정지 상태 떨림: 기준 궤적이 거의 멈춘 구간에서 필터 출력의 프레임 간 변화
+        rest = (speed[1:] < rest_speed) & (speed[:-1] < rest_speed)
+        if rest.any():
+            jitters.append(np.sqrt(np.mean(np.diff(out)[rest] ** 2)))
+
+        # 지연: 움직이는 구간에서 출력과 가장 잘 맞는 기준 궤적의 시간 이동량
+        motion = speed > motion_speed
+        if motion.sum() >= 5:
+            errors = [np.mean((out[motion] - np.interp(t[motion] - delay, t, ref)) ** 2) for delay in delays]
+            lags.append(delays[int(np.argmin(errors))] * 1000.0)
+    return (float(np.mean(lags)) if lags else float('nan'),
+            float(np.mean(jitters)) if jitters else float('nan'))
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='스무딩 필터 지연/떨림 비교')
+    parser.add_argument('--trace', type=str, default=None,
+                        help='비교에 사용할 기록 파일 (.npz, 없으면 합성 기록)')
+    parser.add_argument('--record', type=str, default=None,
+                        help='카메라에서 기록하여 저장할 파일 (.npz)')
+    parser.add_argument('--video', type=str, default=None,
+                        help='기록할 때 카메라 대신 사용할 동영상 파일')
+    parser.add_argument('--seconds', type=float, default=30.0,
+                        help='기록 시간 또는 합성 기록 길이 (초, 기본값: 30)')
+    parser.add_argument('--settings', type=str, default=None,
+                        help='필터 설정을 읽을 카메라 설정 파일 (기본값: config/camera_settings.json)')
+    parser.add_argument('--fps', type=float, default=30.0,
+                        help='합성 기록의 프레임 속도 (기본값: 30)')
+    parser.add_argument('--noise', type=float, default=0.003,
+                        help='합성 기록의 측정 잡음 표준편차 (정규화 좌표, 기본값: 0.003)')
+    parser.add_argument('--window', type=int, default=7,
+                        help='기준 궤적 평균 창 크기 (프레임, 기본값: 7)')
+    args = parser.parse_args()
+
+    if args.record:
+        record_trace(args.record, args.seconds, args.video, args.settings)
+        return
+
+    if args.trace:
+        trace = np.load(args.trace)
+        times, values, mask = trace['times'], trace['values'], trace['mask']
+        reference = offline_reference(values, mask, args.window)
+        print(f"기록 {args.trace}: {len(times)}프레임, {times[-1] - times[0]:.1f}초")
+    else:
+        times, values, mask, reference = synthetic_trace(args.seconds, args.fps, args.noise,
+                                                         np.random.default_rng(0))
+        print(f"합성 기록: {len(times)}프레임, {args.fps:.0f}fps, 잡음 {args.noise}")
+
+    # 정지/이동 구간 기준 (정규화 단위/초)
+    rest_speed, motion_speed = 0.02, 0.3
+    smoothing = load_camera_settings(args.settings).get("smoothing", {})
+
+    print(f"{'필터':<10} {'지연':>8} {'정지 떨림':>10} {'처리 시간':>10}")
+    for name in ('raw',) + tuple(FILTERS):
+        value_filter = None if name == 'raw' else create_filter({**smoothing, "filter": name}, VALUE_NAMES)
+        output, cost_us = run_filter(value_filter, times, values, mask)
+        lag_ms, jitter = evaluate(times, output, reference, mask, rest_speed, motion_speed)
+        print(f"{name:<10} {lag_ms:>6.1f}ms {jitter * 1000:>8.3f}e-3 {cost_us:>8.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""
+랜드마크 값 필터 모듈 - 제스처 값의 떨림을 줄이는 스무딩 필터 모음
+지수 이동 평균(EMA), One-Euro 필터, 등속 칼만 필터를 같은 인터페이스(update/reset)로 제공함
+모든 필터는 값마다 독립적인 상태를 배열로 보관하여 여러 값을 한 번에 갱신하고,
+파라미터도 값마다 다르게 줄 수 있음 (camera_settings.json의 "smoothing" 설정)
+"""
+
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+# 같은 타임스탬프가 두 번 들어와도 0으로 나누지 않도록 하는 최소 시간 간격 (초)
+_MIN_DT = 1e-6
+
+# 칼만 필터 초기 속도 분산 ((단위/초)^2, 정규화 좌표에서 초당 화면 폭 정도의 불확실성)
+_INITIAL_VELOCITY_VARIANCE = 1.0
+
+
+class LandmarkFilter:
+    """값 필터 기본 클래스 (값마다 독립적인 상태를 배열로 보관)"""
+
+    # 값마다 다르게 줄 수 있는 파라미터와 기본값 (하위 클래스에서 정의)
+    PARAMETERS: Dict[str, float] = {}
+
+    def __init__(self, size: int, **params):
+        """
+        필터 초기화
+
+        Args:
+            size: 필터할 값 수
+            **params: PARAMETERS의 파라미터 (스칼라 또는 값마다 하나씩인 시퀀스)
+        """
+        self.size = size
+        self.output = np.zeros(size)
+        self.last_time = np.zeros(size)
+        self.initialized = np.zeros(size, dtype=bool)
+        self._all = np.ones(size, dtype=bool)
+
+        for name, default in self.PARAMETERS.items():
+            value = np.asarray(params.pop(name, default), dtype=float)
+            setattr(self, name, np.broadcast_to(value, (size,)).copy())
+        if params:
+            raise ValueError(f"{type(self).__name__}에 없는 파라미터입니다: {', '.join(params)}")
+
+    def update(self, values: np.ndarray, timestamp: float, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        새 측정값을 반영한 필터 결과 반환
+
+        Args:
+            values: 새 측정값
+            timestamp: 측정 시각 (초, time.perf_counter 기준)
+            mask: 갱신할 값 (None이면 모든 값, 갱신하지 않은 값은 이전 상태 유지)
+
+        Returns:
+            필터된 값 (출력 배열 자체이므로 다음 update 전에 사용할 것)
+        """
+        if mask is None:
+            mask = self._all
+
+        # 이미 값이 있는 항목은 필터링, 처음 들어온 항목은 측정값으로 상태를 시작함
+        dt = np.maximum(timestamp - self.last_time, _MIN_DT)
+        self._step(values, dt, mask & self.initialized)
+        self._start(values, mask & ~self.initialized)
+
+        np.copyto(self.last_time, timestamp, where=mask)
+        self.initialized |= mask
+        return self.output
+
+    def reset(self) -> None:
+        """필터 상태 초기화"""
+        self.output[:] = 0.0
+        self.last_time[:] = 0.0
+        self.initialized[:] = False
+
+    def _step(self, values: np.ndarray, dt: np.ndarray, where: np.ndarray) -> None:
+        """where 항목의 상태를 측정값으로 갱신 (하위 클래스에서 구현)"""
+        raise NotImplementedError
+
+    def _start(self, values: np.ndarray, where: np.ndarray) -> None:
+        """where 항목의 상태를 측정값으로 시작"""
+        np.copyto(self.output, values, where=where)
+
+
+class ExponentialFilter(LandmarkFilter):
+    """프레임 단위 지수 이동 평균 (기존 smooth_value와 같은 계산, 시간 간격은 사용하지 않음)"""
+
+    PARAMETERS = {
+        "factor": 0.8,  # 이전 값의 비중 (0~1, 클수록 부드럽고 느림)
+    }
+
+    def _step(self, values, dt, where):
+        np.copyto(self.output, values + (self.output - values) * self.factor, where=where)
+
+
+class OneEuroFilter(LandmarkFilter):
+    """
+    One-Euro 필터 (Casiez et al., 2012)
+
+    값의 변화 속도를 따로 추정하여 느릴 때는 차단 주파수를 낮춰 떨림을 줄이고,
+    빠를 때는 차단 주파수를 높여 지연을 줄임 (cutoff = min_cutoff + beta * |속도|)
+    """
+
+    PARAMETERS = {
+        "min_cutoff": 0.5,  # 정지 상태의 차단 주파수 (Hz, 낮을수록 떨림이 줄고 지연이 늘어남)
+        "beta": 20.0,       # 속도에 따른 차단 주파수 증가량 (Hz / (단위/초), 클수록 빠른 동작의 지연이 줄어듦)
+        "d_cutoff": 1.0,    # 속도 추정값의 차단 주파수 (Hz)
+    }
+
+    def __init__(self, size: int, **params):
+        super().__init__(size, **params)
+        self.derivative = np.zeros(size)
+
+    def reset(self) -> None:
+        super().reset()
+        self.derivative[:] = 0.0
+
+    @staticmethod
+    def _alpha(cutoff: np.ndarray, dt: np.ndarray) -> np.ndarray:
+        """차단 주파수와 시간 간격에 해당하는 1차 저역 통과 필터 계수"""
+        return 1.0 / (1.0 + 1.0 / (2.0 * np.pi * cutoff * dt))
+
+    def _step(self, values, dt, where):
+        derivative = (values - self.output) / dt
+        derivative = self.derivative + self._alpha(self.d_cutoff, dt) * (derivative - self.derivative)
+        cutoff = self.min_cutoff + self.beta * np.abs(derivative)
+        filtered = self.output + self._alpha(cutoff, dt) * (values - self.output)
+
+        np.copyto(self.derivative, derivative, where=where)
+        np.copyto(self.output, filtered, where=where)
+
+    def _start(self, values, where):
+        super()._start(values, where)
+        np.copyto(self.derivative, 0.0, where=where)
+
+
+class KalmanFilter(LandmarkFilter):
+    """
+    등속 모델 칼만 필터 (값마다 위치, 속도 2차원 상태)
+
+    속도를 상태로 추정하여 움직이는 동안의 지연을 줄이고, 측정 잡음이 클수록 정지 상태의 떨림을 줄임
+    프로세스 잡음은 가속도를 백색 잡음으로 보는 연속 시간 모델 (프레임 간격이 달라도 같은 의미)
+    """
+
+    PARAMETERS = {
+        "process_noise": 0.03,        # 가속도 잡음 스펙트럼 밀도 ((단위/초^2)^2 * 초, 클수록 빠른 변화를 따라감)
+        "measurement_noise": 1e-5,    # 측정 잡음 분산 (단위^2, 클수록 떨림이 줄고 지연이 늘어남)
+    }
+
+    def __init__(self, size: int, **params):
+        super().__init__(size, **params)
+        self.velocity = np.zeros(size)
+        # 상태 공분산 (대칭 2x2 행렬의 세 성분)
+        self.p00 = np.zeros(size)
+        self.p01 = np.zeros(size)
+        self.p11 = np.zeros(size)
+
+    def reset(self) -> None:
+        super().reset()
+        for state in (self.velocity, self.p00, self.p01, self.p11):
+            state[:] = 0.0
+
+    def _step(self, values, dt, where):
+        q, r = self.process_noise, self.measurement_noise
+
+        # 예측 (x += v * dt, P = F P F^T + Q)
+        predicted = self.output + self.velocity * dt
+        p00 = self.p00 + dt * (2.0 * self.p01 + dt * self.p11) + q * dt ** 3 / 3.0
+        p01 = self.p01 + dt * self.p11 + q * dt ** 2 / 2.0
+        p11 = self.p11 + q * dt
+
+        # 갱신
+        gain0 = p00 / (p00 + r)
+        gain1 = p01 / (p00 + r)
+        innovation = values - predicted
+
+        np.copyto(self.output, predicted + gain0 * innovation, where=where)
+        np.copyto(self.velocity, self.velocity + gain1 * innovation, where=where)
+        np.copyto(self.p00, (1.0 - gain0) * p00, where=where)
+        np.copyto(self.p01, (1.0 - gain0) * p01, where=where)
+        np.copyto(self.p11, p11 - gain1 * p01, where=where)
+
+    def _start(self, values, where):
+        super()._start(values, where)
+        np.copyto(self.velocity, 0.0, where=where)
+        np.copyto(self.p00, self.measurement_noise, where=where)
+        np.copyto(self.p01, 0.0, where=where)
+        np.copyto(self.p11, _INITIAL_VELOCITY_VARIANCE, where=where)
+
+
+FILTERS = {
+    "ema": ExponentialFilter,
+    "one_euro": OneEuroFilter,
+    "kalman": KalmanFilter,
+}
+
+
+def create_filter(config: Optional[Dict[str, Any]], names: Sequence[str]) -> LandmarkFilter:
+    """
+    스무딩 설정으로 필터 생성
+
+    설정 형식 (camera_settings.json의 "smoothing"):
+        {"filter": "one_euro",
+         "one_euro": {"min_cutoff": 0.5, "beta": 20.0},
+         "features": {"thumb_index_distance": {"min_cutoff": 0.3}}}
+    필터 종류별 설정은 모든 값에 적용되고, "features"의 값 이름별 설정이 이를 덮어씀
+
+    Args:
+        config: 스무딩 설정 (None이면 기본 설정의 One-Euro 필터)
+        names: 필터할 값의 이름 목록 (값 배열 순서, "features" 설정의 키)
+
+    Returns:
+        값 수가 len(names)인 필터
+    """
+    config = config or {}
+    filter_type = config.get("filter", "one_euro")
+    if filter_type not in FILTERS:
+        raise ValueError(f"지원하지 않는 스무딩 필터입니다: {filter_type} (지원: {', '.join(FILTERS)})")
+
+    filter_class = FILTERS[filter_type]
+    base = {**filter_class.PARAMETERS, **config.get(filter_type, {})}
+    features = config.get("features", {})
+
+    # 값 이름별 설정이 있는 파라미터만 값마다 다른 배열로 만듦 (다른 필터용 항목은 무시)
+    params = {}
+    for param, default in base.items():
+        per_value = [features.get(name, {}).get(param, default) for name in names]
+        params[param] = per_value if len(set(per_value)) > 1 else default
+    return filter_class(len(names), **params)
@@ -0,0 +1,212 @@
+"""
+로컬 STT 대역(stand-in) 서버 모듈입니다.
+OpenAI 음성 변환 API(/v1/audio/transcriptions)와 같은 형식으로 응답하는 HTTP 서버를 띄워
+네트워크나 API 키 없이 STT 경로의 지연 시간을 측정할 수 있게 합니다.
+
+서버는 업로드된 오디오 길이에 비례하는 처리 지연을 흉내 내고,
+synthesize_tone_words()로 만든 합성 음성을 "단어" 단위로 되돌려 읽어 텍스트를 만듭니다.
+"""
+
+import io
+import json
+import time
+import wave
+import threading
+import email.parser
+import email.policy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import numpy as np
+
+try:
+    import soundfile as sf
+except (ImportError, OSError):
+    sf = None
+
+# 합성 단어 n은 TONE_BASE_HZ + n * TONE_STEP_HZ 주파수의 순음으로 표현함
+TONE_BASE_HZ = 300.0
+TONE_STEP_HZ = 50.0
+
+
+def synthesize_tone_words(words, sample_rate=16000, word_time=0.25, gap_time=0.08,
+                          pause_after=None, pause_time=0.4, amplitude=0.3):
+    """
+    단어 번호 목록을 순음 버스트로 이루어진 합성 음성으로 변환
+
+    Args:
+        words: 단어 번호 리스트 (0 이상 정수)
+        sample_rate: 샘플링 레이트
+        word_time: 단어 하나의 길이 (초)
+        gap_time: 단어 사이 간격 (초)
+        pause_after: 이 인덱스의 단어 뒤에 짧은 쉼(micro-pause)을 넣음
+        pause_time: 짧은 쉼의 길이 (초)
+        amplitude: 진폭 (0~1)
+
+    Returns:
+        (frames, 1) 모양의 int16 오디오 배열
+    """
+    pause_after = set(pause_after or [])
+    word_frames = int(word_time * sample_rate)
+    t = np.arange(word_frames) / sample_rate
+    envelope = np.minimum(1.0, np.minimum(t, t[::-1]) / 0.01)
+
+    pieces = []
+    for index, word in enumerate(words):
+        freq = TONE_BASE_HZ + word * TONE_STEP_HZ
+        pieces.append(amplitude * envelope * np.sin(2 * np.pi * freq * t))
+        gap = pause_time if index in pause_after else gap_time
+        pieces.append(np.zeros(int(gap * sample_rate)))
+
+    audio = np.concatenate(pieces) if pieces else np.zeros(0)
+    return (audio * 32767).astype(np.int16).reshape(-1, 1)
+
+
+def decode_tone_words(samples, sample_rate=16000, min_word_time=0.15):
+    """
+    synthesize_tone_words()로 만든 오디오에서 단어 번호를 복원
+
+    Args:
+        samples: 1차원 int16 오디오 배열
+        sample_rate: 샘플링 레이트
+        min_word_time: 단어로 인정할 최소 버스트 길이 (초, 경계에서 잘린 조각은 무시)
+
+    Returns:
+        단어 번호 리스트
+    """
+    frame_size = int(0.01 * sample_rate)
+    num_frames = len(samples) // frame_size
+    if num_frames == 0:
+        return []
+
+    frames = samples[:num_frames * frame_size].astype(np.float32).reshape(num_frames, frame_size) / 32767
+    voiced = np.sqrt(np.mean(frames ** 2, axis=1)) > 0.02
+
+    words = []
+    start = None
+    for index, is_voiced in enumerate(np.append(voiced, False)):
+        if is_voiced and start is None:
+            start = index
+        elif not is_voiced and start is not None:
+            if (index - start) * 0.01 >= min_word_time:
+                burst = samples[start * frame_size:index * frame_size].astype(np.float32)
+                spectrum = np.abs(np.fft.rfft(burst))
+                peak_hz = np.argmax(spectrum) * sample_rate / len(burst)
+                words.append(int(round((peak_hz - TONE_BASE_HZ) / TONE_STEP_HZ)))
+            start = None
+
+    return words
+
+
+def _read_audio(data):
+    """업로드된 오디오 바이트에서 (1차원 샘플, 샘플링 레이트) 추출 (WAV 외 형식은 soundfile 사용)"""
+    if data[:4] != b"RIFF" and sf is not None:
+        samples, sample_rate = sf.read(io.BytesIO(data), dtype='int16', always_2d=True)
+        return samples[:, 0], sample_rate
+
+    with wave.open(io.BytesIO(data), 'rb') as wf:
+        sample_rate = wf.getframerate()
+        channels = wf.getnchannels()
+        samples = np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16)
+    if channels > 1:
+        samples = samples.reshape(-1, channels)[:, 0]
+    return samples, sample_rate
+
+
+class LocalTranscriptionServer:
+    """
+    OpenAI 음성 변환 API 형식을 흉내 내는 로컬 HTTP 서버 클래스입니다.
+
+    처리 지연 = base_latency + latency_per_second * 오디오 길이(초)
+    """
+
+    def __init__(self, base_latency=0.3, latency_per_second=0.15, host="127.0.0.1", port=0):
+        """
+        LocalTranscriptionServer 클래스 초기화
+
+        Args:
+            base_latency: 요청당 고정 지연 (초, 네트워크 왕복 및 모델 준비)
+            latency_per_second: 오디오 1초당 추가 지연 (초)
+            host: 바인딩 주소
+            port: 포트 번호 (0이면 빈 포트 자동 선택)
+        """
+        self.base_latency = base_latency
+        self.latency_per_second = latency_per_second
+        self.request_count = 0
+        self.received_bytes = 0
+        self._lock = threading.Lock()
+
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(length)
+                text, response_format = server._transcribe(self.headers.get("Content-Type", ""), body)
+
+                # response_format="text"이면 OpenAI API처럼 본문에 텍스트만 담아 응답
+                if response_format == "text":
+                    payload, content_type = text.encode("utf-8"), "text/plain; charset=utf-8"
+                else:
+                    payload = json.dumps({"text": text}, ensure_ascii=False).encode("utf-8")
+                    content_type = "application/json"
+                try:
+                    self.send_response(200)
+                    self.send_header("Content-Type", content_type)
+                    self.send_header("Content-Length", str(len(payload)))
+                    self.end_headers()
+                    self.wfile.write(payload)
+                except (BrokenPipeError, ConnectionResetError):
+                    # 마감 시간을 넘겨 클라이언트가 먼저 연결을 끊은 경우
+                    pass
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        """OpenAI 클라이언트에 전달할 base_url"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self):
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """서버 종료"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def _transcribe(self, content_type, body):
+        """multipart 요청에서 오디오를 꺼내 지연을 흉내 낸 뒤 (텍스트, 응답 형식) 반환"""
+        message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+            b"Content-Type: " + content_type.encode("latin-1") + b"\r\n\r\n" + body
+        )
+        audio = b""
+        response_format = "json"
+        for part in message.iter_parts():
+            name = part.get_param("name", header="content-disposition")
+            if name == "file":
+                audio = part.get_payload(decode=True)
+            elif name == "response_format":
+                response_format = part.get_payload(decode=True).decode("utf-8").strip()
+
+        with self._lock:
+            self.request_count += 1
+            self.received_bytes += len(audio)
+
+        try:
+            samples, sample_rate = _read_audio(audio)
+        except Exception:
+            return "", response_format
+
+        duration = len(samples) / sample_rate
+        time.sleep(self.base_latency + self.latency_per_second * duration)
+
+        text = " ".join(f"단어{word}" for word in decode_tone_words(samples, sample_rate))
+        return text, response_format
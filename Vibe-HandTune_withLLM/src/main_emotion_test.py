@@ -13,7 +13,7 @@ parent_dir = os.path.dirname(current_dir)
 if parent_dir not in sys.path:
     sys.path.append(parent_dir)
 
-from src.emotion_analyzer import EmotionAnalyzer
+from src.emotion_analyzer import analyze_emotion, get_emotion_name
 from src.preset_loader import PresetLoader
 
 def test_text_to_preset(text):
@@ -31,15 +31,14 @@ def test_text_to_preset(text):
         선택된 프리셋 정보
     """
     # 모듈 초기화
-    emotion_analyzer = EmotionAnalyzer()
     preset_loader = PresetLoader()
     
     # 단계 1: 감정 분석
     print(f"입력 텍스트: \"{text}\"")
     print("감정 분석 중...")
     start_time = time.time()
-    emotion_number = emotion_analyzer.analyze_emotion(text)
-    emotion_name = emotion_analyzer.get_emotion_name(emotion_number)
+    emotion_number = analyze_emotion(text)
+    emotion_name = get_emotion_name(emotion_number)
     analysis_time = time.time() - start_time
     
     print(f"감정 분석 결과: {emotion_number} ({emotion_name})")
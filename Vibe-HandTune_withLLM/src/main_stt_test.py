@@ -56,6 +56,7 @@ def test_audio_to_text(record_duration=5, prompt=""):
     print(f"{text}")
     print("-" * 50)
     print(f"처리 시간: {process_time:.2f}초")
+    print(f"STT 캐시: {stt_handler.get_cache_stats()}")
     print("=" * 50)
     
     return text
@@ -0,0 +1,82 @@
+"""
+긴 반주 트랙 MIDI 생성 속도 비교 스크립트입니다.
+같은 프리셋 패턴을 여러 번 반복한 트랙을 기존 방식(노트마다 mido.Message를 만들고 mido로 저장)과
+이벤트 배열 방식(build_note_events + events_to_smf_bytes)으로 만들어 시간을 비교하고,
+두 방식의 .mid 바이트가 같은지 확인합니다.
+"""
+
+import io
+import os
+import sys
+import time
+import argparse
+import mido
+
+# 프로젝트 루트 경로를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.midi_generator import build_note_events, events_to_smf_bytes, note_name_to_number, parse_rhythm
+
+
+def render_per_message(note_numbers, note_lengths, tempo, ticks_per_beat=480, velocity=64):
+    """기존 방식: 노트마다 메시지를 만들어 트랙을 구성하고 mido로 저장"""
+    track = [mido.MetaMessage('set_tempo', tempo=mido.bpm2tempo(tempo), time=0)]
+    current_tick = 0
+    last_tick = 0
+    for i, note in enumerate(note_numbers):
+        length_ticks = int(round(note_lengths[i % len(note_lengths)] * ticks_per_beat))
+        track.append(mido.Message('note_on', note=note, velocity=velocity, time=current_tick - last_tick))
+        track.append(mido.Message('note_off', note=note, velocity=velocity, time=length_ticks))
+        last_tick = current_tick + length_ticks
+        current_tick += length_ticks
+
+    mid = mido.MidiFile(ticks_per_beat=ticks_per_beat)
+    mid.tracks.append(mido.MidiTrack(track))
+    buffer = io.BytesIO()
+    mid.save(file=buffer)
+    return buffer.getvalue()
+
+
+def render_vectorized(note_numbers, note_lengths, tempo, repeats, ticks_per_beat=480, velocity=64):
+    """이벤트 배열 방식"""
+    events = build_note_events(note_numbers, note_lengths, repeats, ticks_per_beat, velocity=velocity)
+    return events_to_smf_bytes(events, tempo, ticks_per_beat)
+
+
+def best_time(func, runs):
+    """여러 번 실행한 가장 짧은 시간 (결과, 초)"""
+    best = float('inf')
+    for _ in range(runs):
+        start_time = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start_time)
+    return result, best
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='긴 반주 트랙 MIDI 생성 속도 비교')
+    parser.add_argument('--bars', type=int, nargs='+', default=[16, 256, 4096],
+                        help='패턴 반복 수 목록 (기본값: 16 256 4096)')
+    parser.add_argument('--runs', type=int, default=3,
+                        help='측정 반복 횟수 (기본값: 3)')
+    args = parser.parse_args()
+
+    rhythm = '8,16,16,8,8,4'
+    note_names = ['E2', 'B2', 'E3', 'G3', 'B2', 'E2']
+    note_numbers = [note_name_to_number(name) for name in note_names]
+    note_lengths = parse_rhythm(rhythm)
+    tempo = 120
+
+    print(f"{'반복':>6} {'노트':>8} {'메시지 방식':>12} {'배열 방식':>12} {'배속':>8}  바이트 일치")
+    for bars in args.bars:
+        per_message, old_time = best_time(
+            lambda: render_per_message(note_numbers * bars, note_lengths, tempo), args.runs)
+        vectorized, new_time = best_time(
+            lambda: render_vectorized(note_numbers, note_lengths, tempo, bars), args.runs)
+        print(f"{bars:>6} {len(note_numbers) * bars:>8} {old_time * 1000:>10.2f}ms {new_time * 1000:>10.2f}ms "
+              f"{old_time / new_time:>7.1f}x  {per_message == vectorized}")
+
+
+if __name__ == "__main__":
+    main()
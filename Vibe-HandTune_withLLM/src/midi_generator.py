@@ -1,10 +1,19 @@
 """
 MIDI 메시지 생성 모듈 - 프리셋 정보를 바탕으로 MIDI 시퀀스 생성
+노트 이벤트는 numpy 구조화 배열(틱, 상태 바이트, 노트, 세기)로 한 번에 계산하고,
+표준 MIDI 파일 바이트도 배열에서 바로 직렬화함
+렌더링된 패턴(메시지, 트랙, .mid 바이트)은 (프리셋, 템포, 조옮김) 기준으로 캐시하여
+같은 감정을 다시 고를 때 메시지를 새로 만들지 않음
 """
 
 import mido
+import math
 import time
-from typing import List, Dict, Union, Optional
+import struct
+import threading
+import numpy as np
+from collections import OrderedDict
+from typing import List, Dict, Union, Optional, NamedTuple, Tuple
 
 # 음표 이름을 MIDI 노트 번호로 변환하는 딕셔너리
 NOTE_TO_MIDI = {
@@ -49,100 +58,357 @@ def parse_rhythm(rhythm_pattern):
             
     return note_lengths
 
-def generate_midi_messages(preset, ticks_per_beat=480):
+def resolve_notes(note_names, rhythm_pattern):
     """
-    프리셋을 기반으로 MIDI 메시지 리스트 생성
+    음표 이름 목록과 리듬 패턴을 노트 번호와 노트 길이로 변환
+    
+    잘못된 음표는 시간을 차지하지 않고 건너뛰며, 나머지 음표의 길이는 원래 목록에서의 위치로 정함
+    (i번째 음표 = 리듬[i % 리듬 길이], 건너뛴 음표 때문에 뒤 음표의 리듬이 밀리지 않음)
+    건너뛴 음표가 있으면 남은 음표 순서대로 쓸 길이 목록을 반환하며, build_note_events가
+    이를 순환하여 적용해도 목록을 반복한 결과가 같도록 목록과 리듬이 함께 처음으로 돌아올 때까지의 분량을 만듦
+    
+    Args:
+        note_names: 음표 이름 목록
+        rhythm_pattern: 리듬 패턴 문자열 (예: "4,8,8,4")
+        
+    Returns:
+        (노트 번호 튜플, 노트 길이 튜플, 건너뛴 음표의 ValueError 리스트)
+    """
+    note_lengths = parse_rhythm(rhythm_pattern)
+    note_numbers, positions, errors = [], [], []
+    for position, note_name in enumerate(note_names):
+        try:
+            note_numbers.append(note_name_to_number(note_name))
+            positions.append(position)
+        except ValueError as e:
+            errors.append(e)
+    
+    if errors and note_numbers:
+        count, pattern_length = len(note_names), len(note_lengths)
+        laps = pattern_length // math.gcd(count, pattern_length)
+        note_lengths = [note_lengths[(lap * count + position) % pattern_length]
+                        for lap in range(laps) for position in positions]
+    return tuple(note_numbers), tuple(note_lengths), errors
+
+# 노트 이벤트 배열 형식 (type은 MIDI 상태 바이트: 0x90 = note_on, 0x80 = note_off)
+EVENT_DTYPE = np.dtype([('tick', np.int64), ('type', np.uint8), ('note', np.uint8), ('velocity', np.uint8)])
+NOTE_ON = 0x90
+NOTE_OFF = 0x80
+
+def build_note_events(note_numbers, note_lengths, repeats: int = 1, ticks_per_beat: int = 480,
+                      transpose: int = 0, velocity: int = 64, channel: int = 0) -> np.ndarray:
+    """
+    노트 번호와 리듬으로 노트 이벤트 배열 생성 (반복문 없이 벡터 연산)
+    
+    리듬은 노트 순서대로 순환하여 적용하고 (i번째 노트 = 리듬[i % 리듬 길이]),
+    노트 목록을 repeats번 이어 붙인 것과 같은 결과를 만듦
     
     Args:
-        preset: 프리셋 딕셔너리 (tempo, rhythm, notes)
+        note_numbers: MIDI 노트 번호 목록
+        note_lengths: 노트 길이 목록 (4분음표 = 1.0)
+        repeats: 노트 목록 반복 횟수
         ticks_per_beat: MIDI 타이밍 해상도
+        transpose: 조옮김 (반음 단위)
+        velocity: 노트 세기
+        channel: MIDI 채널 (0~15)
         
     Returns:
-        MIDI 메시지 객체 리스트
+        EVENT_DTYPE 배열 (note_on, note_off가 번갈아 나오며 tick은 시작 기준 절대 틱)
     """
-    messages = []
+    notes = np.tile(np.asarray(note_numbers, dtype=np.int64), repeats)
+    count = len(notes)
     
-    # 프리셋에서 필요한 정보 추출
-    tempo = float(preset.get('tempo', 120))
-    rhythm_pattern = str(preset.get('rhythm', '4,4,4,4'))
-    notes = preset.get('notes', ['C3', 'E3', 'G3', 'C4'])
+    # 리듬 틱 길이를 노트 수만큼 순환 반복하고 누적 합으로 시작/끝 틱 계산
+    rhythm_ticks = np.rint(np.asarray(note_lengths, dtype=np.float64) * ticks_per_beat).astype(np.int64)
+    length_ticks = np.resize(rhythm_ticks, count) if count else rhythm_ticks[:0]
+    end_ticks = np.cumsum(length_ticks)
     
-    # 리듬 패턴 파싱
-    note_lengths = parse_rhythm(rhythm_pattern)
+    events = np.empty(2 * count, dtype=EVENT_DTYPE)
+    events['tick'][0::2] = end_ticks - length_ticks
+    events['tick'][1::2] = end_ticks
+    events['type'][0::2] = NOTE_ON | channel
+    events['type'][1::2] = NOTE_OFF | channel
+    events['note'] = np.repeat(np.clip(notes + transpose, 0, 127), 2)
+    events['velocity'] = velocity
+    return events
+
+def events_to_smf_bytes(events: np.ndarray, tempo: float, ticks_per_beat: int = 480) -> bytes:
+    """
+    노트 이벤트 배열을 표준 MIDI 파일(.mid) 바이트로 직렬화
+    
+    mido로 같은 트랙(set_tempo + 노트 메시지)을 저장한 것과 같은 바이트를 만듦 (타입 1, 트랙 1개)
+    
+    Args:
+        events: EVENT_DTYPE 배열 (tick 오름차순)
+        tempo: 템포 (BPM)
+        ticks_per_beat: MIDI 타이밍 해상도
+        
+    Returns:
+        .mid 파일 내용
+    """
+    deltas = np.diff(events['tick'], prepend=np.int64(0))
+    if len(deltas) and (deltas.min() < 0 or deltas.max() >= 1 << 28):
+        raise ValueError("이벤트 틱은 오름차순이어야 하며 간격은 2^28 틱보다 작아야 합니다.")
     
-    # 박자 길이 계산 (초 단위)
-    beat_duration = 60.0 / tempo  # 4분음표 길이(초)
+    # 가변 길이 델타 타임(VLQ) 바이트 수: 7비트마다 1바이트
+    vlq_sizes = 1 + (deltas >= 1 << 7) + (deltas >= 1 << 14) + (deltas >= 1 << 21)
+    event_sizes = vlq_sizes + 3
+    offsets = np.cumsum(event_sizes) - event_sizes
     
-    # 노트와 리듬 패턴을 조합하여 메시지 생성
-    current_time = 0.0
-    pattern_length = len(note_lengths)
+    body = np.empty(int(event_sizes.sum()), dtype=np.uint8)
+    for k in range(4):
+        has_byte = vlq_sizes > k
+        shift = 7 * (vlq_sizes[has_byte] - 1 - k)
+        continuation = np.where(k < vlq_sizes[has_byte] - 1, 0x80, 0)
+        body[offsets[has_byte] + k] = ((deltas[has_byte] >> shift) & 0x7F) | continuation
+    status_offsets = offsets + vlq_sizes
+    body[status_offsets] = events['type']
+    body[status_offsets + 1] = events['note']
+    body[status_offsets + 2] = events['velocity']
     
-    for i, note_name in enumerate(notes):
-        # 현재 노트에 해당하는 리듬 패턴 인덱스
-        pattern_idx = i % pattern_length
-        note_length = note_lengths[pattern_idx]
+    track = b''.join((
+        b'\x00\xff\x51\x03' + mido.bpm2tempo(tempo).to_bytes(3, 'big'),  # set_tempo
+        body.tobytes(),
+        b'\x00\xff\x2f\x00',                                          # end_of_track
+    ))
+    header = b'MThd' + struct.pack('>LHHH', 6, 1, 1, ticks_per_beat)
+    return header + b'MTrk' + struct.pack('>L', len(track)) + track
+
+class RenderedPattern(NamedTuple):
+    """렌더링이 끝난 베이스 패턴 (여러 곳에서 공유하므로 메시지를 수정하지 말 것)"""
+    messages: Tuple[mido.Message, ...]   # 재생용 메시지 (time = 패턴 시작 기준 절대 시간, 초)
+    track: Tuple[mido.Message, ...]      # 파일용 메시지 (set_tempo 포함, time = 델타 틱)
+    midi_bytes: bytes                    # 표준 MIDI 파일(.mid) 내용
+    duration: float                      # 패턴 길이 (초)
+    length_ticks: int                    # 패턴 길이 (틱)
+
+
+class PatternCache:
+    """렌더링된 패턴의 LRU 캐시 (스레드 안전)"""
+    
+    def __init__(self, max_entries=32):
+        """
+        PatternCache 초기화
         
-        # 노트 길이를 초 단위로 변환
-        duration = note_length * beat_duration
+        Args:
+            max_entries: 보관할 최대 패턴 수
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+    
+    def get(self, key) -> Optional[RenderedPattern]:
+        """
+        캐시된 패턴 반환 (없으면 None)
         
-        try:
-            # 음표 이름을 MIDI 노트 번호로 변환
-            note_number = note_name_to_number(note_name)
-            
-            # note_on 메시지 생성
-            messages.append(mido.Message('note_on', note=note_number, velocity=64, time=current_time))
-            
-            # note_off 메시지 생성
-            messages.append(mido.Message('note_off', note=note_number, velocity=64, time=current_time + duration))
+        Args:
+            key: 캐시 키
             
-            # 다음 노트의 시작 시간 업데이트
-            current_time += duration
-            
-        except ValueError as e:
-            print(f"노트 처리 중 오류 발생: {e}")
-            continue
+        Returns:
+            RenderedPattern 또는 None
+        """
+        with self._lock:
+            pattern = self._entries.get(key)
+            if pattern is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return pattern
+    
+    def put(self, key, pattern: RenderedPattern) -> None:
+        """
+        패턴 저장 (max_entries를 넘으면 가장 오래 사용하지 않은 패턴 제거)
+        
+        Args:
+            key: 캐시 키
+            pattern: 렌더링된 패턴
+        """
+        with self._lock:
+            self._entries[key] = pattern
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def clear(self) -> None:
+        """저장된 패턴과 지표 초기화"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+    
+    def get_stats(self) -> Dict[str, Union[int, float]]:
+        """
+        캐시 지표 반환
+        
+        Returns:
+            패턴 수, 적중/실패/제거 횟수, 적중률
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+# 전역 패턴 캐시
+_pattern_cache = PatternCache()
+
+def _resolve_preset(preset):
+    """
+    프리셋에서 노트 번호, 리듬, 템포 추출
     
-    return messages
+    Args:
+        preset: 프리셋 딕셔너리 또는 PresetLoader의 CompiledPreset
+        
+    Returns:
+        (노트 번호 튜플, 리듬 튜플, 템포)
+    """
+    if hasattr(preset, 'note_numbers'):
+        # 이미 변환된 프리셋
+        return preset.note_numbers, preset.note_lengths, preset.tempo
+    
+    note_numbers, note_lengths, errors = resolve_notes(preset.get('notes', ['C3', 'E3', 'G3', 'C4']),
+                                                       str(preset.get('rhythm', '4,4,4,4')))
+    for e in errors:
+        print(f"노트 처리 중 오류 발생: {e}")
+    return note_numbers, note_lengths, float(preset.get('tempo', 120))
+
+def _pattern_key(preset, tempo, transpose, ticks_per_beat, velocity):
+    """프리셋과 변형 설정으로 캐시 키 생성"""
+    if hasattr(preset, 'note_numbers'):
+        source = (preset.note_numbers, preset.note_lengths, preset.tempo)
+    else:
+        source = (tuple(preset.get('notes', ('C3', 'E3', 'G3', 'C4'))),
+                  str(preset.get('rhythm', '4,4,4,4')), float(preset.get('tempo', 120)))
+    return (source, tempo, transpose, ticks_per_beat, velocity)
+
+def _render(preset, tempo, transpose, ticks_per_beat, velocity) -> RenderedPattern:
+    """프리셋을 재생용 메시지, 파일용 트랙, .mid 바이트로 렌더링"""
+    note_numbers, note_lengths, preset_tempo = _resolve_preset(preset)
+    tempo = float(tempo if tempo is not None else preset_tempo)
+    
+    events = build_note_events(note_numbers, note_lengths, ticks_per_beat=ticks_per_beat,
+                               transpose=transpose, velocity=velocity)
+    length_ticks = int(events['tick'][-1]) if len(events) else 0
+    seconds_per_tick = 60.0 / (tempo * ticks_per_beat)
+    
+    # 재생용 메시지 (절대 시간, 초)와 파일용 메시지 (델타 틱)
+    ticks = events['tick'].tolist()
+    deltas = np.diff(events['tick'], prepend=np.int64(0)).tolist()
+    notes = events['note'].tolist()
+    types = ['note_on' if status & 0xF0 == NOTE_ON else 'note_off' for status in events['type'].tolist()]
+    messages = [mido.Message(kind, note=note, velocity=velocity, time=tick * seconds_per_tick)
+                for kind, note, tick in zip(types, notes, ticks)]
+    track = [mido.MetaMessage('set_tempo', tempo=mido.bpm2tempo(tempo), time=0)]
+    track.extend(mido.Message(kind, note=note, velocity=velocity, time=delta)
+                 for kind, note, delta in zip(types, notes, deltas))
+    
+    return RenderedPattern(
+        messages=tuple(messages),
+        track=tuple(track),
+        midi_bytes=events_to_smf_bytes(events, tempo, ticks_per_beat),
+        duration=length_ticks * seconds_per_tick,
+        length_ticks=length_ticks
+    )
+
+def render_pattern(preset, tempo: Optional[float] = None, transpose: int = 0,
+                   ticks_per_beat: int = 480, velocity: int = 64) -> RenderedPattern:
+    """
+    프리셋을 렌더링한 패턴 반환 (같은 설정은 캐시에서 그대로 반환)
+    
+    Args:
+        preset: 프리셋 딕셔너리 (tempo, rhythm, notes) 또는 PresetLoader의 CompiledPreset
+        tempo: 프리셋 템포 대신 사용할 BPM (None이면 프리셋 템포)
+        transpose: 조옮김 (반음 단위)
+        ticks_per_beat: MIDI 타이밍 해상도
+        velocity: 노트 세기
+        
+    Returns:
+        RenderedPattern (공유 객체이므로 메시지를 수정하지 말 것)
+    """
+    key = _pattern_key(preset, tempo, transpose, ticks_per_beat, velocity)
+    pattern = _pattern_cache.get(key)
+    if pattern is None:
+        pattern = _render(preset, tempo, transpose, ticks_per_beat, velocity)
+        _pattern_cache.put(key, pattern)
+    return pattern
+
+def get_pattern_cache_stats() -> Dict[str, Union[int, float]]:
+    """
+    패턴 캐시 지표 반환
+    
+    Returns:
+        패턴 수, 적중/실패/제거 횟수, 적중률
+    """
+    return _pattern_cache.get_stats()
 
-def create_midi_file(preset, filename="output.mid", ticks_per_beat=480):
+def generate_midi_messages(preset, ticks_per_beat=480, tempo=None, transpose=0):
+    """
+    프리셋을 기반으로 MIDI 메시지 리스트 생성
+    
+    Args:
+        preset: 프리셋 딕셔너리 (tempo, rhythm, notes) 또는 CompiledPreset
+        ticks_per_beat: MIDI 타이밍 해상도
+        tempo: 프리셋 템포 대신 사용할 BPM (None이면 프리셋 템포)
+        transpose: 조옮김 (반음 단위)
+        
+    Returns:
+        MIDI 메시지 객체 리스트 (time = 시작 기준 절대 시간(초), 캐시된 메시지를 공유함)
+    """
+    return list(render_pattern(preset, tempo, transpose, ticks_per_beat).messages)
+
+def create_midi_file(preset, filename="output.mid", ticks_per_beat=480, tempo=None, transpose=0):
     """
     프리셋을 기반으로 MIDI 파일 생성
     
     Args:
-        preset: 프리셋 딕셔너리
+        preset: 프리셋 딕셔너리 또는 CompiledPreset
         filename: 출력 파일 이름
         ticks_per_beat: MIDI 타이밍 해상도
+        tempo: 프리셋 템포 대신 사용할 BPM (None이면 프리셋 템포)
+        transpose: 조옮김 (반음 단위)
         
     Returns:
         생성된 MIDI 파일 경로
     """
-    # 새 MIDI 파일 생성
-    mid = mido.MidiFile(ticks_per_beat=ticks_per_beat)
-    track = mido.MidiTrack()
-    mid.tracks.append(track)
-    
-    # 템포 설정
-    tempo = int(preset.get('tempo', 120))
-    tempo_msg = mido.MetaMessage('set_tempo', tempo=mido.bpm2tempo(tempo))
-    track.append(tempo_msg)
+    # 렌더링된 .mid 바이트를 그대로 저장
+    with open(filename, 'wb') as f:
+        f.write(render_pattern(preset, tempo, transpose, ticks_per_beat).midi_bytes)
+    return filename
+
+def export_backing_track(preset, filename: str, repeats: int = 1, tempo: Optional[float] = None,
+                         transpose: int = 0, ticks_per_beat: int = 480, velocity: int = 64) -> str:
+    """
+    프리셋 패턴을 여러 번 반복한 긴 반주 트랙을 MIDI 파일로 저장
     
-    # MIDI 메시지 생성 및 추가
-    messages = generate_midi_messages(preset, ticks_per_beat)
+    메시지 객체를 만들지 않고 이벤트 배열에서 바로 직렬화하며, 캐시에도 넣지 않음
     
-    # 시간 기반 메시지를 틱 기반으로 변환하여 트랙에 추가
-    last_time = 0
-    for msg in messages:
-        # 델타 타임 계산 (틱 단위)
-        delta_ticks = int((msg.time - last_time) * ticks_per_beat)
-        
-        # 메시지 생성 (delta time 포함)
-        new_msg = mido.Message(msg.type, note=msg.note, velocity=msg.velocity, time=delta_ticks)
-        track.append(new_msg)
+    Args:
+        preset: 프리셋 딕셔너리 또는 CompiledPreset
+        filename: 출력 파일 이름
+        repeats: 패턴(노트 목록) 반복 횟수
+        tempo: 프리셋 템포 대신 사용할 BPM (None이면 프리셋 템포)
+        transpose: 조옮김 (반음 단위)
+        ticks_per_beat: MIDI 타이밍 해상도
+        velocity: 노트 세기
         
-        last_time = msg.time
-    
-    # 파일 저장
-    mid.save(filename)
+    Returns:
+        생성된 MIDI 파일 경로
+    """
+    note_numbers, note_lengths, preset_tempo = _resolve_preset(preset)
+    tempo = float(tempo if tempo is not None else preset_tempo)
+    events = build_note_events(note_numbers, note_lengths, repeats, ticks_per_beat, transpose, velocity)
+    with open(filename, 'wb') as f:
+        f.write(events_to_smf_bytes(events, tempo, ticks_per_beat))
     return filename
 
 def test_midi_generation():
@@ -1,10 +1,11 @@
 """
 MIDI 출력 모듈: MIDI 포트 관리 및 메시지 전송
+메시지 시퀀스는 MidiScheduler 스레드가 절대 시각 기준으로 전송함
 """
 
 import mido
-import time
 from typing import List, Optional
+from src.midi_scheduler import MidiScheduler
 
 class MidiOutput:
     """MIDI 출력 관리 클래스"""
@@ -12,6 +13,7 @@ class MidiOutput:
     def __init__(self):
         """MIDI 출력 초기화"""
         self.port = None
+        self.scheduler = None
         
     def list_output_ports(self) -> List[str]:
         """
@@ -92,34 +94,78 @@ class MidiOutput:
             print(f"MIDI 메시지 전송 실패: {e}")
             return False
     
+    def _get_scheduler(self) -> MidiScheduler:
+        """스케줄러 반환 (처음 사용할 때 생성)"""
+        if self.scheduler is None:
+            self.scheduler = MidiScheduler(self._send_to_port)
+        return self.scheduler
+    
+    def _send_to_port(self, message: mido.Message) -> None:
+        """현재 열린 포트로 전송 (스케줄러 스레드에서 호출)"""
+        if self.port:
+            self.port.send(message)
+    
     def send_messages(self, messages: List[mido.Message]) -> bool:
         """
-        MIDI 메시지 리스트를 적절한 타이밍으로 전송
+        MIDI 메시지 리스트를 적절한 타이밍으로 전송 (재생이 끝날 때까지 대기)
         
         Args:
-            messages: 전송할 MIDI 메시지 리스트
+            messages: 전송할 MIDI 메시지 리스트 (time = 시작 기준 절대 시간, 초)
             
         Returns:
-            성공 여부 (True/False)
+            성공 여부 (True/False, 전송에 실패한 메시지가 하나라도 있으면 False)
         """
         if not self.port:
             print("MIDI 출력 포트가 열려있지 않습니다.")
             return False
             
         try:
-            for msg in messages:
-                if msg.time > 0:
-                    # 메시지 간 딜레이 적용
-                    time.sleep(msg.time)
-                # 메시지 전송
-                self.port.send(msg)
+            scheduler = self._get_scheduler()
+            scheduler.play(messages)
+            scheduler.wait()
+            errors = scheduler.playback_errors
+            if errors:
+                print(f"MIDI 메시지 시퀀스 전송 실패: {errors}개 메시지 ({scheduler.last_error})")
+                return False
             return True
         except Exception as e:
             print(f"MIDI 메시지 시퀀스 전송 실패: {e}")
             return False
     
+    def play_pattern(self, messages, loop: bool = False, queue: bool = False) -> bool:
+        """
+        MIDI 패턴을 백그라운드에서 재생 (바로 반환)
+        
+        Args:
+            messages: 메시지 리스트 (time = 시작 기준 절대 시간, 초) 또는 RenderedPattern
+            loop: 반복 재생 여부
+            queue: True면 현재 패턴(반복 중이면 이번 반복)이 끝난 뒤 이어서 재생
+            
+        Returns:
+            성공 여부 (True/False)
+        """
+        if not self.port:
+            print("MIDI 출력 포트가 열려있지 않습니다.")
+            return False
+        
+        try:
+            if queue:
+                self._get_scheduler().queue(messages, loop=loop)
+            else:
+                self._get_scheduler().play(messages, loop=loop)
+            return True
+        except Exception as e:
+            print(f"MIDI 패턴 재생 실패: {e}")
+            return False
+    
+    def stop_playback(self) -> None:
+        """백그라운드 재생을 멈추고 켜져 있는 노트를 끔"""
+        if self.scheduler is not None:
+            self.scheduler.stop()
+    
     def close_port(self) -> None:
         """현재 열린 MIDI 포트 닫기"""
+        self.stop_playback()
         if self.port:
             self.port.close()
             self.port = None 
\ No newline at end of file
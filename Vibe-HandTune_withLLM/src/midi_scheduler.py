@@ -0,0 +1,273 @@
+"""
+MIDI 스케줄러 모듈: 전용 스레드에서 절대 시각 기준으로 MIDI 메시지 전송
+단조 시계로 패턴 시작 시각 + 메시지 시각을 마감 시각으로 삼아 누적 오차가 없고,
+마지막 1ms는 sleep 대신 바쁜 대기(spin)로 맞춰 지연 편차(jitter)를 줄임
+재생 취소, 반복 재생, 다음 패턴 예약을 지원함
+"""
+
+import time
+import threading
+from collections import deque
+from typing import Callable, Dict, Optional, Sequence, Union
+
+import numpy as np
+import mido
+
+# 지연(lateness) 히스토그램 구간 경계 (마이크로초)
+JITTER_BIN_EDGES_US = (0, 50, 100, 250, 500, 1000, 2000, 5000, 10000)
+
+
+class _Pattern:
+    """재생할 패턴 (메시지와 반복 길이)"""
+    __slots__ = ("messages", "duration", "loop")
+
+    def __init__(self, messages, duration, loop):
+        self.messages = messages
+        self.duration = duration
+        self.loop = loop
+
+
+class MidiScheduler:
+    """전용 스레드에서 MIDI 패턴을 재생하는 스케줄러"""
+
+    def __init__(self, send: Callable[[mido.Message], None], spin_threshold: float = 0.001,
+                 history_size: int = 10000):
+        """
+        MidiScheduler 초기화 (스케줄러 스레드 시작)
+
+        Args:
+            send: 메시지 하나를 포트로 보내는 함수 (예: port.send)
+            spin_threshold: 마감 직전 바쁜 대기로 전환할 남은 시간 (초)
+            history_size: 지연 백분위 계산에 보관할 최근 전송 수
+        """
+        self.send = send
+        self.spin_threshold = spin_threshold
+
+        self._cond = threading.Condition()
+        self._current = None        # 재생 중인 _Pattern
+        self._start_time = 0.0      # 현재 반복의 시작 시각 (perf_counter)
+        self._index = 0             # 다음에 보낼 메시지 위치
+        self._queue = deque()       # 예약된 _Pattern
+        self._active_notes = set()  # 켜져 있는 (채널, 노트)
+        self._running = True
+
+        # 전송 실패 (스케줄러 스레드에서 일어나므로 호출한 쪽에서 확인할 수 있도록 기록)
+        self.send_errors = 0        # 전체 전송 실패 수
+        self.last_error = None      # 마지막 전송 실패 예외
+        self._play_errors_base = 0  # 마지막 play() 시점의 send_errors
+
+        # 지연 통계
+        self._stats_lock = threading.Lock()
+        self._histogram = np.zeros(len(JITTER_BIN_EDGES_US), dtype=np.int64)
+        self._history = deque(maxlen=history_size)
+        self.sent_count = 0
+
+        self._thread = threading.Thread(target=self._run, name="midi-scheduler", daemon=True)
+        self._thread.start()
+
+    @staticmethod
+    def _make_pattern(messages, loop: bool, duration: Optional[float]) -> _Pattern:
+        """메시지 목록 또는 RenderedPattern을 _Pattern으로 변환"""
+        if hasattr(messages, "messages"):
+            # midi_generator.RenderedPattern
+            if duration is None:
+                duration = messages.duration
+            messages = messages.messages
+
+        messages = tuple(messages)
+        if duration is None:
+            duration = max((msg.time for msg in messages), default=0.0)
+        if loop and duration <= 0:
+            raise ValueError("반복 재생하려면 패턴 길이가 0보다 커야 합니다.")
+        return _Pattern(messages, float(duration), loop)
+
+    def play(self, messages: Union[Sequence[mido.Message], object], loop: bool = False,
+             duration: Optional[float] = None, delay: float = 0.0) -> None:
+        """
+        패턴을 바로 재생 (재생 중인 패턴과 예약된 패턴은 취소)
+
+        Args:
+            messages: 메시지 목록 (time = 패턴 시작 기준 절대 시간, 초) 또는 RenderedPattern
+            loop: 반복 재생 여부
+            duration: 패턴 길이 (초, None이면 RenderedPattern 길이 또는 마지막 메시지 시각)
+            delay: 재생 시작까지 기다릴 시간 (초)
+        """
+        pattern = self._make_pattern(messages, loop, duration)
+        with self._cond:
+            self._release_notes()
+            self._queue.clear()
+            self._current = pattern
+            self._start_time = time.perf_counter() + delay
+            self._index = 0
+            self._play_errors_base = self.send_errors
+            self._cond.notify()
+
+    def queue(self, messages: Union[Sequence[mido.Message], object], loop: bool = False,
+              duration: Optional[float] = None) -> None:
+        """
+        현재 패턴이 끝나는 시점(반복 중이면 이번 반복이 끝나는 시점)에 이어서 재생하도록 예약
+
+        Args:
+            messages: 메시지 목록 또는 RenderedPattern
+            loop: 반복 재생 여부
+            duration: 패턴 길이 (초)
+        """
+        pattern = self._make_pattern(messages, loop, duration)
+        with self._cond:
+            if self._current is None:
+                self._current = pattern
+                self._start_time = time.perf_counter()
+                self._index = 0
+            else:
+                self._queue.append(pattern)
+            self._cond.notify()
+
+    def stop(self) -> None:
+        """재생과 예약을 모두 취소하고 켜져 있는 노트를 끔"""
+        with self._cond:
+            self._queue.clear()
+            self._current = None
+            self._release_notes()
+            self._cond.notify_all()
+
+    @property
+    def is_playing(self) -> bool:
+        """재생 중이거나 예약된 패턴이 있는지 여부"""
+        with self._cond:
+            return self._current is not None
+
+    @property
+    def playback_errors(self) -> int:
+        """마지막 play() 이후 전송에 실패한 메시지 수 (이어서 예약한 패턴 포함)"""
+        with self._cond:
+            return self.send_errors - self._play_errors_base
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        반복하지 않는 패턴의 재생이 모두 끝날 때까지 대기
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            재생이 끝났으면 True, 시간 초과면 False
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: self._current is None, timeout)
+
+    def close(self) -> None:
+        """재생을 멈추고 스케줄러 스레드 종료"""
+        self.stop()
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        self._thread.join(timeout=1.0)
+
+    def _release_notes(self) -> None:
+        """켜져 있는 노트에 note_off 전송 (잠금을 잡은 상태에서 호출)"""
+        for channel, note in self._active_notes:
+            try:
+                self.send(mido.Message('note_off', channel=channel, note=note, velocity=0))
+            except Exception as e:
+                self._record_error(e)
+                print(f"MIDI 노트 끄기 실패: {e}")
+        self._active_notes.clear()
+
+    def _advance_pattern(self) -> None:
+        """현재 패턴의 메시지를 모두 보냈을 때 다음 패턴 또는 다음 반복으로 이동 (잠금 안에서 호출)"""
+        next_start = self._start_time + self._current.duration
+        if self._queue:
+            self._current = self._queue.popleft()
+        elif not self._current.loop:
+            self._current = None
+            self._cond.notify_all()
+            return
+        self._start_time = next_start
+        self._index = 0
+
+    def _run(self) -> None:
+        """스케줄러 스레드 본체"""
+        with self._cond:
+            while self._running:
+                pattern = self._current
+                if pattern is None:
+                    self._cond.wait()
+                    continue
+
+                if self._index >= len(pattern.messages):
+                    self._advance_pattern()
+                    continue
+
+                message = pattern.messages[self._index]
+                deadline = self._start_time + message.time
+                remaining = deadline - time.perf_counter()
+
+                # 마감까지 충분히 남았으면 잠들되, play/stop이 오면 바로 깨어남
+                if remaining > self.spin_threshold:
+                    self._cond.wait(remaining - self.spin_threshold)
+                    continue
+
+                # 취소 여부를 다시 확인한 뒤 마지막 구간은 바쁜 대기
+                self._cond.release()
+                try:
+                    while time.perf_counter() < deadline:
+                        pass
+                finally:
+                    self._cond.acquire()
+                if self._current is not pattern:
+                    continue
+
+                try:
+                    self.send(message)
+                except Exception as e:
+                    self._record_error(e)
+                    print(f"MIDI 메시지 전송 실패: {e}")
+                lateness = time.perf_counter() - deadline
+
+                if message.type == 'note_on' and message.velocity > 0:
+                    self._active_notes.add((message.channel, message.note))
+                elif message.type in ('note_off', 'note_on'):
+                    self._active_notes.discard((message.channel, message.note))
+                self._index += 1
+                self._record(lateness)
+
+    def _record_error(self, error: Exception) -> None:
+        """전송 실패 기록 (잠금을 잡은 상태에서 호출)"""
+        self.send_errors += 1
+        self.last_error = error
+
+    def _record(self, lateness: float) -> None:
+        """전송 지연 기록"""
+        lateness_us = lateness * 1e6
+        bin_index = int(np.searchsorted(JITTER_BIN_EDGES_US, lateness_us, side='right')) - 1
+        with self._stats_lock:
+            self._histogram[max(bin_index, 0)] += 1
+            self._history.append(lateness_us)
+            self.sent_count += 1
+
+    def get_jitter_stats(self) -> Dict[str, object]:
+        """
+        전송 지연 통계 반환 (마감 시각 대비 실제 전송 시각)
+
+        Returns:
+            전송 수, 지연 백분위(p50/p95/p99/max, µs), 히스토그램 {구간: 횟수}
+        """
+        with self._stats_lock:
+            history = np.array(self._history)
+            histogram = self._histogram.copy()
+            sent = self.sent_count
+
+        labels = [f"{low}-{high}us" for low, high in zip(JITTER_BIN_EDGES_US, JITTER_BIN_EDGES_US[1:])]
+        labels.append(f">={JITTER_BIN_EDGES_US[-1]}us")
+        stats = {"sent": sent, "histogram": dict(zip(labels, histogram.tolist()))}
+        for name, q in (("p50_us", 50), ("p95_us", 95), ("p99_us", 99)):
+            stats[name] = float(np.percentile(history, q)) if len(history) else 0.0
+        stats["max_us"] = float(history.max()) if len(history) else 0.0
+        return stats
+
+    def reset_stats(self) -> None:
+        """지연 통계 초기화"""
+        with self._stats_lock:
+            self._histogram[:] = 0
+            self._history.clear()
+            self.sent_count = 0
@@ -0,0 +1,155 @@
+"""
+MIDI 전송 타이밍 비교 스크립트입니다.
+같은 베이스 패턴을 기존 방식(메시지마다 time.sleep)과 MidiScheduler로 재생하여
+메시지별 목표 시각 대비 실제 도착 시각의 지연 분포를 비교합니다.
+가상 MIDI 포트를 만들 수 있으면 그 포트를 통해, 아니면 루프백 대역 포트로 측정합니다.
+"""
+
+import os
+import sys
+import time
+import argparse
+import threading
+import numpy as np
+import mido
+
+# 프로젝트 루트 경로를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.midi_generator import render_pattern
+from src.midi_scheduler import MidiScheduler, JITTER_BIN_EDGES_US
+
+
+class LoopbackPort:
+    """보낸 메시지의 도착 시각만 기록하는 대역 출력 포트"""
+
+    def __init__(self):
+        self.arrivals = []
+
+    def send(self, message):
+        self.arrivals.append(time.perf_counter())
+
+    def close(self):
+        pass
+
+
+class VirtualPortPair:
+    """가상 출력 포트와 그 포트를 듣는 입력 포트 (도착 시각은 입력 콜백에서 기록)"""
+
+    def __init__(self, name="HandTune Jitter Test"):
+        self.arrivals = []
+        self._output = mido.open_output(name, virtual=True)
+        self._input = mido.open_input(name, callback=lambda msg: self.arrivals.append(time.perf_counter()))
+
+    def send(self, message):
+        self._output.send(message)
+
+    def close(self):
+        self._input.close()
+        self._output.close()
+
+
+def open_port(use_virtual):
+    """측정용 포트 열기 (가상 포트를 만들 수 없으면 루프백 대역 포트)"""
+    if use_virtual:
+        try:
+            return VirtualPortPair(), "가상 MIDI 포트"
+        except Exception as e:
+            print(f"가상 MIDI 포트를 열 수 없어 루프백 대역 포트를 사용합니다: {e}")
+    return LoopbackPort(), "루프백 대역 포트"
+
+
+def play_with_sleep(port, messages):
+    """기존 방식: 직전 메시지와의 시간 차이만큼 time.sleep 후 전송 (시작 시각 반환)"""
+    start_time = time.perf_counter()
+    last_time = 0.0
+    for msg in messages:
+        if msg.time > last_time:
+            time.sleep(msg.time - last_time)
+        last_time = msg.time
+        port.send(msg)
+    return start_time
+
+
+def play_with_scheduler(port, messages):
+    """MidiScheduler로 재생 (시작 시각 반환)"""
+    scheduler = MidiScheduler(port.send)
+    start_time = time.perf_counter() + 0.01
+    scheduler.play(messages, delay=start_time - time.perf_counter())
+    scheduler.wait()
+    scheduler.close()
+    return start_time
+
+
+def measure(name, play, messages, use_virtual, load_threads):
+    """재생 방식 하나의 지연 분포 측정 (µs)"""
+    port, port_name = open_port(use_virtual)
+
+    # 다른 스레드가 CPU를 쓰는 상황을 흉내 (GUI, 카메라 처리 등)
+    stop_event = threading.Event()
+
+    def busy():
+        while not stop_event.is_set():
+            sum(i * i for i in range(2000))
+
+    workers = [threading.Thread(target=busy, daemon=True) for _ in range(load_threads)]
+    for worker in workers:
+        worker.start()
+    try:
+        start_time = play(port, messages)
+        time.sleep(0.05)
+    finally:
+        stop_event.set()
+        for worker in workers:
+            worker.join()
+        port.close()
+
+    targets = start_time + np.array([msg.time for msg in messages])
+    arrivals = np.array(port.arrivals[:len(messages)])
+    lateness_us = (arrivals - targets[:len(arrivals)]) * 1e6
+    return name, port_name, lateness_us
+
+
+def print_histogram(lateness_us):
+    """지연 히스토그램 출력"""
+    edges = list(JITTER_BIN_EDGES_US) + [np.inf]
+    counts, _ = np.histogram(np.maximum(lateness_us, 0), bins=edges)
+    for low, high, count in zip(edges, edges[1:], counts):
+        label = f"{low:>6}-{high:<6}" if np.isfinite(high) else f"{low:>6}+      "
+        print(f"    {label}us {count:>5} {'#' * int(40 * count / max(1, counts.max()))}")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='MIDI 전송 타이밍 비교')
+    parser.add_argument('--bars', type=int, default=16,
+                        help='재생할 패턴 반복 수 (기본값: 16)')
+    parser.add_argument('--tempo', type=float, default=140,
+                        help='템포 (BPM, 기본값: 140)')
+    parser.add_argument('--load-threads', type=int, default=1,
+                        help='동시에 CPU를 쓰는 스레드 수 (기본값: 1)')
+    parser.add_argument('--virtual', action='store_true',
+                        help='가상 MIDI 포트로 측정 (python-rtmidi 필요)')
+    parser.add_argument('--switch-interval', type=float, default=None,
+                        help='Python 스레드 전환 간격 (초, 기본값: 인터프리터 기본 0.005). '
+                             '다른 스레드가 CPU를 쓸 때 스케줄러가 깨어나는 지연의 상한')
+    args = parser.parse_args()
+
+    if args.switch_interval is not None:
+        sys.setswitchinterval(args.switch_interval)
+
+    preset = {'tempo': args.tempo, 'rhythm': '8,16,16,8,8', 'notes': ['E2', 'B2', 'E3', 'G3', 'B2'] * args.bars}
+    messages = render_pattern(preset).messages
+    print(f"메시지 {len(messages)}개, 길이 {messages[-1].time:.1f}초, 부하 스레드 {args.load_threads}개")
+
+    for name, play in (("time.sleep", play_with_sleep), ("MidiScheduler", play_with_scheduler)):
+        name, port_name, lateness_us = measure(name, play, messages, args.virtual, args.load_threads)
+        print(f"\n[{name}] ({port_name})")
+        print(f"  p50 {np.percentile(lateness_us, 50):.0f}us, p95 {np.percentile(lateness_us, 95):.0f}us, "
+              f"p99 {np.percentile(lateness_us, 99):.0f}us, 최대 {lateness_us.max():.0f}us, "
+              f"마지막 메시지 {lateness_us[-1]:.0f}us")
+        print_histogram(lateness_us)
+
+
+if __name__ == "__main__":
+    main()
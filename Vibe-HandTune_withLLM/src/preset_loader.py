@@ -5,13 +5,120 @@ config/bass_presets.json 파일에서 감정별 베이스 멜로디 프리셋을
 
 import os
 import json
+import time
+import threading
+from types import MappingProxyType
+from typing import NamedTuple
+import numpy as np
+import mido
+from src.midi_generator import resolve_notes
+
+
+class CompiledPreset(NamedTuple):
+    """
+    재생에 바로 쓸 수 있도록 미리 변환해 둔 프리셋입니다. (읽기 전용)
+    """
+    emotion: str                # 감정 번호 ("1"~"5")
+    name: str                   # 감정 이름
+    info: MappingProxyType      # 원본 프리셋 정보 {"name", "preset"}
+    note_numbers: tuple         # MIDI 노트 번호
+    note_lengths: tuple         # 리듬 패턴 (4분음표 = 1.0, 건너뛴 음표가 있으면 midi_generator.resolve_notes 참고)
+    rhythm_ticks: np.ndarray    # note_lengths의 틱 단위 값 (읽기 전용)
+    tempo: float                # BPM
+    us_per_beat: int            # 4분음표 길이 (마이크로초, MIDI set_tempo 값)
+    ticks_per_beat: int         # 틱 해상도
+
+
+class _PresetIndex(NamedTuple):
+    """한 번에 교체되는 프리셋 인덱스"""
+    raw: dict                   # JSON 원본
+    emotions: MappingProxyType  # 감정 번호 -> 원본 프리셋 정보
+    compiled: MappingProxyType  # 감정 번호 -> CompiledPreset
+    mtime_ns: int               # 로드한 파일의 수정 시각
+    size: int                   # 로드한 파일의 크기
+
+
+def _freeze(value):
+    """JSON 값을 읽기 전용 구조로 변환 (dict -> MappingProxyType, list -> tuple)"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value):
+    """_freeze로 만든 읽기 전용 구조를 JSON 모양의 새 dict/list로 복사"""
+    if isinstance(value, MappingProxyType):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+def compile_preset(emotion_key, info, ticks_per_beat=480):
+    """
+    프리셋 하나를 CompiledPreset으로 변환합니다.
+
+    Parameters:
+    -----------
+    emotion_key : str
+        감정 번호
+    info : dict
+        {"name": 감정 이름, "preset": 프리셋 딕셔너리}
+    ticks_per_beat : int
+        틱 해상도
+
+    Returns:
+    --------
+    CompiledPreset
+        변환된 프리셋
+
+    Raises:
+    -------
+    ValueError
+        프리셋 구조가 유효하지 않은 경우
+    """
+    if not isinstance(info, dict) or not isinstance(info.get("preset"), dict):
+        raise ValueError(f"감정 {emotion_key}의 프리셋 구조가 유효하지 않습니다.")
+
+    preset = info["preset"]
+    tempo = float(preset.get("tempo", 120))
+    if tempo <= 0:
+        raise ValueError(f"감정 {emotion_key}의 템포가 유효하지 않습니다: {tempo}")
+
+    # 잘못된 음표는 MIDI 생성과 같이 건너뜀 (나머지 음표의 리듬은 원래 위치 기준)
+    note_numbers, note_lengths, errors = resolve_notes(preset.get("notes", ["C3", "E3", "G3", "C4"]),
+                                                       str(preset.get("rhythm", "4,4,4,4")))
+    for e in errors:
+        print(f"감정 {emotion_key} 프리셋의 음표를 건너뜁니다: {e}")
+
+    rhythm_ticks = np.round(np.array(note_lengths) * ticks_per_beat).astype(np.int32)
+    rhythm_ticks.setflags(write=False)
+
+    return CompiledPreset(
+        emotion=emotion_key,
+        name=info.get("name", emotion_key),
+        info=_freeze(info),
+        note_numbers=note_numbers,
+        note_lengths=note_lengths,
+        rhythm_ticks=rhythm_ticks,
+        tempo=tempo,
+        us_per_beat=mido.bpm2tempo(tempo),
+        ticks_per_beat=ticks_per_beat
+    )
+
 
 class PresetLoader:
     """
     베이스 멜로디 프리셋 로더 클래스입니다.
+
+    프리셋 파일은 로드할 때 한 번만 검사하고 변환하여 읽기 전용 인덱스로 만들며,
+    조회는 딕셔너리 검색만 합니다. 파일 수정 시각이 바뀌면 새 인덱스를 만들어
+    통째로 교체하므로 프로그램을 다시 시작하지 않아도 프리셋 수정이 반영됩니다.
     """
     
-    def __init__(self, preset_file_path=None):
+    def __init__(self, preset_file_path=None, reload_interval=1.0, ticks_per_beat=480):
         """
         PresetLoader 클래스 초기화
         
@@ -19,6 +126,10 @@ class PresetLoader:
         -----------
         preset_file_path : str or None
             프리셋 JSON 파일 경로. None이면 기본 경로 사용
+        reload_interval : float or None
+            파일 변경을 확인하는 최소 간격 (초, None이면 자동으로 다시 로드하지 않음)
+        ticks_per_beat : int
+            리듬을 틱으로 변환할 때의 해상도
         """
         if preset_file_path is None:
             # 현재 모듈 경로 기준으로 config/bass_presets.json 경로 설정
@@ -28,43 +139,129 @@ class PresetLoader:
         else:
             self.preset_file_path = preset_file_path
         
-        # 프리셋 데이터 저장 변수
-        self.presets = None
+        self.reload_interval = reload_interval
+        self.ticks_per_beat = ticks_per_beat
+        
+        # 프리셋 인덱스 (로드할 때마다 통째로 교체)
+        self._index = None
+        self._load_lock = threading.Lock()
+        self._next_check = time.monotonic() + (reload_interval or 0)
+        self._failed_version = None  # 로드에 실패한 파일의 (수정 시각, 크기)
         
         # 파일 로드
         self.load_presets()
     
+    @property
+    def presets(self):
+        """JSON 원본 프리셋 데이터 (로드되지 않았으면 None)"""
+        index = self._index
+        return index.raw if index is not None else None
+    
     def load_presets(self):
         """
-        프리셋 JSON 파일을 로드합니다.
+        프리셋 JSON 파일을 로드하고 인덱스를 교체합니다.
+        새 파일이 유효하지 않으면 기존 인덱스를 그대로 유지합니다.
         
         Returns:
         --------
         bool
             로드 성공 여부
         """
-        try:
-            if not os.path.exists(self.preset_file_path):
-                print(f"프리셋 파일이 존재하지 않습니다: {self.preset_file_path}")
+        with self._load_lock:
+            try:
+                if not os.path.exists(self.preset_file_path):
+                    print(f"프리셋 파일이 존재하지 않습니다: {self.preset_file_path}")
+                    return False
+                
+                stat = os.stat(self.preset_file_path)
+                with open(self.preset_file_path, 'r', encoding='utf-8') as f:
+                    raw = json.load(f)
+                
+                # 기본 구조 확인
+                if not isinstance(raw, dict) or not isinstance(raw.get("emotions"), dict):
+                    print("프리셋 파일 구조가 유효하지 않습니다.")
+                    return False
+                
+                compiled = {}
+                for emotion_key, info in raw["emotions"].items():
+                    try:
+                        compiled[str(emotion_key)] = compile_preset(
+                            str(emotion_key), info, self.ticks_per_beat
+                        )
+                    except (ValueError, TypeError) as e:
+                        print(f"프리셋을 건너뜁니다: {str(e)}")
+                
+                if not compiled:
+                    print("유효한 프리셋이 없습니다.")
+                    return False
+                
+                # 인덱스 교체 (속성 하나만 바꾸므로 조회 중인 스레드는 이전 인덱스나 새 인덱스 중 하나를 봄)
+                self._index = _PresetIndex(
+                    raw=raw,
+                    emotions=MappingProxyType({k: v.info for k, v in compiled.items()}),
+                    compiled=MappingProxyType(compiled),
+                    mtime_ns=stat.st_mtime_ns,
+                    size=stat.st_size
+                )
+                
+                print(f"프리셋을 성공적으로 로드했습니다: {len(compiled)} 감정")
+                return True
+                
+            except json.JSONDecodeError as e:
+                print(f"JSON 파싱 오류: {str(e)}")
                 return False
-            
-            with open(self.preset_file_path, 'r', encoding='utf-8') as f:
-                self.presets = json.load(f)
-            
-            # 기본 구조 확인
-            if not isinstance(self.presets, dict) or "emotions" not in self.presets:
-                print("프리셋 파일 구조가 유효하지 않습니다.")
+            except Exception as e:
+                print(f"프리셋 로드 중 오류 발생: {str(e)}")
                 return False
-            
-            print(f"프리셋을 성공적으로 로드했습니다: {len(self.presets['emotions'])} 감정")
-            return True
-            
-        except json.JSONDecodeError as e:
-            print(f"JSON 파싱 오류: {str(e)}")
+    
+    def reload_if_changed(self):
+        """
+        파일이 바뀌었으면 다시 로드합니다.
+        
+        Returns:
+        --------
+        bool
+            다시 로드했는지 여부
+        """
+        try:
+            stat = os.stat(self.preset_file_path)
+        except OSError:
             return False
-        except Exception as e:
-            print(f"프리셋 로드 중 오류 발생: {str(e)}")
+        
+        version = (stat.st_mtime_ns, stat.st_size)
+        index = self._index
+        if index is not None and version == (index.mtime_ns, index.size):
+            return False
+        
+        # 같은 내용으로 실패를 반복하지 않도록 파일이 다시 바뀔 때까지 기다림
+        if version == self._failed_version:
             return False
+        
+        loaded = self.load_presets()
+        self._failed_version = None if loaded else version
+        return loaded
+    
+    def _get_index(self):
+        """현재 인덱스 반환 (reload_interval마다 파일 변경 확인)"""
+        if self.reload_interval is not None:
+            now = time.monotonic()
+            if now >= self._next_check:
+                self._next_check = now + self.reload_interval
+                self.reload_if_changed()
+        return self._index
+    
+    def _resolve_key(self, index, emotion_number):
+        """감정 번호를 인덱스 키로 변환 (없으면 중립 "3")"""
+        # 문자열로 변환 (숫자 입력도 처리하기 위함)
+        emotion_key = str(emotion_number)
+        
+        # 감정 번호 유효성 검사
+        if emotion_key not in index.compiled:
+            print(f"유효하지 않은 감정 번호입니다: {emotion_number}")
+            # 기본값으로 중립(3) 반환
+            emotion_key = "3"
+            print(f"기본 감정(중립) 프리셋을 사용합니다.")
+        return emotion_key
     
     def get_preset_by_emotion(self, emotion_number):
         """
@@ -78,23 +275,36 @@ class PresetLoader:
         Returns:
         --------
         dict or None
-            프리셋 정보 딕셔너리 또는 None(감정 번호가 유효하지 않을 경우)
+            프리셋 정보 {"name", "preset"}의 JSON 모양 복사본 또는 None(프리셋이 로드되지 않았을 경우)
+            (읽기 전용 인덱스가 필요하면 get_compiled_preset 사용)
         """
-        if self.presets is None:
+        index = self._get_index()
+        if index is None:
             print("프리셋이 로드되지 않았습니다.")
             return None
         
-        # 문자열로 변환 (숫자 입력도 처리하기 위함)
-        emotion_key = str(emotion_number)
+        return _thaw(index.emotions.get(self._resolve_key(index, emotion_number)))
+    
+    def get_compiled_preset(self, emotion_number):
+        """
+        감정 번호에 해당하는 변환된 프리셋을 반환합니다.
         
-        # 감정 번호 유효성 검사
-        if emotion_key not in self.presets["emotions"]:
-            print(f"유효하지 않은 감정 번호입니다: {emotion_number}")
-            # 기본값으로 중립(3) 반환
-            emotion_key = "3"
-            print(f"기본 감정(중립) 프리셋을 사용합니다.")
+        Parameters:
+        -----------
+        emotion_number : int or str
+            감정 번호 (1-5, 유효하지 않으면 중립)
+            
+        Returns:
+        --------
+        CompiledPreset or None
+            변환된 프리셋 또는 None(프리셋이 로드되지 않았을 경우)
+        """
+        index = self._get_index()
+        if index is None:
+            print("프리셋이 로드되지 않았습니다.")
+            return None
         
-        return self.presets["emotions"][emotion_key]
+        return index.compiled.get(self._resolve_key(index, emotion_number))
     
     def get_emotion_names(self):
         """
@@ -105,11 +315,12 @@ class PresetLoader:
         dict or None
             감정 번호를 키로, 이름을 값으로 하는 딕셔너리
         """
-        if self.presets is None:
+        index = self._get_index()
+        if index is None:
             print("프리셋이 로드되지 않았습니다.")
             return None
         
-        return {k: v["name"] for k, v in self.presets["emotions"].items()}
+        return {k: v.name for k, v in index.compiled.items()}
     
     def get_all_emotions(self):
         """
@@ -117,14 +328,15 @@ class PresetLoader:
         
         Returns:
         --------
-        dict or None
-            감정 정보 딕셔너리
+        Mapping or None
+            감정 정보 딕셔너리 (읽기 전용)
         """
-        if self.presets is None:
+        index = self._get_index()
+        if index is None:
             print("프리셋이 로드되지 않았습니다.")
             return None
         
-        return self.presets["emotions"]
+        return index.emotions
 
 # 간단한 테스트 코드
 if __name__ == "__main__":
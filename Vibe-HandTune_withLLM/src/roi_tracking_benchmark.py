@@ -0,0 +1,102 @@
+"""
+손 ROI 추적 효과 측정 스크립트입니다.
+같은 프레임 목록을 전체 이미지 감지와 ROI 추적(HandRoiTracker)으로 각각 처리하여
+FPS, 프레임당 CPU 시간, 감지 입력 크기, 추적 실패율, 손 감지 프레임 수와
+두 방식의 손목 위치 차이를 비교합니다. 손이 나오는 동영상이나 이미지가 필요합니다.
+
+사용 예:
+    python -m src.roi_tracking_benchmark --video hands.mp4
+"""
+
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+# 프로젝트 루트 경로를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.gesture_engine_benchmark import load_frames
+from src.gesture_recognizer import GestureEngine
+from src.hand_features import HAND_SLOTS
+
+
+def run_mode(frames, roi_tracking, settings_path):
+    """한 가지 방식으로 프레임 목록 처리 (통계, 프레임별 손목 위치)"""
+    engine = GestureEngine(settings_path, smooth_landmarks=False, roi_tracking=roi_tracking,
+                           headless=True, flip_horizontal=True)
+    # 모델 로딩과 첫 추론은 측정에서 제외
+    engine.process_frame(frames[0])
+    engine.reset()
+
+    positions = np.full((len(frames), len(HAND_SLOTS), 2), np.nan)
+    start_time = time.perf_counter()
+    start_cpu = time.process_time()
+    for index, frame in enumerate(frames):
+        gesture_data, _ = engine.process_frame(frame)
+        for slot, hand_type in enumerate(HAND_SLOTS):
+            if gesture_data[hand_type]['detected']:
+                positions[index, slot] = (gesture_data[hand_type]['x_position'],
+                                          gesture_data[hand_type]['y_position'])
+    elapsed = time.perf_counter() - start_time
+    cpu_time = time.process_time() - start_cpu
+
+    stats = {
+        "fps": len(frames) / elapsed,
+        "cpu_ms": cpu_time / len(frames) * 1000,
+        "detected": int(np.any(~np.isnan(positions[:, :, 0]), axis=1).sum()),
+        "roi": engine.get_roi_stats(),
+    }
+    engine.close()
+    return stats, positions
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='손 ROI 추적 효과 측정')
+    parser.add_argument('--video', type=str, default=None,
+                        help='측정에 사용할 동영상 파일 (손이 나오는 영상)')
+    parser.add_argument('--image', type=str, default=None,
+                        help='측정에 사용할 이미지 파일 (반복 사용)')
+    parser.add_argument('--frames', type=int, default=300,
+                        help='처리할 프레임 수 (기본값: 300)')
+    parser.add_argument('--width', type=int, default=640,
+                        help='프레임 너비 (기본값: 640)')
+    parser.add_argument('--height', type=int, default=480,
+                        help='프레임 높이 (기본값: 480)')
+    parser.add_argument('--settings', type=str, default=None,
+                        help='ROI 설정을 읽을 카메라 설정 파일 (기본값: config/camera_settings.json)')
+    args = parser.parse_args()
+
+    if not args.video and not args.image:
+        parser.error("손이 나오는 --video 또는 --image가 필요합니다.")
+
+    frames = load_frames(args)
+    print(f"프레임 {len(frames)}개, {args.width}x{args.height}")
+
+    results = {}
+    for roi_tracking in (False, True):
+        stats, positions = run_mode(frames, roi_tracking, args.settings)
+        results[roi_tracking] = positions
+        mode = "ROI 추적" if roi_tracking else "전체 이미지"
+        print(f"\n[{mode}]")
+        print(f"  {stats['fps']:.1f} FPS, CPU {stats['cpu_ms']:.2f}ms/프레임, "
+              f"손 감지 {stats['detected']}/{len(frames)}프레임")
+        roi = stats["roi"]
+        if roi:
+            print(f"  ROI {roi['roi_frames']}프레임, 전체 이미지 {roi['full_frames']}프레임, "
+                  f"추적 실패 {roi['tracking_lost']}회 ({roi['tracking_loss_rate'] * 100:.1f}%), "
+                  f"추적 상태 초기화 {roi['tracking_restarts']}회, "
+                  f"평균 입력 {roi['mean_input_pixels'] / (args.width * args.height) * 100:.0f}% 픽셀, "
+                  f"감지 {roi['mean_detect_ms']:.2f}ms/프레임")
+
+    # 두 방식 모두 감지한 손의 손목 위치 차이 (정규화 좌표)
+    difference = np.abs(results[True] - results[False])
+    difference = difference[~np.isnan(difference)]
+    if difference.size:
+        print(f"\n손목 위치 차이: 평균 {difference.mean():.4f}, 최대 {difference.max():.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+스트리밍(추측 실행) STT 모듈입니다.
+VoiceDetector가 말하는 도중 짧은 쉼마다 잘라 넘기는 문장 구간을 곧바로 STT에 보내고,
+문장이 끝나면 구간별 결과를 겹침 제거 후 이어 붙여 하나의 텍스트로 만듭니다.
+말이 끝난 뒤에는 마지막 구간만 변환하면 되므로 텍스트를 받기까지의 시간이 줄어듭니다.
+이미 녹음된 WAV도 쉼 위치에서 나누어 구간별로 동시에 변환할 수 있습니다.
+"""
+
+import re
+import threading
+import numpy as np
+from src.audio_input import AudioInput
+from src.audio_codec import read_wav_bytes
+
+
+def _normalize_word(word):
+    """겹침 비교용 단어 정규화 (문장 부호 제거, 소문자화)"""
+    return re.sub(r"[^\w]", "", word).lower()
+
+
+def merge_transcripts(previous, following, max_overlap_words=6):
+    """
+    겹치는 오디오로 변환된 두 텍스트를 중복 없이 이어 붙입니다.
+
+    앞 텍스트의 끝 단어들과 뒤 텍스트의 첫 단어들이 일치하는 가장 긴 구간을 찾아
+    뒤 텍스트에서 제거합니다. (문장 부호와 대소문자는 무시하고 비교)
+
+    Parameters:
+    -----------
+    previous : str
+        앞 구간까지 이어 붙인 텍스트
+    following : str
+        다음 구간의 텍스트
+    max_overlap_words : int
+        비교할 최대 겹침 단어 수
+
+    Returns:
+    --------
+    str
+        이어 붙인 텍스트
+    """
+    previous_words = previous.split()
+    following_words = following.split()
+    if not previous_words:
+        return " ".join(following_words)
+    if not following_words:
+        return " ".join(previous_words)
+
+    previous_keys = [_normalize_word(w) for w in previous_words[-max_overlap_words:]]
+    following_keys = [_normalize_word(w) for w in following_words[:max_overlap_words]]
+
+    overlap = 0
+    for size in range(min(len(previous_keys), len(following_keys)), 0, -1):
+        if previous_keys[-size:] == following_keys[:size]:
+            overlap = size
+            break
+
+    return " ".join(previous_words + following_words[overlap:])
+
+
+def split_wav_on_pauses(wav_bytes, target_time=4.0, search_time=1.5, frame_time=0.02):
+    """
+    녹음된 WAV를 target_time 정도 길이의 구간으로 나눕니다.
+    각 경계는 목표 위치 앞뒤 search_time 안에서 가장 조용한 프레임으로 정해
+    단어 중간에서 잘리지 않도록 합니다.
+
+    Parameters:
+    -----------
+    wav_bytes : bytes
+        16비트 PCM WAV 파일 내용
+    target_time : float
+        구간 목표 길이 (초)
+    search_time : float
+        경계를 찾을 범위 (목표 위치 앞뒤, 초)
+    frame_time : float
+        에너지를 계산할 프레임 길이 (초)
+
+    Returns:
+    --------
+    list
+        구간별 WAV 바이트 목록 (나눌 필요가 없으면 원본 하나)
+    """
+    try:
+        pcm, sample_rate = read_wav_bytes(wav_bytes)
+    except Exception:
+        return [wav_bytes]
+
+    frame_size = max(1, int(frame_time * sample_rate))
+    target = int(target_time / frame_time)
+    search = int(search_time / frame_time)
+    frame_count = len(pcm) // frame_size
+    if frame_count <= target + search:
+        return [wav_bytes]
+
+    # 프레임별 에너지 (채널 평균)
+    frames = pcm[:frame_count * frame_size].astype(np.float32).mean(axis=1).reshape(frame_count, frame_size)
+    energy = np.einsum('ij,ij->i', frames, frames)
+
+    encoder = AudioInput(sample_rate=sample_rate, channels=pcm.shape[1])
+    segments = []
+    start = 0
+    while frame_count - start > target + search:
+        low = start + target - search
+        cut = low + int(np.argmin(energy[low:start + target + search + 1]))
+        segments.append(encoder.get_wav_bytes(pcm[start * frame_size:cut * frame_size]))
+        start = cut
+    segments.append(encoder.get_wav_bytes(pcm[start * frame_size:]))
+    return segments
+
+
+class StreamingTranscriber:
+    """
+    문장 구간을 병렬로 변환하고 결과를 이어 붙이는 클래스입니다.
+
+    VoiceDetector의 segment_callback으로 add_segment를 등록하고,
+    문장 완성 콜백에서 finish()를 호출해 최종 텍스트를 받습니다.
+    """
+    def __init__(self, stt_handler, sample_rate=16000, channels=1, prompt=""):
+        """
+        StreamingTranscriber 클래스 초기화
+
+        Parameters:
+        -----------
+        stt_handler : STTHandler
+            구간 변환에 사용할 STT 핸들러
+        sample_rate : int
+            구간 오디오의 샘플링 레이트
+        channels : int
+            구간 오디오의 채널 수
+        prompt : str
+            STT 결과를 안내하는 프롬프트 (동시 변환 수는 stt_handler 설정을 따름)
+        """
+        self.stt_handler = stt_handler
+        self.prompt = prompt
+        self.min_segment_frames = int(0.1 * sample_rate)
+
+        # WAV 변환 기능만 사용 (스트림은 열지 않음)
+        self._encoder = AudioInput(sample_rate=sample_rate, channels=channels)
+        self._lock = threading.Lock()
+        self._futures = []
+        self._final_submitted = threading.Event()
+
+        # 마지막 문장의 구간 수
+        self.last_segment_count = 0
+
+    def add_segment(self, audio_segment, segment_index, is_final):
+        """
+        구간 오디오를 STT에 제출합니다. (VoiceDetector의 segment_callback)
+
+        Parameters:
+        -----------
+        audio_segment : numpy.ndarray
+            구간 오디오 (문장 버퍼의 뷰여도 됨, WAV로 즉시 변환)
+        segment_index : int
+            문장 안에서의 구간 번호 (0이면 새 문장 시작)
+        is_final : bool
+            문장의 마지막 구간인지 여부
+        """
+        with self._lock:
+            if segment_index == 0:
+                # 새 문장 시작 (무시된 이전 문장의 구간은 버림)
+                self._futures = []
+                self._final_submitted.clear()
+
+            if len(audio_segment) >= self.min_segment_frames:
+                wav_bytes = self._encoder.get_wav_bytes(audio_segment)
+                self._futures.append(self.stt_handler.submit_audio(wav_bytes, prompt=self.prompt))
+
+            if is_final:
+                self._final_submitted.set()
+
+    def finish(self, timeout=None):
+        """
+        마지막 구간까지 변환이 끝나기를 기다린 뒤 이어 붙인 텍스트를 반환합니다.
+
+        Parameters:
+        -----------
+        timeout : float or None
+            마지막 구간 제출 및 각 구간 변환을 기다리는 최대 시간 (초)
+
+        Returns:
+        --------
+        str
+            문장 전체 텍스트
+        """
+        self._final_submitted.wait(timeout)
+        with self._lock:
+            futures = self._futures
+            self._futures = []
+            self._final_submitted.clear()
+
+        text = ""
+        for future in futures:
+            try:
+                segment_text = future.result(timeout)
+            except Exception as e:
+                print(f"구간 변환 실패: {str(e)}")
+                continue
+            text = merge_transcripts(text, segment_text.strip())
+
+        self.last_segment_count = len(futures)
+        return text
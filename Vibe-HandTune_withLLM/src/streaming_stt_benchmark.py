@@ -0,0 +1,135 @@
+"""
+스트리밍 STT 지연 비교 스크립트입니다.
+합성 음성을 실시간 속도로 VoiceDetector에 흘려보내면서
+기존 경로(문장 종료 후 전체 변환)와 스트리밍 경로(짧은 쉼마다 구간 변환)의
+'말이 끝난 뒤 텍스트를 받기까지의 시간'을 로컬 STT 대역 서버로 측정합니다.
+"""
+
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+# 프로젝트 루트 경로를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.audio_input import AudioInput
+from src.stt_handler import STTHandler
+from src.voice_detector import VoiceDetector
+from src.streaming_stt import StreamingTranscriber
+from src.local_stt_server import LocalTranscriptionServer, synthesize_tone_words
+
+SAMPLE_RATE = 16000
+
+# 합성 발화: 단어 번호와 짧은 쉼을 넣을 단어 인덱스
+WORDS = [1, 5, 2, 8, 3, 9, 4, 12, 6, 11, 7, 10, 13, 14]
+PAUSE_AFTER = [3, 7, 10]
+
+
+def create_utterance(sample_rate=SAMPLE_RATE, lead_time=0.5, tail_time=1.8, seed=0):
+    """
+    앞뒤 묵음과 배경 잡음을 포함한 합성 발화 생성
+
+    Returns:
+        (int16 오디오 배열, 음성 종료 샘플 위치, 정답 텍스트)
+    """
+    speech = synthesize_tone_words(WORDS, sample_rate=sample_rate, pause_after=PAUSE_AFTER)[:, 0]
+    lead = int(lead_time * sample_rate)
+    tail = int(tail_time * sample_rate)
+
+    rng = np.random.default_rng(seed)
+    audio = rng.normal(0.0, 100.0, lead + len(speech) + tail)
+    audio[lead:lead + len(speech)] += speech
+
+    # 합성 음성 끝에는 단어 간격만큼 묵음이 붙어 있으므로 마지막 단어 끝을 종료 위치로 사용
+    speech_end = lead + len(speech) - int(0.08 * sample_rate)
+    expected = " ".join(f"단어{word}" for word in WORDS)
+    return np.clip(audio, -32768, 32767).astype(np.int16).reshape(-1, 1), speech_end, expected
+
+
+def run_path(streaming, audio, speech_end, stt_handler, pause_threshold, chunk_duration=0.1):
+    """
+    실시간 속도로 오디오를 흘려보내며 한 경로의 지연 측정
+
+    Returns:
+        (텍스트, 말이 끝난 뒤 텍스트까지 걸린 시간, 문장 종료 판정 후 STT 대기 시간, 구간 수)
+    """
+    audio_input = AudioInput(sample_rate=SAMPLE_RATE, channels=1, chunk_duration=chunk_duration)
+    detector = VoiceDetector(audio_input=audio_input, pause_threshold=pause_threshold, verbose=False)
+    chunk_size = audio_input.chunk_size
+
+    transcriber = None
+    if streaming:
+        transcriber = StreamingTranscriber(stt_handler, sample_rate=SAMPLE_RATE)
+        detector.segment_callback = transcriber.add_segment
+
+    start_time = time.perf_counter()
+    speech_end_time = start_time + speech_end / SAMPLE_RATE
+
+    for start in range(0, len(audio) - chunk_size + 1, chunk_size):
+        # 청크가 마이크에서 도착하는 시점까지 대기
+        arrival = start_time + (start + chunk_size) / SAMPLE_RATE
+        delay = arrival - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+        phrase = detector.process_chunk(audio[start:start + chunk_size])
+        if phrase is None:
+            continue
+
+        detected_time = time.perf_counter()
+        if streaming:
+            text = transcriber.finish()
+            segments = transcriber.last_segment_count
+        else:
+            text = stt_handler.transcribe_audio(audio_input.get_wav_bytes(phrase)).strip()
+            segments = 1
+        text_time = time.perf_counter()
+        return text, text_time - speech_end_time, text_time - detected_time, segments
+
+    return "", float("nan"), float("nan"), 0
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='스트리밍 STT 지연 비교')
+    parser.add_argument('--trials', type=int, default=3,
+                        help='경로별 반복 횟수 (기본값: 3)')
+    parser.add_argument('--base-latency', type=float, default=0.3,
+                        help='대역 서버의 요청당 고정 지연 (초, 기본값: 0.3)')
+    parser.add_argument('--per-second', type=float, default=0.15,
+                        help='대역 서버의 오디오 1초당 지연 (초, 기본값: 0.15)')
+    parser.add_argument('--pause-threshold', type=float, default=1.0,
+                        help='문장 종료 묵음 시간 (초, 기본값: 1.0)')
+    args = parser.parse_args()
+
+    # 로컬 대역 서버는 API 키를 확인하지 않음
+    os.environ.setdefault("OPENAI_API_KEY", "local-stand-in")
+    server = LocalTranscriptionServer(base_latency=args.base_latency,
+                                      latency_per_second=args.per_second).start()
+    # 반복 측정이 캐시에 적중하지 않도록 캐시는 끔
+    stt_handler = STTHandler(base_url=server.base_url, cache_dir=None)
+
+    audio, speech_end, expected = create_utterance()
+    print(f"합성 발화: {speech_end / SAMPLE_RATE - 0.5:.2f}초, 단어 {len(WORDS)}개, "
+          f"대역 서버 지연 {args.base_latency}초 + 오디오 1초당 {args.per_second}초")
+
+    try:
+        print(f"\n{'경로':<10}{'텍스트까지(초)':>16}{'STT 대기(초)':>14}{'구간':>6}{'정확':>6}")
+        for name, streaming in [("기존", False), ("스트리밍", True)]:
+            results = [run_path(streaming, audio, speech_end, stt_handler, args.pause_threshold)
+                       for _ in range(args.trials)]
+            correct = sum(text == expected for text, _, _, _ in results)
+            print(f"{name:<10}{np.mean([r[1] for r in results]):>16.3f}"
+                  f"{np.mean([r[2] for r in results]):>14.3f}{results[-1][3]:>6}"
+                  f"{correct:>4}/{len(results)}")
+            if correct < len(results):
+                print(f"  결과 예: {results[-1][0]}")
+    finally:
+        stt_handler.close()
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+STT 백엔드 성능 비교 스크립트입니다.
+같은 녹음 파일들을 API 경로와 로컬 엔진으로 각각 변환하여
+실시간 배율(RTF = 처리 시간 / 오디오 길이)과 요청당 지연 시간을 비교합니다.
+녹음 파일을 주지 않으면 합성 음성을 사용하고, API 경로는 기본적으로 로컬 대역 서버를 사용합니다.
+"""
+
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+# 프로젝트 루트 경로를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.audio_input import AudioInput
+from src.stt_handler import STTHandler
+from src.batch_stt import _wav_duration
+from src.local_stt_server import LocalTranscriptionServer, synthesize_tone_words
+
+SAMPLE_RATE = 16000
+
+
+def create_recordings(count=8, seed=0):
+    """
+    길이가 다른 합성 발화 목록 생성
+
+    Returns:
+        [(이름, WAV 바이트, 길이(초), 정답 텍스트), ...]
+    """
+    rng = np.random.default_rng(seed)
+    encoder = AudioInput(sample_rate=SAMPLE_RATE, channels=1)
+    recordings = []
+    for index in range(count):
+        words = [int(w) for w in rng.integers(0, 15, size=int(rng.integers(5, 20)))]
+        audio = synthesize_tone_words(words, sample_rate=SAMPLE_RATE)
+        expected = " ".join(f"단어{word}" for word in words)
+        recordings.append((f"synthetic_{index}", encoder.get_wav_bytes(audio),
+                           len(audio) / SAMPLE_RATE, expected))
+    return recordings
+
+
+def load_recordings(file_paths):
+    """
+    WAV 파일 목록을 읽기 (정답 텍스트 없음)
+
+    Returns:
+        [(이름, WAV 바이트, 길이(초), None), ...]
+    """
+    recordings = []
+    for file_path in file_paths:
+        with open(file_path, "rb") as f:
+            wav_bytes = f.read()
+        duration = _wav_duration(wav_bytes)
+        if duration > 0:
+            recordings.append((os.path.basename(file_path), wav_bytes, duration, None))
+    return recordings
+
+
+def run_backend(backend, recordings, base_url=None):
+    """
+    한 백엔드로 모든 녹음을 순서대로 변환하며 측정
+
+    Returns:
+        측정 결과 딕셔너리
+    """
+    # 콜드 스타트: 핸들러 생성(로컬 모델 로드 포함) + 첫 요청
+    start_time = time.perf_counter()
+    handler = STTHandler(backend=backend, base_url=base_url, cache_dir=None)
+    handler.transcribe_audio(recordings[0][1])
+    cold_ms = (time.perf_counter() - start_time) * 1000
+
+    latencies = []
+    correct = 0
+    total_audio = 0.0
+    try:
+        for _, wav_bytes, duration, expected in recordings:
+            start_time = time.perf_counter()
+            text = handler.transcribe_audio(wav_bytes).strip()
+            latencies.append(time.perf_counter() - start_time)
+            total_audio += duration
+            if expected is not None and text == expected:
+                correct += 1
+    finally:
+        handler.close()
+
+    latencies_ms = np.array(latencies) * 1000
+    return {
+        "backend": backend,
+        "cold_ms": cold_ms,
+        "mean_ms": float(latencies_ms.mean()),
+        "p50_ms": float(np.percentile(latencies_ms, 50)),
+        "p95_ms": float(np.percentile(latencies_ms, 95)),
+        "rtf": sum(latencies) / total_audio,
+        "correct": correct,
+        "labeled": sum(expected is not None for _, _, _, expected in recordings),
+    }
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='STT 백엔드 성능 비교')
+    parser.add_argument('wav_files', nargs='*',
+                        help='측정할 WAV 파일 (생략 시 합성 음성 사용)')
+    parser.add_argument('--backends', nargs='+', default=['api', 'stub'],
+                        help='비교할 백엔드 (api, faster_whisper, stub; 기본값: api stub)')
+    parser.add_argument('--real-api', action='store_true',
+                        help='로컬 대역 서버 대신 실제 Whisper API 사용')
+    parser.add_argument('--base-latency', type=float, default=0.3,
+                        help='대역 서버의 요청당 고정 지연 (초, 기본값: 0.3)')
+    parser.add_argument('--per-second', type=float, default=0.15,
+                        help='대역 서버의 오디오 1초당 지연 (초, 기본값: 0.15)')
+    args = parser.parse_args()
+
+    recordings = load_recordings(args.wav_files) if args.wav_files else create_recordings()
+    if not recordings:
+        print("측정할 녹음이 없습니다.")
+        return
+    print(f"녹음 {len(recordings)}개, 총 {sum(r[2] for r in recordings):.1f}초")
+
+    server = None
+    base_url = None
+    if 'api' in args.backends and not args.real_api:
+        os.environ.setdefault("OPENAI_API_KEY", "local-stand-in")
+        server = LocalTranscriptionServer(base_latency=args.base_latency,
+                                          latency_per_second=args.per_second).start()
+        base_url = server.base_url
+        print(f"API 경로: 로컬 대역 서버 ({args.base_latency}초 + 오디오 1초당 {args.per_second}초)")
+
+    try:
+        print(f"\n{'백엔드':<16}{'콜드(ms)':>10}{'평균(ms)':>10}{'p50(ms)':>10}{'p95(ms)':>10}{'RTF':>8}{'정확':>8}")
+        for backend in args.backends:
+            try:
+                r = run_backend(backend, recordings, base_url if backend == 'api' else None)
+            except Exception as e:
+                print(f"{backend:<16}측정 실패: {str(e)}")
+                continue
+            accuracy = f"{r['correct']}/{r['labeled']}" if r['labeled'] else "-"
+            print(f"{r['backend']:<16}{r['cold_ms']:>10.0f}{r['mean_ms']:>10.1f}{r['p50_ms']:>10.1f}"
+                  f"{r['p95_ms']:>10.1f}{r['rtf']:>8.3f}{accuracy:>8}")
+    finally:
+        if server is not None:
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
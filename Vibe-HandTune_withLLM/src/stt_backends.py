@@ -0,0 +1,301 @@
+"""
+로컬 STT 백엔드 모듈입니다.
+네트워크 없이 CPU에서 동작하는 음성 인식 엔진과, STTHandler가 API 클라이언트 대신
+사용할 수 있는 비동기 어댑터를 제공합니다.
+
+엔진은 한 번만 로드하여 계속 메모리에 유지(warm)하며, 사용할 엔진은
+config/stt_settings.json의 backend 항목으로 선택합니다.
+"""
+
+import io
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+from src.audio_codec import read_wav_bytes
+from src.stt_client import gather_transcriptions
+
+try:
+    import soundfile as sf
+except (ImportError, OSError):
+    sf = None
+
+ENGINE_SAMPLE_RATE = 16000
+
+
+def decode_audio_bytes(audio_bytes, sample_rate=ENGINE_SAMPLE_RATE):
+    """
+    업로드용 오디오 바이트를 엔진 입력(16kHz 모노 float32)으로 변환합니다.
+
+    Parameters:
+    -----------
+    audio_bytes : bytes
+        WAV 또는 soundfile이 읽을 수 있는 형식의 오디오 파일 내용
+    sample_rate : int
+        엔진이 요구하는 샘플링 레이트
+
+    Returns:
+    --------
+    numpy.ndarray
+        -1~1 범위의 1차원 float32 배열
+    """
+    if audio_bytes[:4] == b"RIFF":
+        pcm, source_rate = read_wav_bytes(audio_bytes)
+        audio = pcm.mean(axis=1).astype(np.float32) / 32768.0
+    elif sf is not None:
+        data, source_rate = sf.read(io.BytesIO(audio_bytes), dtype='float32', always_2d=True)
+        audio = data.mean(axis=1)
+    else:
+        raise RuntimeError("WAV 이외의 형식을 읽으려면 soundfile 패키지가 필요합니다.")
+
+    if source_rate != sample_rate and len(audio):
+        # 선형 보간 리샘플링 (음성 인식 입력용으로 충분)
+        duration = len(audio) / source_rate
+        target = np.arange(int(duration * sample_rate)) / sample_rate
+        audio = np.interp(target, np.arange(len(audio)) / source_rate, audio).astype(np.float32)
+
+    return audio
+
+
+class STTEngine:
+    """
+    로컬 음성 인식 엔진의 기본 클래스입니다.
+
+    load()는 한 번만 호출되고, 이후 transcribe()는 같은 스레드에서 순서대로 호출됩니다.
+    """
+    name = "base"
+
+    def __init__(self, language="ko"):
+        """
+        STTEngine 클래스 초기화
+
+        Parameters:
+        -----------
+        language : str
+            인식할 언어 코드
+        """
+        self.language = language
+        self.model_name = self.name
+
+    def load(self):
+        """모델을 메모리에 로드"""
+
+    def transcribe(self, audio, prompt=""):
+        """
+        16kHz 모노 float32 오디오를 텍스트로 변환
+
+        Parameters:
+        -----------
+        audio : numpy.ndarray
+            -1~1 범위의 1차원 float32 배열
+        prompt : str
+            인식 결과를 안내하는 프롬프트
+
+        Returns:
+        --------
+        str
+            변환된 텍스트
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """모델 자원 해제"""
+
+
+class FasterWhisperEngine(STTEngine):
+    """
+    faster-whisper(CTranslate2) 기반 CPU 음성 인식 엔진입니다.
+    int8 양자화 모델을 사용해 메모리와 연산량을 줄입니다.
+    """
+    name = "faster_whisper"
+
+    def __init__(self, language="ko", model_size="small", compute_type="int8",
+                 cpu_threads=0, beam_size=1, temperature=0):
+        """
+        FasterWhisperEngine 클래스 초기화
+
+        Parameters:
+        -----------
+        language : str
+            인식할 언어 코드
+        model_size : str
+            모델 크기 또는 변환된 모델 디렉토리 ('tiny', 'base', 'small' 등)
+        compute_type : str
+            연산 정밀도 ('int8', 'int8_float32', 'float32')
+        cpu_threads : int
+            사용할 CPU 스레드 수 (0이면 자동)
+        beam_size : int
+            빔 서치 크기 (1이면 탐욕 탐색으로 가장 빠름)
+        temperature : float
+            디코딩 온도
+        """
+        super().__init__(language)
+        self.model_size = model_size
+        self.compute_type = compute_type
+        self.cpu_threads = cpu_threads
+        self.beam_size = beam_size
+        self.temperature = temperature
+        self.model_name = f"faster_whisper:{model_size}:{compute_type}"
+        self._model = None
+
+    def load(self):
+        """모델 로드 (처음 한 번만)"""
+        if self._model is not None:
+            return
+
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError:
+            raise RuntimeError("로컬 STT 엔진을 사용하려면 faster-whisper 패키지가 필요합니다.")
+
+        print(f"로컬 STT 모델 로드 중: {self.model_size} ({self.compute_type})")
+        self._model = WhisperModel(
+            self.model_size,
+            device="cpu",
+            compute_type=self.compute_type,
+            cpu_threads=self.cpu_threads
+        )
+
+    def transcribe(self, audio, prompt=""):
+        """16kHz 모노 float32 오디오를 텍스트로 변환"""
+        self.load()
+        segments, _ = self._model.transcribe(
+            audio,
+            language=self.language,
+            initial_prompt=prompt or None,
+            beam_size=self.beam_size,
+            temperature=self.temperature,
+            condition_on_previous_text=False
+        )
+        return " ".join(segment.text.strip() for segment in segments).strip()
+
+    def close(self):
+        """모델 해제"""
+        self._model = None
+
+
+class StubEngine(STTEngine):
+    """
+    테스트용 결정적(deterministic) 엔진입니다.
+
+    local_stt_server.synthesize_tone_words()로 만든 합성 음성을 읽어
+    로컬 대역 서버와 같은 텍스트를 돌려주며, 필요하면 오디오 길이에 비례하는 처리 시간을 흉내 냅니다.
+    """
+    name = "stub"
+
+    def __init__(self, language="ko", latency_per_second=0.0):
+        """
+        StubEngine 클래스 초기화
+
+        Parameters:
+        -----------
+        language : str
+            인식할 언어 코드 (사용하지 않음)
+        latency_per_second : float
+            오디오 1초당 흉내 낼 처리 시간 (초)
+        """
+        super().__init__(language)
+        self.latency_per_second = latency_per_second
+
+    def transcribe(self, audio, prompt=""):
+        """합성 음성의 단어 번호를 읽어 텍스트로 변환"""
+        from src.local_stt_server import decode_tone_words
+
+        if self.latency_per_second > 0:
+            time.sleep(self.latency_per_second * len(audio) / ENGINE_SAMPLE_RATE)
+
+        samples = (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16)
+        return " ".join(f"단어{word}" for word in decode_tone_words(samples, ENGINE_SAMPLE_RATE))
+
+
+def create_stt_engine(name, language="ko", **kwargs):
+    """
+    이름으로 로컬 STT 엔진을 생성합니다.
+
+    Parameters:
+    -----------
+    name : str
+        엔진 이름 ('faster_whisper', 'stub')
+    language : str
+        인식할 언어 코드
+    **kwargs
+        엔진별 추가 설정
+
+    Returns:
+    --------
+    STTEngine
+        생성된 엔진 인스턴스
+    """
+    engines = {
+        FasterWhisperEngine.name: FasterWhisperEngine,
+        StubEngine.name: StubEngine,
+    }
+    if name not in engines:
+        raise ValueError(f"지원하지 않는 STT 엔진입니다: {name} (사용 가능: {', '.join(engines)})")
+    return engines[name](language=language, **kwargs)
+
+
+class LocalSTTClient:
+    """
+    로컬 엔진을 AsyncSTTClient와 같은 비동기 인터페이스로 감싸는 클래스입니다.
+    STTHandler는 백엔드 종류와 관계없이 같은 방식으로 이 클라이언트를 사용합니다.
+    """
+    def __init__(self, engine, max_concurrency=1, request_timeout=None):
+        """
+        LocalSTTClient 클래스 초기화 (엔진을 바로 로드하여 첫 요청 지연을 없앰)
+
+        Parameters:
+        -----------
+        engine : STTEngine
+            사용할 로컬 엔진
+        max_concurrency : int
+            동시에 실행할 변환 수 (엔진이 스레드 안전하지 않으면 1)
+        request_timeout : float or None
+            요청당 마감 시간 (초)
+        """
+        self.engine = engine
+        self.max_retries = 1
+        self.request_timeout = request_timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="local-stt")
+
+        start_time = time.time()
+        engine.load()
+        self.load_time = time.time() - start_time
+
+    def _run(self, audio_bytes, prompt):
+        """오디오 디코딩과 엔진 변환 (작업 스레드에서 실행)"""
+        return self.engine.transcribe(decode_audio_bytes(audio_bytes), prompt)
+
+    async def transcribe(self, audio_bytes, prompt="", filename="audio.wav", timeout=None):
+        """
+        오디오 바이트 하나를 텍스트로 변환합니다. (AsyncSTTClient.transcribe와 같은 인터페이스)
+        """
+        if len(audio_bytes) == 0:
+            return ""
+
+        timeout = self.request_timeout if timeout is None else timeout
+        loop = asyncio.get_running_loop()
+        try:
+            return await asyncio.wait_for(
+                loop.run_in_executor(self._executor, self._run, audio_bytes, prompt),
+                timeout
+            )
+        except asyncio.TimeoutError:
+            raise RuntimeError(f"STT 변환 실패 (마감 시간 {timeout}초 초과)")
+
+    async def transcribe_many(self, audio_list, prompt="", filename="audio.wav", timeout=None,
+                              return_exceptions=False):
+        """
+        여러 오디오를 변환하고 입력 순서대로 결과를 반환합니다. (AsyncSTTClient.transcribe_many와 같은 인터페이스)
+        실패한 항목이 있으면 RuntimeError를 발생시키며, return_exceptions가 True이면 그 자리에 예외 객체를 넣어 반환합니다.
+        """
+        return await gather_transcriptions(
+            (self.transcribe(audio, prompt, timeout=timeout) for audio in audio_list),
+            return_exceptions
+        )
+
+    async def close(self):
+        """작업 스레드와 엔진 정리"""
+        self._executor.shutdown(wait=False)
+        self.engine.close()
@@ -0,0 +1,261 @@
+"""
+비동기 STT 클라이언트 모듈입니다.
+asyncio 기반으로 Whisper API를 호출하며, 하나의 AsyncOpenAI 클라이언트(내부 HTTP 연결 풀)를
+계속 재사용하고 여러 오디오를 동시에 변환합니다.
+재시도는 지터가 있는 지수 백오프로 이벤트 루프를 막지 않고 기다리며,
+요청마다 전체 마감 시간(deadline)을 넘기지 않습니다.
+"""
+
+import random
+import asyncio
+import threading
+from openai import AsyncOpenAI
+from src.config_loader import load_api_key
+
+
+class AsyncSTTClient:
+    """
+    Whisper API 비동기 호출을 처리하는 클래스입니다.
+    모든 코루틴은 같은 이벤트 루프에서 실행되어야 합니다.
+    """
+    def __init__(self, model="whisper-1", language="ko", temperature=0, base_url=None,
+                 max_concurrency=4, max_retries=3, backoff_base=0.5, backoff_max=8.0,
+                 request_timeout=30.0):
+        """
+        AsyncSTTClient 클래스 초기화
+
+        Parameters:
+        -----------
+        model : str
+            사용할 Whisper 모델 이름
+        language : str
+            인식할 언어 코드 (예: 'ko', 'en', 'ja')
+        temperature : float
+            모델의 온도 값 (0~1)
+        base_url : str or None
+            API 서버 주소 (None이면 OpenAI 기본 주소)
+        max_concurrency : int
+            동시에 진행할 최대 변환 요청 수
+        max_retries : int
+            요청당 최대 시도 횟수
+        backoff_base : float
+            첫 재시도 대기 시간의 상한 (초, 시도마다 두 배)
+        backoff_max : float
+            재시도 대기 시간의 최대 상한 (초)
+        request_timeout : float or None
+            재시도를 포함한 요청당 마감 시간 (초)
+        """
+        self.api_key = load_api_key()
+        self.model = model
+        self.language = language
+        self.temperature = temperature
+        self.base_url = base_url
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.request_timeout = request_timeout
+
+        # 이벤트 루프 안에서 처음 사용할 때 생성 (클라이언트와 세마포어는 루프에 묶임)
+        self._client = None
+        self._semaphore = None
+
+    def _get_client(self):
+        """공유 AsyncOpenAI 클라이언트 반환 (재시도는 직접 처리하므로 SDK 재시도는 끔)"""
+        if self._client is None:
+            self._client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url, max_retries=0)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._client
+
+    def _backoff_delay(self, attempt):
+        """지수 백오프 + 전체 지터 대기 시간 (초)"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    async def transcribe(self, audio_bytes, prompt="", filename="audio.wav", timeout=None):
+        """
+        오디오 바이트 하나를 텍스트로 변환합니다.
+
+        Parameters:
+        -----------
+        audio_bytes : bytes
+            업로드할 오디오 파일 내용
+        prompt : str
+            STT 결과를 안내하는 프롬프트
+        filename : str
+            업로드 파일 이름 (확장자로 형식을 판단함)
+        timeout : float or None
+            이 요청의 마감 시간 (초, None이면 request_timeout 사용)
+
+        Returns:
+        --------
+        str
+            변환된 텍스트
+        """
+        if len(audio_bytes) == 0:
+            return ""
+
+        client = self._get_client()
+        loop = asyncio.get_running_loop()
+        timeout = self.request_timeout if timeout is None else timeout
+        deadline = None if timeout is None else loop.time() + timeout
+
+        async with self._semaphore:
+            for attempt in range(self.max_retries):
+                remaining = None if deadline is None else deadline - loop.time()
+                try:
+                    if remaining is not None and remaining <= 0:
+                        raise asyncio.TimeoutError()
+
+                    response = await asyncio.wait_for(
+                        client.audio.transcriptions.create(
+                            model=self.model,
+                            file=(filename, audio_bytes),
+                            language=self.language,
+                            prompt=prompt,
+                            temperature=self.temperature,
+                            response_format="text"
+                        ),
+                        remaining
+                    )
+                    return response if isinstance(response, str) else response.text
+
+                except asyncio.TimeoutError:
+                    raise RuntimeError(f"STT 변환 실패 (마감 시간 {timeout}초 초과)")
+
+                except Exception as e:
+                    print(f"STT 변환 시도 {attempt+1}/{self.max_retries} 실패: {str(e)}")
+                    if attempt == self.max_retries - 1:
+                        raise RuntimeError(f"STT 변환 실패 (최대 시도 횟수 초과): {str(e)}")
+
+                    # 마감 시간 안에서만 재시도 대기
+                    delay = self._backoff_delay(attempt)
+                    if deadline is not None:
+                        delay = min(delay, max(0.0, deadline - loop.time()))
+                    await asyncio.sleep(delay)
+
+        return ""
+
+    async def transcribe_many(self, audio_list, prompt="", filename="audio.wav", timeout=None,
+                              return_exceptions=False):
+        """
+        여러 오디오를 동시에 변환하고 입력 순서대로 결과를 반환합니다.
+
+        Parameters:
+        -----------
+        audio_list : list
+            오디오 바이트 목록
+        prompt : str
+            STT 결과를 안내하는 프롬프트
+        filename : str or list
+            업로드 파일 이름 (항목마다 다르면 audio_list와 같은 길이의 리스트)
+        timeout : float or None
+            요청당 마감 시간 (초)
+        return_exceptions : bool
+            True이면 실패한 항목 자리에 예외 객체를 넣어 반환
+
+        Returns:
+        --------
+        list
+            변환된 텍스트 목록
+
+        Raises:
+        -------
+        RuntimeError
+            return_exceptions가 False이고 실패한 항목이 있을 때
+        """
+        filenames = filename if isinstance(filename, list) else [filename] * len(audio_list)
+        return await gather_transcriptions(
+            (self.transcribe(audio, prompt, name, timeout) for audio, name in zip(audio_list, filenames)),
+            return_exceptions
+        )
+
+    async def close(self):
+        """HTTP 연결 풀 정리"""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+
+def raise_for_failed_chunks(results):
+    """
+    청크별 변환 결과에 예외가 있으면 실패한 청크를 모두 모아 RuntimeError를 발생시킵니다.
+
+    Parameters:
+    -----------
+    results : list
+        청크별 텍스트 또는 예외 객체 (입력 순서)
+
+    Raises:
+    -------
+    RuntimeError
+        실패한 청크가 하나라도 있을 때 (첫 번째 예외를 원인으로 연결)
+    """
+    failures = [(index, result) for index, result in enumerate(results) if isinstance(result, BaseException)]
+    if failures:
+        detail = ", ".join(f"청크 {index+1}: {error}" for index, error in failures)
+        raise RuntimeError(f"STT 변환 실패 ({len(failures)}/{len(results)}개 청크) - {detail}") from failures[0][1]
+
+
+async def gather_transcriptions(coroutines, return_exceptions=False):
+    """
+    여러 변환 코루틴을 동시에 실행하고 입력 순서대로 결과를 반환합니다.
+    하나가 실패해도 나머지는 끝까지 실행합니다.
+
+    Parameters:
+    -----------
+    coroutines : iterable
+        변환 코루틴 목록
+    return_exceptions : bool
+        True이면 실패한 항목 자리에 예외 객체를 넣어 반환하고,
+        False이면 실패한 항목이 있을 때 RuntimeError를 발생시킴
+
+    Returns:
+    --------
+    list
+        변환된 텍스트 목록 (return_exceptions가 True이면 예외 객체 포함)
+    """
+    results = await asyncio.gather(*coroutines, return_exceptions=True)
+    if not return_exceptions:
+        raise_for_failed_chunks(results)
+    return list(results)
+
+
+class EventLoopThread:
+    """
+    백그라운드 스레드에서 asyncio 이벤트 루프를 돌리는 클래스입니다.
+    동기 코드에서 코루틴을 제출하고 concurrent.futures.Future로 결과를 받습니다.
+    """
+    def __init__(self, name="stt-event-loop"):
+        """
+        EventLoopThread 클래스 초기화
+
+        Parameters:
+        -----------
+        name : str
+            스레드 이름
+        """
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        """이벤트 루프 실행 (스레드 본체)"""
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coroutine):
+        """
+        코루틴을 이벤트 루프에 제출합니다.
+
+        Returns:
+        --------
+        concurrent.futures.Future
+            코루틴 결과를 받을 Future
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def stop(self):
+        """이벤트 루프 중지 및 스레드 종료 대기"""
+        if self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=2.0)
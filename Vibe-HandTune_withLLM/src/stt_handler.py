@@ -1,19 +1,28 @@
 """
 음성-텍스트 변환(Speech-to-Text) 처리 모듈입니다.
-OpenAI의 Whisper API를 사용하여 오디오를 텍스트로 변환합니다.
+OpenAI의 Whisper API 또는 로컬 엔진을 사용하여 오디오를 텍스트로 변환합니다.
+
+실제 변환은 백그라운드 이벤트 루프의 AsyncSTTClient(API) 또는 LocalSTTClient(로컬 엔진)가
+처리하고, 이 모듈의 STTHandler는 기존 호출부를 위한 동기 인터페이스를 제공합니다.
+사용할 백엔드는 config/stt_settings.json에서 선택합니다.
 """
 
 import os
-from openai import OpenAI
-import time
+import concurrent.futures
 import numpy as np
-from src.config_loader import load_api_key
+from src.stt_client import AsyncSTTClient, EventLoopThread, raise_for_failed_chunks
+from src.audio_codec import UploadEncoder
+from src.stt_backends import LocalSTTClient, create_stt_engine
+from src.config_loader import load_stt_settings
+from src.transcription_cache import TranscriptionCache
 
 class STTHandler:
     """
     Whisper API를 사용하여 Speech-to-Text 변환을 처리하는 클래스입니다.
     """
-    def __init__(self, model="whisper-1", language="ko", temperature=0):
+    def __init__(self, model="whisper-1", language="ko", temperature=0, base_url=None,
+                 max_concurrency=4, request_timeout=30.0, cache_dir="stt_cache",
+                 upload_format="wav", compression_level=None, backend=None):
         """
         STTHandler 클래스 초기화
 
@@ -25,16 +34,127 @@ class STTHandler:
             인식할 언어 코드 (예: 'ko', 'en', 'ja')
         temperature : float
             모델의 온도 값 (0~1, 낮을수록 더 확정적인 결과)
+        base_url : str or None
+            API 서버 주소 (None이면 OpenAI 기본 주소, 로컬 호환 서버 사용 시 지정)
+        max_concurrency : int
+            동시에 진행할 최대 변환 요청 수
+        request_timeout : float or None
+            재시도를 포함한 요청당 마감 시간 (초)
+        cache_dir : str or None
+            변환 결과 캐시 디렉토리 (None이면 캐시 사용 안 함)
+        upload_format : str
+            업로드 전 인코딩 형식 ('wav', 'flac', 'ogg', 'opus', 'mp3')
+            WAV 이외의 형식은 soundfile 패키지가 필요함
+        compression_level : float or None
+            손실 압축 형식의 압축 정도 (0~1, 클수록 작은 파일)
+        backend : str or None
+            STT 백엔드 ('api', 'faster_whisper', 'stub'). None이면 설정 파일의 값 사용
         """
-        api_key = load_api_key()
-        self.client = OpenAI(api_key=api_key)
+        settings = load_stt_settings()
+        self.backend = backend or settings["backend"]
+        
+        if self.backend == "api":
+            self.client = AsyncSTTClient(
+                model=model,
+                language=language,
+                temperature=temperature,
+                base_url=base_url,
+                max_concurrency=max_concurrency,
+                request_timeout=request_timeout
+            )
+        else:
+            # 로컬 엔진은 여기서 한 번 로드되어 핸들러가 살아 있는 동안 유지됨
+            engine = create_stt_engine(self.backend, language=language, **settings.get(self.backend, {}))
+            self.client = LocalSTTClient(engine, request_timeout=request_timeout)
+            model = engine.model_name
+            upload_format = "wav"  # 로컬 엔진은 업로드가 없으므로 재인코딩하지 않음
+        
         self.model = model
         self.language = language
         self.temperature = temperature
-        self.max_retries = 3
-        self.retry_delay = 2  # 초 단위
+        self.max_retries = self.client.max_retries
+        
+        # 업로드 인코더 (인코딩 시간과 전송 바이트 수 집계)
+        self.encoder = UploadEncoder(upload_format, compression_level)
+        
+        # 같은 오디오와 설정의 재변환은 API 호출 없이 캐시에서 반환
+        self.cache = TranscriptionCache(cache_dir) if cache_dir else None
+        
+        # 비동기 클라이언트를 실행할 백그라운드 이벤트 루프 (처음 호출할 때 시작)
+        self._loop_thread = None
+
+    def _get_loop(self):
+        """백그라운드 이벤트 루프 반환"""
+        if self._loop_thread is None:
+            self._loop_thread = EventLoopThread()
+        return self._loop_thread
+
+    def _read_audio(self, audio_data_or_path):
+        """
+        입력 오디오를 (바이트, 파일 이름)으로 변환
+
+        Parameters:
+        -----------
+        audio_data_or_path : bytes, memoryview, str or file object
+            오디오 데이터, 파일 경로 또는 열린 파일 객체
+
+        Returns:
+        --------
+        tuple
+            (오디오 바이트, 업로드 파일 이름)
+        """
+        if isinstance(audio_data_or_path, str):
+            # 파일 경로인 경우 파일 읽기
+            with open(audio_data_or_path, "rb") as audio_file:
+                return audio_file.read(), os.path.basename(audio_data_or_path)
+        if isinstance(audio_data_or_path, np.ndarray):
+            # 오류 반환
+            raise ValueError("NumPy 배열은 직접 처리할 수 없습니다. WAV 바이트로 먼저 변환해주세요.")
+        if hasattr(audio_data_or_path, "read"):
+            # 열린 파일 객체인 경우 내용 읽기
+            name = os.path.basename(getattr(audio_data_or_path, "name", "audio.wav"))
+            return audio_data_or_path.read(), name
+        # 바이트 데이터인 경우 그대로 사용
+        return bytes(audio_data_or_path), "audio.wav"
 
-    def transcribe_audio(self, audio_data_or_path, prompt=""):
+    def submit_audio(self, audio_data_or_path, prompt="", timeout=None):
+        """
+        오디오 변환을 백그라운드에서 시작하고 바로 반환합니다.
+
+        Parameters:
+        -----------
+        audio_data_or_path : bytes, str or file object
+            텍스트로 변환할 오디오 데이터 또는 파일 경로
+        prompt : str
+            STT 결과를 안내하는 프롬프트
+        timeout : float or None
+            요청 마감 시간 (초, None이면 request_timeout 사용)
+
+        Returns:
+        --------
+        concurrent.futures.Future
+            변환된 텍스트를 결과로 가지는 Future
+        """
+        audio_bytes, filename = self._read_audio(audio_data_or_path)
+        
+        cache_key = None
+        if self.cache is not None and len(audio_bytes) > 0:
+            cache_key = self._cache_key(audio_bytes, prompt)
+            text = self.cache.get(cache_key)
+            if text is not None:
+                future = concurrent.futures.Future()
+                future.set_result(text)
+                return future
+        
+        upload_bytes, upload_name = self.encoder.encode(audio_bytes, filename)
+        future = self._get_loop().submit(
+            self.client.transcribe(upload_bytes, prompt, upload_name, timeout)
+        )
+        if cache_key is not None:
+            future.add_done_callback(lambda f: self._store_result(cache_key, f))
+        return future
+
+    def transcribe_audio(self, audio_data_or_path, prompt="", timeout=None):
         """
         오디오 데이터를 텍스트로 변환합니다.
 
@@ -44,71 +164,19 @@ class STTHandler:
             텍스트로 변환할 오디오 데이터 또는 파일 경로
         prompt : str
             STT 결과를 안내하는 프롬프트 (특정 단어나 문맥을 힌트로 제공)
+        timeout : float or None
+            요청 마감 시간 (초, None이면 request_timeout 사용)
 
         Returns:
         --------
         str
             변환된 텍스트
         """
-        # 타입 확인 및 처리
-        if isinstance(audio_data_or_path, str):
-            # 파일 경로인 경우 파일 열기
-            audio_file = open(audio_data_or_path, "rb")
-        elif isinstance(audio_data_or_path, np.ndarray):
-            # 오류 반환
-            raise ValueError("NumPy 배열은 직접 처리할 수 없습니다. WAV 바이트로 먼저 변환해주세요.")
-        else:
-            # 바이트 데이터인 경우 그대로 사용
-            audio_file = audio_data_or_path
-
-        # 오디오가 비어있는지 확인
-        if hasattr(audio_file, "read") and len(audio_file.read(1)) == 0:
-            audio_file.seek(0)  # 포인터 초기화
-            return ""
-
-        if isinstance(audio_file, bytes) and len(audio_file) == 0:
-            return ""
-
-        # API 호출 시도
-        for attempt in range(self.max_retries):
-            try:
-                # API 호출 준비
-                if isinstance(audio_file, bytes):
-                    # 바이트 데이터인 경우 임시 파일 객체로 변환
-                    from io import BytesIO
-                    audio_file = ("audio.wav", audio_file, "audio/wav")
-
-                # Whisper API 호출
-                response = self.client.audio.transcriptions.create(
-                    model=self.model,
-                    file=audio_file,
-                    language=self.language,
-                    prompt=prompt,
-                    temperature=self.temperature,
-                    response_format="text"
-                )
-                
-                # 결과 반환
-                return response.text
-                
-            except Exception as e:
-                print(f"STT 변환 시도 {attempt+1}/{self.max_retries} 실패: {str(e)}")
-                
-                # 파일 포인터 초기화 (파일 객체인 경우)
-                if hasattr(audio_file, "seek"):
-                    audio_file.seek(0)
-                
-                # 마지막 시도가 아니면 대기 후 재시도
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay)
-                else:
-                    raise RuntimeError(f"STT 변환 실패 (최대 시도 횟수 초과): {str(e)}")
-        
-        return ""  # 여기까지 오면 빈 문자열 반환 (실제로는 위에서 예외 발생)
+        return self.submit_audio(audio_data_or_path, prompt, timeout).result()
 
     def transcribe_chunks(self, audio_chunks, prompt=""):
         """
-        여러 오디오 청크를 처리하고 결과를 결합합니다.
+        여러 오디오 청크를 동시에 처리하고 순서대로 결과를 결합합니다.
 
         Parameters:
         -----------
@@ -121,15 +189,99 @@ class STTHandler:
         --------
         str
             변환된 텍스트
+
+        Raises:
+        -------
+        RuntimeError
+            변환에 실패한 청크가 있을 때 (성공한 청크는 캐시에 저장됨)
         """
-        results = []
+        chunks = [self._read_audio(chunk) for chunk in audio_chunks]
+        audio_list = [audio_bytes for audio_bytes, _ in chunks]
+        results = [None] * len(audio_list)
+        
+        # 캐시에 없는 청크만 API로 변환
+        keys = [None] * len(audio_list)
+        if self.cache is not None:
+            for index, audio_bytes in enumerate(audio_list):
+                keys[index] = self._cache_key(audio_bytes, prompt)
+                results[index] = self.cache.get(keys[index])
         
-        for chunk in audio_chunks:
-            text = self.transcribe_audio(chunk, prompt)
-            if text:
-                results.append(text)
+        missing = [index for index, text in enumerate(results) if text is None]
+        if missing:
+            uploads = [self.encoder.encode(*chunks[i]) for i in missing]
+            texts = self._get_loop().submit(
+                self.client.transcribe_many(
+                    [upload_bytes for upload_bytes, _ in uploads],
+                    prompt,
+                    [upload_name for _, upload_name in uploads],
+                    return_exceptions=True
+                )
+            ).result()
+            for index, text in zip(missing, texts):
+                results[index] = text
+                # 성공한 청크는 실패한 청크가 있어도 캐시하여 다시 시도할 때 재사용
+                if self.cache is not None and not isinstance(text, BaseException):
+                    self.cache.put(keys[index], text)
+            
+            # 실패한 청크가 있으면 잘린 결과 대신 예외 발생
+            raise_for_failed_chunks(results)
         
-        return " ".join(results)
+        return " ".join(text for text in results if text)
+
+    def is_cached(self, audio_bytes, prompt=""):
+        """
+        오디오의 변환 결과가 캐시에 있는지 확인합니다. (API 요청이 필요한지 판단용)
+
+        Parameters:
+        -----------
+        audio_bytes : bytes
+            오디오 파일 내용
+        prompt : str
+            STT 결과를 안내하는 프롬프트
+
+        Returns:
+        --------
+        bool
+            캐시 존재 여부
+        """
+        if self.cache is None:
+            return False
+        return self.cache.contains(self._cache_key(audio_bytes, prompt))
+
+    def get_cache_stats(self):
+        """
+        변환 결과 캐시 지표를 반환합니다.
+
+        Returns:
+        --------
+        dict or None
+            캐시 지표 (캐시를 사용하지 않으면 None)
+        """
+        return self.cache.get_stats() if self.cache is not None else None
+
+    def get_upload_stats(self):
+        """
+        업로드 인코딩 지표를 반환합니다.
+
+        Returns:
+        --------
+        dict
+            업로드 형식, 평균 인코딩 CPU 시간(ms), 원본/전송 바이트 수, 압축률
+        """
+        return self.encoder.get_stats()
+
+    def _cache_key(self, audio_bytes, prompt):
+        """현재 변환 설정을 포함한 캐시 키"""
+        return TranscriptionCache.make_key(
+            audio_bytes, self.model, self.language, prompt, self.temperature,
+            upload_format=self.encoder.upload_format,
+            compression_level=self.encoder.compression_level
+        )
+
+    def _store_result(self, cache_key, future):
+        """변환이 성공하면 결과를 캐시에 저장 (Future 완료 콜백)"""
+        if not future.cancelled() and future.exception() is None:
+            self.cache.put(cache_key, future.result())
 
     def transcribe_wav_file(self, file_path, prompt=""):
         """
@@ -163,6 +315,16 @@ class STTHandler:
             print(f"WAV 파일 변환 중 오류 발생: {str(e)}")
             return ""
 
+    def close(self):
+        """
+        HTTP 연결 풀과 백그라운드 이벤트 루프를 정리합니다.
+        """
+        if self._loop_thread is None:
+            return
+        self._loop_thread.submit(self.client.close()).result(timeout=2.0)
+        self._loop_thread.stop()
+        self._loop_thread = None
+
 # 테스트 코드
 if __name__ == "__main__":
     from src.audio_input import AudioInput
@@ -0,0 +1,212 @@
+"""
+STT 변환 결과 캐시 모듈입니다.
+오디오 내용과 변환 설정의 해시를 키로 변환 결과를 디스크에 저장하여,
+같은 녹음을 다시 변환할 때 API를 호출하지 않고 바로 결과를 돌려줍니다.
+"""
+
+import os
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+class TranscriptionCache:
+    """
+    내용 해시 기반 디스크 캐시 클래스입니다.
+
+    항목 하나당 `<sha256>.json` 파일 하나를 사용하며, 전체 크기가 max_bytes를 넘으면
+    가장 오래 사용하지 않은 항목부터 지웁니다(LRU). 사용 순서는 파일 수정 시각으로
+    보관하므로 프로그램을 다시 시작해도 유지됩니다.
+    """
+    def __init__(self, cache_dir="stt_cache", max_bytes=5 * 1024 * 1024):
+        """
+        TranscriptionCache 클래스 초기화
+
+        Parameters:
+        -----------
+        cache_dir : str
+            캐시 파일을 저장할 디렉토리
+        max_bytes : int
+            캐시 파일 전체의 최대 크기 (바이트)
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # 키 -> 파일 크기 (오래된 순)
+        self._total_bytes = 0
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self._load_index()
+
+    @staticmethod
+    def make_key(audio_bytes, model, language, prompt, temperature, response_format="text",
+                 upload_format="wav", compression_level=None):
+        """
+        오디오 내용과 변환 설정으로 캐시 키를 만듭니다.
+
+        Parameters:
+        -----------
+        audio_bytes : bytes or memoryview
+            업로드할 오디오 파일 내용
+        model, language, prompt, temperature, response_format, upload_format, compression_level
+            변환 결과에 영향을 주는 요청 설정 (손실 압축 업로드는 형식과 압축 수준에 따라 결과가 달라질 수 있음)
+
+        Returns:
+        --------
+        str
+            sha256 16진수 문자열
+        """
+        settings = json.dumps(
+            [model, language, prompt, float(temperature), response_format, upload_format, compression_level],
+            ensure_ascii=False
+        )
+        digest = hashlib.sha256(settings.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(audio_bytes)
+        return digest.hexdigest()
+
+    def contains(self, key):
+        """
+        캐시에 항목이 있는지 확인합니다. (적중/실패 횟수와 사용 순서는 바꾸지 않음)
+
+        Parameters:
+        -----------
+        key : str
+            make_key()로 만든 캐시 키
+
+        Returns:
+        --------
+        bool
+            항목 존재 여부
+        """
+        with self._lock:
+            return key in self._entries
+
+    def get(self, key):
+        """
+        캐시된 변환 결과를 반환합니다.
+
+        Parameters:
+        -----------
+        key : str
+            make_key()로 만든 캐시 키
+
+        Returns:
+        --------
+        str or None
+            캐시된 텍스트, 없으면 None
+        """
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+
+            path = self._path(key)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    text = json.load(f)["text"]
+                os.utime(path)
+            except (OSError, ValueError, KeyError):
+                # 손상되었거나 외부에서 지워진 항목
+                self._remove(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return text
+
+    def put(self, key, text):
+        """
+        변환 결과를 저장하고 필요하면 오래된 항목을 지웁니다.
+
+        Parameters:
+        -----------
+        key : str
+            make_key()로 만든 캐시 키
+        text : str
+            변환된 텍스트
+        """
+        data = json.dumps({"text": text}, ensure_ascii=False).encode("utf-8")
+        path = self._path(key)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+
+        with self._lock:
+            try:
+                with open(temp_path, "wb") as f:
+                    f.write(data)
+                os.replace(temp_path, path)
+            except OSError as e:
+                print(f"STT 캐시 저장 실패: {str(e)}")
+                return
+
+            self._total_bytes -= self._entries.pop(key, 0)
+            self._entries[key] = len(data)
+            self._total_bytes += len(data)
+
+            while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def clear(self):
+        """
+        캐시 항목을 모두 지웁니다.
+        """
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def get_stats(self):
+        """
+        캐시 상태 지표를 반환합니다.
+
+        Returns:
+        --------
+        dict
+            항목 수, 전체 크기, 적중/실패/제거 횟수, 적중률
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def _path(self, key):
+        """캐시 키에 해당하는 파일 경로"""
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _remove(self, key):
+        """항목 하나를 인덱스와 디스크에서 제거 (락을 잡은 상태에서 호출)"""
+        self._total_bytes -= self._entries.pop(key, 0)
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def _load_index(self):
+        """디스크의 캐시 파일을 수정 시각 순으로 읽어 LRU 인덱스 구성"""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".json"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.cache_dir, name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, name[:-len(".json")], stat.st_size))
+
+        for _, key, size in sorted(entries):
+            self._entries[key] = size
+            self._total_bytes += size
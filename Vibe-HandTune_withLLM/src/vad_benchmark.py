@@ -0,0 +1,194 @@
+"""
+VAD 엔진 성능 비교 스크립트입니다.
+녹음된 WAV 파일(또는 합성 신호)을 VoiceDetector에 빠르게 흘려보내
+엔진별 오디오 1초당 CPU 시간과 음성 종료 감지 지연을 측정합니다.
+"""
+
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+# 프로젝트 루트 경로를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.audio_input import AudioInput
+from src.voice_detector import VoiceDetector
+from src.vad_engine import EnergyVAD, MultiFeatureVAD
+
+SAMPLE_RATE = 16000
+
+
+def create_synthetic_signal(sample_rate=SAMPLE_RATE, seed=0):
+    """
+    정답 음성 구간을 알고 있는 합성 신호 생성
+
+    배경 잡음 위에 음절 단위로 진폭이 변하는 배음 신호를 음성 구간으로 삽입하고,
+    음성이 아닌 광대역 잡음 구간(오탐 확인용)을 하나 추가함
+
+    Returns:
+        (int16 오디오 배열, [(시작 샘플, 종료 샘플), ...])
+    """
+    rng = np.random.default_rng(seed)
+    layout = [(1.03, 1.21), (1.47, 0.83), (1.52, 2.06), (1.18, 0.64), (1.55, 1.47), (2.0, 0.0)]
+
+    total = int(sum(silence + speech for silence, speech in layout) * sample_rate)
+    signal = rng.normal(0.0, 0.004, total)
+    segments = []
+
+    position = 0
+    for silence, speech in layout:
+        position += int(silence * sample_rate)
+        length = int(speech * sample_rate)
+        if length == 0:
+            continue
+
+        t = np.arange(length) / sample_rate
+        pitch = 140 + 30 * np.sin(2 * np.pi * 0.7 * t)
+        phase = 2 * np.pi * np.cumsum(pitch) / sample_rate
+        voiced = sum(np.sin(k * phase) / k for k in range(1, 6))
+        syllables = 0.55 + 0.45 * np.abs(np.sin(2 * np.pi * 2.5 * t))
+        signal[position:position + length] += 0.25 * voiced * syllables
+
+        segments.append((position, position + length))
+        position += length
+
+    # 마지막 묵음 구간 중간에 광대역 잡음 삽입 (음성 구간 아님)
+    noise_start = position - int(1.5 * sample_rate)
+    signal[noise_start:noise_start + int(0.6 * sample_rate)] += rng.normal(0.0, 0.12, int(0.6 * sample_rate))
+
+    audio = np.clip(signal * 32767, -32768, 32767).astype(np.int16)
+    return audio, segments
+
+
+def label_reference_segments(audio, sample_rate=SAMPLE_RATE, frame_duration=0.01, min_gap=0.3):
+    """
+    정답이 없는 녹음 파일용 기준 음성 구간 추정 (10ms RMS 기반)
+
+    Returns:
+        [(시작 샘플, 종료 샘플), ...]
+    """
+    frame_size = int(sample_rate * frame_duration)
+    num_frames = len(audio) // frame_size
+    frames = audio[:num_frames * frame_size].astype(np.float32).reshape(num_frames, frame_size) / 32767
+    rms = np.sqrt(np.mean(frames ** 2, axis=1))
+
+    # 하위 20% 프레임을 잡음으로 보고 그 4배를 기준 임계값으로 사용
+    threshold = max(4 * np.percentile(rms, 20), 0.01)
+    voiced = np.flatnonzero(rms > threshold)
+
+    segments = []
+    max_gap = int(min_gap / frame_duration)
+    for index in voiced:
+        if segments and index - segments[-1][1] <= max_gap:
+            segments[-1][1] = index + 1
+        else:
+            segments.append([index, index + 1])
+
+    return [(start * frame_size, end * frame_size) for start, end in segments
+            if (end - start) * frame_duration >= 0.1]
+
+
+def run_engine(name, engine, audio, segments, sample_rate=SAMPLE_RATE, chunk_duration=0.1):
+    """
+    VoiceDetector에 오디오를 청크 단위로 흘려보내며 성능 측정
+
+    Returns:
+        측정 결과 딕셔너리
+    """
+    audio_input = AudioInput(sample_rate=sample_rate, channels=1, chunk_duration=chunk_duration)
+    detector = VoiceDetector(audio_input=audio_input, vad_engine=engine, verbose=False)
+    chunk_size = audio_input.chunk_size
+    audio = audio.reshape(-1, 1)
+
+    events = []
+    phrases = 0
+    last_detected = None
+
+    cpu_start = time.process_time()
+    for start in range(0, len(audio) - chunk_size + 1, chunk_size):
+        if detector.process_chunk(audio[start:start + chunk_size]) is not None:
+            phrases += 1
+        if detector.speech_end_detected_position != last_detected:
+            last_detected = detector.speech_end_detected_position
+            events.append((detector.speech_end_position, last_detected))
+    cpu_time = time.process_time() - cpu_start
+
+    # 정답 종료 지점마다 가장 가까운 종료 이벤트를 매칭
+    latencies = []
+    boundary_errors = []
+    tolerance = int(0.3 * sample_rate)
+    for _, true_end in segments:
+        candidates = [(abs(end - true_end), end, detected) for end, detected in events
+                      if abs(end - true_end) <= tolerance]
+        if not candidates:
+            continue
+        _, end, detected = min(candidates)
+        latencies.append((detected - true_end) / sample_rate * 1000)
+        boundary_errors.append(abs(end - true_end) / sample_rate * 1000)
+
+    duration = len(audio) / sample_rate
+    return {
+        "name": name,
+        "cpu_ms_per_sec": cpu_time / duration * 1000,
+        "phrases": phrases,
+        "matched": len(latencies),
+        "segments": len(segments),
+        "latency_ms": float(np.mean(latencies)) if latencies else float("nan"),
+        "boundary_error_ms": float(np.mean(boundary_errors)) if boundary_errors else float("nan"),
+    }
+
+
+def print_results(title, results):
+    """측정 결과 표 출력"""
+    print(f"\n[{title}]")
+    print(f"{'엔진':<16}{'CPU(ms/초)':>12}{'종료 지연(ms)':>15}{'경계 오차(ms)':>15}{'매칭':>8}{'문장':>6}")
+    for r in results:
+        print(f"{r['name']:<16}{r['cpu_ms_per_sec']:>12.3f}{r['latency_ms']:>15.1f}"
+              f"{r['boundary_error_ms']:>15.1f}{r['matched']:>5}/{r['segments']:<2}{r['phrases']:>6}")
+
+
+def benchmark(audio, segments, sample_rate, chunk_duration, energy_threshold):
+    """기존 에너지 엔진과 다중 특징 엔진 비교"""
+    engines = [
+        ("energy(기존)", EnergyVAD(sample_rate=sample_rate, energy_threshold=energy_threshold)),
+        ("multi_feature", MultiFeatureVAD(sample_rate=sample_rate, energy_threshold=energy_threshold)),
+    ]
+    return [run_engine(name, engine, audio, segments, sample_rate, chunk_duration)
+            for name, engine in engines]
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='VAD 엔진 성능 비교')
+    parser.add_argument('wav_files', nargs='*',
+                        help='측정할 WAV 파일 (생략 시 합성 신호 사용)')
+    parser.add_argument('--chunk', type=float, default=0.1,
+                        help='청크 길이 (초, 기본값: 0.1)')
+    parser.add_argument('--threshold', type=float, default=0.05,
+                        help='에너지 임계값 (기본값: 0.05)')
+    args = parser.parse_args()
+
+    if not args.wav_files:
+        audio, segments = create_synthetic_signal()
+        print(f"합성 신호 사용: {len(audio) / SAMPLE_RATE:.1f}초, 음성 구간 {len(segments)}개")
+        print_results("합성 신호", benchmark(audio, segments, SAMPLE_RATE, args.chunk, args.threshold))
+        return
+
+    loader = AudioInput()
+    for file_path in args.wav_files:
+        audio = loader.load_from_wav_file(file_path)
+        if audio.size == 0:
+            continue
+        if audio.ndim == 2:
+            audio = audio[:, 0]
+
+        segments = label_reference_segments(audio)
+        print(f"\n{file_path}: {len(audio) / SAMPLE_RATE:.1f}초, 기준 음성 구간 {len(segments)}개")
+        print_results(os.path.basename(file_path),
+                      benchmark(audio, segments, SAMPLE_RATE, args.chunk, args.threshold))
+
+
+if __name__ == "__main__":
+    main()
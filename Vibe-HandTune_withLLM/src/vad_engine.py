@@ -0,0 +1,448 @@
+"""
+음성 활성화 감지(VAD) 엔진 모듈입니다.
+오디오 청크를 짧은 프레임으로 나누어 프레임 단위의 음성/묵음 판정을 내리는 엔진들을 제공합니다.
+VoiceDetector는 이 엔진을 교체하여 사용할 수 있습니다.
+"""
+
+import math
+import numpy as np
+
+
+class VADEngine:
+    """
+    VAD 엔진 기본 클래스입니다.
+
+    process()는 청크를 frame_size 샘플 단위 프레임으로 나누어
+    프레임별 음성 활성 여부(bool 배열)를 반환합니다.
+    청크 길이가 frame_size의 배수가 아니면 남는 샘플은 마지막 프레임에 포함됩니다.
+    음성 종료 직후 hangover_frames 프레임은 활성으로 유지되므로,
+    실제 음성 종료 위치는 비활성 전환 지점에서 그만큼 앞당겨 계산합니다.
+    """
+    hangover_frames = 0
+
+    def __init__(self, sample_rate=16000, energy_threshold=0.05, frame_size=None):
+        """
+        VADEngine 클래스 초기화
+
+        Parameters:
+        -----------
+        sample_rate : int
+            오디오 샘플링 레이트 (Hz)
+        energy_threshold : float
+            음성 판정 에너지 임계값 (0~1)
+        frame_size : int or None
+            판정 프레임 길이 (샘플). None이면 청크 전체를 한 프레임으로 판정
+        """
+        self.sample_rate = sample_rate
+        self.energy_threshold = energy_threshold
+        self.frame_size = frame_size
+
+        # 마지막 청크의 프레임별 에너지 (임계값 조정 및 지표용)
+        self.last_energy = np.zeros(0, dtype=np.float32)
+
+    def process(self, audio_chunk):
+        """
+        청크의 프레임별 음성 활성 여부를 반환합니다.
+
+        Parameters:
+        -----------
+        audio_chunk : numpy.ndarray
+            (frames, channels) 또는 (frames,) 모양의 오디오 청크
+
+        Returns:
+        --------
+        numpy.ndarray
+            프레임별 음성 활성 여부 (bool)
+        """
+        raise NotImplementedError
+
+    def measure_energy(self, audio_chunk):
+        """
+        청크 전체의 에너지를 엔진과 같은 척도로 계산합니다.
+
+        Parameters:
+        -----------
+        audio_chunk : numpy.ndarray
+            오디오 청크
+
+        Returns:
+        --------
+        float
+            정규화된 에너지 레벨 (0~1)
+        """
+        raise NotImplementedError
+
+    def get_frame_size(self, chunk_frames):
+        """청크 길이에 대한 실제 판정 프레임 길이 (샘플)"""
+        return self.frame_size or chunk_frames
+
+    def reset(self):
+        """
+        엔진 내부 상태를 초기화합니다.
+        """
+        self.last_energy = np.zeros(0, dtype=np.float32)
+
+
+class EnergyVAD(VADEngine):
+    """
+    청크 전체의 평균 절대 진폭을 단일 임계값과 비교하는 기존 방식의 VAD 엔진입니다.
+    청크 하나가 판정 단위이며 hangover가 없습니다.
+    """
+    def process(self, audio_chunk):
+        energy = self.measure_energy(audio_chunk)
+        self.last_energy = np.array([energy], dtype=np.float32)
+        return np.array([energy > self.energy_threshold])
+
+    def measure_energy(self, audio_chunk):
+        if audio_chunk is None or audio_chunk.size == 0:
+            return 0.0
+
+        if audio_chunk.dtype.kind == 'i':  # int16 등의 정수형
+            # 정수형 데이터는 최대값으로 나누어 정규화
+            max_value = np.iinfo(audio_chunk.dtype).max
+            return float(np.mean(np.abs(audio_chunk / max_value)))
+
+        # 이미 -1~1 범위의 부동소수점은 바로 계산
+        return float(np.mean(np.abs(audio_chunk)))
+
+
+class MultiFeatureVAD(VADEngine):
+    """
+    RMS, 영교차율(ZCR), 스펙트럴 플럭스를 함께 사용하는 프레임 단위 VAD 엔진입니다.
+
+    청크를 10~30ms 프레임으로 나누어 세 특징을 한 번의 벡터 연산으로 계산하고,
+    onset/hangover 상태 기계로 판정을 안정화합니다.
+    - onset: 연속 onset_frames 프레임이 음성이어야 음성 시작으로 판정
+    - hangover: 음성 중 묵음 프레임이 hangover_frames 이하이면 음성으로 유지
+    """
+    def __init__(self,
+                 sample_rate=16000,
+                 energy_threshold=0.05,
+                 frame_duration=0.02,
+                 max_zcr=0.25,
+                 flux_threshold=0.45,
+                 onset_frames=2,
+                 hangover_frames=3):
+        """
+        MultiFeatureVAD 클래스 초기화
+
+        Parameters:
+        -----------
+        sample_rate : int
+            오디오 샘플링 레이트 (Hz)
+        energy_threshold : float
+            음성 판정 RMS 임계값 (0~1)
+        frame_duration : float
+            판정 프레임 길이 (초, 0.01~0.03 권장).
+            청크 길이가 배수가 아니면 청크를 균등하게 나누도록 가장 가까운 길이로 조정됨
+        max_zcr : float
+            유성음으로 볼 최대 영교차율 (이보다 높으면 플럭스가 커야 음성으로 판정)
+        flux_threshold : float
+            음성 변화로 볼 최소 정규화 스펙트럴 플럭스
+        onset_frames : int
+            음성 시작 판정에 필요한 연속 음성 프레임 수
+        hangover_frames : int
+            음성 종료 판정 전 허용하는 연속 묵음 프레임 수
+        """
+        frame_size = max(1, int(sample_rate * frame_duration))
+        super().__init__(sample_rate, energy_threshold, frame_size)
+        self.nominal_frame_size = frame_size
+
+        self.max_zcr = max_zcr
+        self.flux_threshold = flux_threshold
+        self.onset_frames = onset_frames
+        self.hangover_frames = hangover_frames
+
+        # 마지막 청크의 특징값 (지표용)
+        self.last_zcr = np.zeros(0, dtype=np.float32)
+        self.last_flux = np.zeros(0, dtype=np.float32)
+
+        # 분석 창과 정규화 작업 버퍼 (청크 길이가 바뀔 때만 다시 할당)
+        self._chunk_frames = None
+        self._set_frame_size(frame_size)
+
+        self.reset()
+
+    def get_frame_size(self, chunk_frames):
+        if chunk_frames != self._chunk_frames:
+            # 청크를 남는 샘플 없이(또는 최소로) 나누는 프레임 길이 선택
+            num_frames = max(1, int(round(chunk_frames / self.nominal_frame_size)))
+            self._chunk_frames = chunk_frames
+            self._set_frame_size(max(1, chunk_frames // num_frames))
+        return self.frame_size
+
+    def _set_frame_size(self, frame_size):
+        """프레임 길이 변경 시 분석 창과 작업 버퍼를 다시 준비"""
+        if frame_size == getattr(self, "frame_size", None) and hasattr(self, "_window"):
+            return
+        self.frame_size = frame_size
+        self._window = np.hanning(frame_size).astype(np.float32)
+        self._work = np.zeros((0, frame_size), dtype=np.float32)
+        self._prev_spectrum = None
+
+    def reset(self):
+        super().reset()
+        self._prev_spectrum = None
+        self._active = False
+        self._voice_run = 0
+        self._silence_run = 0
+
+    def process(self, audio_chunk):
+        frames = self._frame(audio_chunk)
+        num_frames = len(frames)
+        if num_frames == 0:
+            return np.zeros(0, dtype=bool)
+
+        rms, zcr, flux = self._compute_features(frames)
+        self.last_energy = rms
+        self.last_zcr = zcr
+        self.last_flux = flux
+
+        # 프레임별 원시 판정: 에너지가 충분하고, 유성음(낮은 ZCR)이거나 스펙트럼 변화가 큼
+        raw = (rms > self.energy_threshold) & ((zcr < self.max_zcr) | (flux > self.flux_threshold))
+
+        return self._apply_state_machine(raw)
+
+    def measure_energy(self, audio_chunk):
+        frames = self._frame(audio_chunk)
+        if len(frames) == 0:
+            return 0.0
+        work = self._normalize(frames)
+        return float(np.sqrt(np.einsum('ij,ij->', work, work) / work.size))
+
+    def _frame(self, audio_chunk):
+        """청크를 (프레임 수, frame_size) 모양의 모노 뷰로 변환"""
+        if audio_chunk is None or audio_chunk.size == 0:
+            return np.zeros((0, self.frame_size), dtype=np.float32)
+
+        if audio_chunk.ndim == 2:
+            samples = audio_chunk[:, 0] if audio_chunk.shape[1] == 1 else audio_chunk.mean(axis=1)
+        else:
+            samples = audio_chunk
+
+        self.get_frame_size(len(samples))
+        num_frames = len(samples) // self.frame_size
+        return samples[:num_frames * self.frame_size].reshape(num_frames, self.frame_size)
+
+    def _normalize(self, frames):
+        """정수형 샘플을 -1~1 범위 float32로 변환하여 작업 버퍼에 기록"""
+        if self._work.shape != frames.shape:
+            self._work = np.empty(frames.shape, dtype=np.float32)
+
+        if frames.dtype.kind == 'i':
+            scale = np.float32(1.0 / np.iinfo(frames.dtype).max)
+        else:
+            scale = np.float32(1.0)
+        np.multiply(frames, scale, out=self._work, casting='unsafe')
+        return self._work
+
+    def _compute_features(self, frames):
+        """프레임별 RMS, 영교차율, 정규화 스펙트럴 플럭스를 벡터 연산으로 계산"""
+        work = self._normalize(frames)
+        frame_size = self.frame_size
+
+        # RMS
+        rms = np.sqrt(np.einsum('ij,ij->i', work, work) / frame_size)
+
+        # 영교차율: 인접 샘플 부호가 바뀐 비율
+        signs = np.signbit(work)
+        zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / max(1, frame_size - 1)
+
+        # 스펙트럴 플럭스: 직전 프레임 대비 증가한 스펙트럼 크기의 합 / 현재 스펙트럼 크기 합
+        spectrum = np.abs(np.fft.rfft(work * self._window, axis=1))
+        if self._prev_spectrum is None:
+            previous = np.vstack([spectrum[:1], spectrum[:-1]])
+        else:
+            previous = np.vstack([self._prev_spectrum[None, :], spectrum[:-1]])
+        increase = np.maximum(spectrum - previous, 0.0).sum(axis=1)
+        flux = increase / (spectrum.sum(axis=1) + 1e-9)
+        self._prev_spectrum = spectrum[-1]
+
+        return rms.astype(np.float32), zcr.astype(np.float32), flux.astype(np.float32)
+
+    def _apply_state_machine(self, raw):
+        """onset/hangover 상태 기계를 적용한 프레임별 음성 활성 여부"""
+        active = np.empty(len(raw), dtype=bool)
+
+        for i, is_voice in enumerate(raw):
+            if self._active:
+                if is_voice:
+                    self._silence_run = 0
+                else:
+                    self._silence_run += 1
+                    if self._silence_run > self.hangover_frames:
+                        self._active = False
+                        self._voice_run = 0
+            else:
+                if is_voice:
+                    self._voice_run += 1
+                    if self._voice_run >= self.onset_frames:
+                        self._active = True
+                        self._silence_run = 0
+                        # onset을 확정한 프레임들을 음성 구간으로 소급 표시 (현재 청크 범위 내)
+                        active[max(0, i - self.onset_frames + 1):i] = True
+                else:
+                    self._voice_run = 0
+            active[i] = self._active
+
+        return active
+
+
+def create_vad_engine(name, sample_rate=16000, energy_threshold=0.05, **kwargs):
+    """
+    이름으로 VAD 엔진을 생성합니다.
+
+    Parameters:
+    -----------
+    name : str
+        엔진 이름 ('multi_feature' 또는 'energy')
+    sample_rate : int
+        오디오 샘플링 레이트 (Hz)
+    energy_threshold : float
+        음성 판정 에너지 임계값
+    **kwargs
+        엔진별 추가 매개변수
+
+    Returns:
+    --------
+    VADEngine
+        생성된 VAD 엔진
+    """
+    engines = {
+        "multi_feature": MultiFeatureVAD,
+        "energy": EnergyVAD,
+    }
+    if name not in engines:
+        raise ValueError(f"알 수 없는 VAD 엔진입니다: {name} (사용 가능: {', '.join(engines)})")
+    return engines[name](sample_rate=sample_rate, energy_threshold=energy_threshold, **kwargs)
+
+
+class NoiseFloorTracker:
+    """
+    배경 잡음 수준을 연속적으로 추적하여 음성 판정 임계값을 갱신하는 클래스입니다.
+
+    로그(dB) 영역의 지수 백분위수 추적기를 사용합니다. 관측값이 추정치보다 크면
+    percentile 비율만큼, 작으면 나머지 비율만큼 추정치를 이동시켜
+    추정치가 에너지 분포의 하위 percentile 지점에 수렴하도록 합니다.
+    갱신 비용은 청크당 O(1)이며 별도의 보정 녹음이나 스트림 재시작이 필요 없습니다.
+    음성 구간에서는 잡음이 과대 추정되지 않도록 상승 속도를 줄입니다.
+    """
+    def __init__(self,
+                 percentile=0.2,
+                 adapt_rate_db=10.0,
+                 speech_rate_scale=0.1,
+                 threshold_margin_db=6.0,
+                 min_threshold=0.005,
+                 max_threshold=0.2,
+                 warmup_time=0.5):
+        """
+        NoiseFloorTracker 클래스 초기화
+
+        Parameters:
+        -----------
+        percentile : float
+            잡음 수준으로 추적할 에너지 분포의 백분위수 (0~1)
+        adapt_rate_db : float
+            추정치의 최대 이동 속도 (dB/초)
+        speech_rate_scale : float
+            음성 구간에서 상승 속도에 곱할 비율
+        threshold_margin_db : float
+            잡음 수준 대비 음성 판정 임계값 여유 (dB)
+        min_threshold : float
+            임계값 하한 (0~1)
+        max_threshold : float
+            임계값 상한 (0~1)
+        warmup_time : float
+            초기 추정에 사용할 시간 (초). 이 기간에는 관측 평균으로 빠르게 수렴
+        """
+        self.percentile = percentile
+        self.adapt_rate_db = adapt_rate_db
+        self.speech_rate_scale = speech_rate_scale
+        self.threshold_margin_db = threshold_margin_db
+        self.min_threshold = min_threshold
+        self.max_threshold = max_threshold
+        self.warmup_time = warmup_time
+
+        self.reset()
+
+    def reset(self):
+        """
+        추정치를 초기화하고 초기 추정(warm-up) 단계로 되돌립니다.
+        """
+        self.floor_db = None
+        self.observed_time = 0.0
+        self.update_count = 0
+
+    @property
+    def is_warming_up(self):
+        """초기 추정 단계 여부"""
+        return self.observed_time < self.warmup_time
+
+    @property
+    def noise_floor(self):
+        """현재 잡음 수준 추정치 (0~1), 관측 전이면 None"""
+        if self.floor_db is None:
+            return None
+        return 10 ** (self.floor_db / 20)
+
+    @property
+    def threshold(self):
+        """현재 음성 판정 임계값 (0~1), 관측 전이면 None"""
+        if self.floor_db is None:
+            return None
+        threshold = 10 ** ((self.floor_db + self.threshold_margin_db) / 20)
+        return min(self.max_threshold, max(self.min_threshold, threshold))
+
+    def update(self, energy, duration, is_speech=False):
+        """
+        청크 하나의 에너지 관측값으로 잡음 수준을 갱신합니다.
+
+        Parameters:
+        -----------
+        energy : float
+            청크의 잡음 관측값 (0~1, 보통 청크 내 프레임 에너지의 최솟값)
+        duration : float
+            청크 길이 (초)
+        is_speech : bool
+            현재 음성 구간 여부
+
+        Returns:
+        --------
+        float
+            갱신된 음성 판정 임계값
+        """
+        level_db = 20 * math.log10(max(float(energy), 1e-6))
+        self.update_count += 1
+
+        if self.floor_db is None:
+            self.floor_db = level_db
+        elif self.is_warming_up:
+            # 초기 단계: 관측값의 누적 평균
+            weight = duration / (self.observed_time + duration)
+            self.floor_db += (level_db - self.floor_db) * weight
+        else:
+            step = self.adapt_rate_db * duration
+            if level_db > self.floor_db:
+                scale = self.speech_rate_scale if is_speech else 1.0
+                self.floor_db = min(level_db, self.floor_db + step * self.percentile * scale)
+            else:
+                self.floor_db = max(level_db, self.floor_db - step * (1 - self.percentile))
+
+        self.observed_time += duration
+        return self.threshold
+
+    def get_metrics(self):
+        """
+        잡음 추적 지표를 반환합니다.
+
+        Returns:
+        --------
+        dict
+            잡음 수준, 임계값, 초기 추정 여부, 갱신 횟수
+        """
+        return {
+            "noise_floor": self.noise_floor,
+            "energy_threshold": self.threshold,
+            "warming_up": self.is_warming_up,
+            "updates": self.update_count,
+        }
@@ -3,10 +3,12 @@
 음성이 감지되면 자동으로 녹음을 시작하고 Whisper API를 통해 텍스트로 변환합니다.
 """
 
+import sys
 import time
 from src.audio_input import AudioInput
 from src.stt_handler import STTHandler
 from src.voice_detector import VoiceDetector
+from src.streaming_stt import StreamingTranscriber
 
 def process_detected_audio(audio_data, stt_handler):
     """
@@ -47,9 +49,14 @@ def process_detected_audio(audio_data, stt_handler):
     
     return text
 
-def main():
+def main(streaming=False):
     """
     메인 실행 함수
+    
+    Parameters:
+    -----------
+    streaming : bool
+        말하는 도중 짧은 쉼마다 구간을 미리 변환하는 스트리밍 모드 사용 여부
     """
     # 모듈 초기화
     print("오디오 입력 모듈 초기화 중...")
@@ -68,15 +75,33 @@ def main():
     )
     
     # 콜백 함수 정의 (클로저 사용)
-    def audio_callback(audio_data):
-        process_detected_audio(audio_data, stt_handler)
+    if streaming:
+        # 스트리밍 모드: 구간은 미리 변환하고 문장 종료 시에는 결과만 이어 붙임
+        transcriber = StreamingTranscriber(stt_handler, prompt="음악, 감정 관련 단어")
+        segment_callback = transcriber.add_segment
+        
+        def audio_callback(audio_data):
+            start_time = time.time()
+            text = transcriber.finish()
+            print("\n" + "=" * 50)
+            print(f"음성-텍스트 변환 결과 (스트리밍, 구간 {transcriber.last_segment_count}개):")
+            print("-" * 50)
+            print(f"{text}")
+            print("-" * 50)
+            print(f"문장 종료 후 대기 시간: {time.time() - start_time:.2f}초")
+            print("=" * 50)
+    else:
+        segment_callback = None
+        
+        def audio_callback(audio_data):
+            process_detected_audio(audio_data, stt_handler)
     
     # 주변 소음에 맞춰 임계값 조정
     voice_detector.adjust_for_ambient_noise(duration=2.0)
     
     # 음성 감지 시작
     print("\n음성 감지를 시작합니다. 말씀해 주세요. (종료하려면 Ctrl+C)")
-    voice_detector.start_detection(callback=audio_callback)
+    voice_detector.start_detection(callback=audio_callback, segment_callback=segment_callback)
     
     try:
         # 메인 스레드는 사용자 중단을 기다림
@@ -89,4 +114,4 @@ def main():
         voice_detector.stop_detection()
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main(streaming="--streaming" in sys.argv) 
\ No newline at end of file
@@ -7,6 +7,8 @@ import numpy as np
 import time
 import threading
 from src.audio_input import AudioInput
+from src.audio_buffer import PhraseBuffer
+from src.vad_engine import MultiFeatureVAD, NoiseFloorTracker
 
 class VoiceDetector:
     """
@@ -17,7 +19,14 @@ class VoiceDetector:
                  energy_threshold=0.05,  # 에너지 임계값 (0~1)
                  pause_threshold=1.0,    # 음성 사이 허용 묵음 시간 (초)
                  phrase_threshold=0.3,   # 음성 시작 인식 시간 (초)
-                 max_phrase_time=10.0):  # 최대 음성 녹음 시간 (초)
+                 max_phrase_time=10.0,   # 최대 음성 녹음 시간 (초)
+                 pre_roll_time=0.3,      # 음성 시작 전 포함할 오디오 길이 (초)
+                 vad_engine=None,        # 프레임 단위 음성 판정 엔진
+                 adaptive_threshold=True,  # 잡음 수준에 따른 임계값 자동 조정
+                 micro_pause_time=0.25,  # 구간을 나눌 짧은 쉼 길이 (초)
+                 min_segment_time=1.0,   # 스트리밍 구간 최소 길이 (초)
+                 segment_overlap=0.3,    # 스트리밍 구간 사이 겹치는 길이 (초)
+                 verbose=True):          # 상태 메시지 출력 여부
         """
         VoiceDetector 클래스 초기화
 
@@ -33,47 +42,265 @@ class VoiceDetector:
             음성 시작 인식에 필요한 최소 시간 (초)
         max_phrase_time : float
             한 문장 최대 녹음 시간 (초)
+        pre_roll_time : float
+            음성 시작이 감지되기 직전 구간 중 문장 앞에 포함할 길이 (초)
+        vad_engine : VADEngine or None
+            사용할 VAD 엔진, None이면 MultiFeatureVAD 자동 생성
+        adaptive_threshold : bool
+            감지 루프 안에서 잡음 수준을 계속 추적하여 에너지 임계값을 갱신할지 여부
+            (초기 추정이 끝나기 전까지는 energy_threshold 값을 사용)
+        micro_pause_time : float
+            스트리밍 모드에서 문장을 구간으로 자를 짧은 쉼의 길이 (초)
+        min_segment_time : float
+            스트리밍 모드에서 구간 하나의 최소 길이 (초)
+        segment_overlap : float
+            다음 구간 앞에 이전 구간 끝을 겹쳐 붙일 길이 (초, 경계 단어 손실 방지)
+        verbose : bool
+            음성 시작/종료 등 상태 메시지 출력 여부
         """
         # AudioInput 인스턴스 생성 또는 사용
         self.audio_input = audio_input or AudioInput(chunk_duration=0.1)
         
-        # 음성 감지 매개변수
-        self.energy_threshold = energy_threshold
+        # VAD 엔진 생성 또는 사용
+        self.vad_engine = vad_engine or MultiFeatureVAD(
+            sample_rate=self.audio_input.sample_rate,
+            energy_threshold=energy_threshold
+        )
+        
+        # 잡음 수준 추적기 (사용하지 않으면 None)
+        self.noise_tracker = NoiseFloorTracker() if adaptive_threshold else None
+        
+        # 음성 감지 매개변수 (에너지 임계값은 VAD 엔진이 관리)
         self.pause_threshold = pause_threshold
         self.phrase_threshold = phrase_threshold
         self.max_phrase_time = max_phrase_time
+        self.pre_roll_time = pre_roll_time
+        
+        # 스트리밍 구간 매개변수 (segment_callback이 설정된 경우에만 사용)
+        self.micro_pause_time = micro_pause_time
+        self.min_segment_time = min_segment_time
+        self.segment_overlap = segment_overlap
+        self.segment_callback = None
+        
+        # 문장 버퍼 (최대 문장 길이 + 청크 하나 여유분으로 미리 할당)
+        sample_rate = self.audio_input.sample_rate
+        self.phrase_buffer = PhraseBuffer(
+            max_frames=int(max_phrase_time * sample_rate) + self.audio_input.chunk_size,
+            channels=self.audio_input.channels,
+            dtype=self.audio_input.dtype,
+            preroll_frames=int(pre_roll_time * sample_rate)
+        )
         
         # 상태 변수
         self.is_listening = False
         self.listen_thread = None
+        self.verbose = verbose
+        self.reset_state()
+    
+    @property
+    def energy_threshold(self):
+        """VAD 엔진의 에너지 임계값"""
+        return self.vad_engine.energy_threshold
+    
+    @energy_threshold.setter
+    def energy_threshold(self, value):
+        self.vad_engine.energy_threshold = value
+    
+    def _log(self, message):
+        """verbose 설정에 따라 상태 메시지 출력"""
+        if self.verbose:
+            print(message)
+    
+    def reset_state(self):
+        """
+        음성 감지 상태를 초기화합니다. 위치 값은 스트림 시작 기준 샘플 수입니다.
+        """
+        self.vad_engine.reset()
+        self.phrase_buffer.reset()
+        self.is_speaking = False
+        self.stream_position = 0
+        self.speech_start_position = None
+        self.last_speech_position = None
+        
+        # 마지막 음성 종료 이벤트 (종료 위치, 종료를 판정한 시점의 위치)
+        self.speech_end_position = None
+        self.speech_end_detected_position = None
+        self._vad_active = False
+        
+        # 스트리밍 구간 상태 (문장 버퍼 0번 프레임의 스트림 위치, 다음 구간 시작 오프셋 등)
+        self._phrase_origin = 0
+        self._segment_start = 0
+        self._segment_index = 0
+        self._last_cut_position = 0
     
-    def _calculate_energy(self, audio_chunk):
+    def process_chunk(self, chunk):
         """
-        오디오 청크의 에너지 레벨을 계산합니다.
+        오디오 청크 하나를 처리하고, 문장이 완성되면 해당 오디오를 반환합니다.
+        
+        시간은 벽시계가 아니라 처리한 샘플 수로 계산하므로,
+        실시간 스트림뿐 아니라 녹음된 파일을 빠르게 흘려보내는 경우에도 같은 결과를 냅니다.
+        
+        segment_callback이 설정되어 있으면 말하는 도중 짧은 쉼마다 문장의 앞부분을
+        구간으로 잘라 segment_callback(구간 오디오, 구간 번호, 마지막 구간 여부)로 넘기고,
+        문장이 끝나면 남은 부분을 마지막 구간으로 넘깁니다.
         
         Parameters:
         -----------
-        audio_chunk : numpy.ndarray
-            오디오 데이터 청크
+        chunk : numpy.ndarray
+            (frames, channels) 모양의 오디오 청크
+            
+        Returns:
+        --------
+        numpy.ndarray or None
+            완성된 문장 오디오 (문장 버퍼의 뷰), 문장이 완성되지 않았으면 None
+        """
+        sample_rate = self.audio_input.sample_rate
+        chunk_frames = len(chunk)
+        chunk_start = self.stream_position
+        chunk_end = chunk_start + chunk_frames
+        self.stream_position = chunk_end
+        
+        # 프레임 단위 음성 판정
+        decisions = self.vad_engine.process(chunk)
+        frame_size = self.vad_engine.get_frame_size(chunk_frames)
+        speech_frames = np.flatnonzero(decisions)
+        
+        # 잡음 수준 갱신 (청크 내 최소 프레임 에너지를 잡음 관측값으로 사용)
+        if self.noise_tracker is not None and len(self.vad_engine.last_energy):
+            threshold = self.noise_tracker.update(
+                self.vad_engine.last_energy.min(),
+                chunk_frames / sample_rate,
+                is_speech=self.is_speaking
+            )
+            if not self.noise_tracker.is_warming_up:
+                self.vad_engine.energy_threshold = threshold
+        
+        # 음성 종료 이벤트 기록 (활성 -> 비활성 전환 지점에서 hangover만큼 앞당긴 위치)
+        ended_position = None
+        if len(decisions):
+            previous = np.concatenate(([self._vad_active], decisions[:-1]))
+            ends = np.flatnonzero(previous & ~decisions)
+            if len(ends):
+                ended_position = chunk_start + (int(ends[-1]) - self.vad_engine.hangover_frames) * frame_size
+                self.speech_end_position = ended_position
+                self.speech_end_detected_position = chunk_end
+            self._vad_active = bool(decisions[-1])
+        
+        if len(speech_frames):
+            # 청크 안의 첫/마지막 음성 위치 (마지막 프레임은 청크 끝까지 포함)
+            first_position = chunk_start + int(speech_frames[0]) * frame_size
+            last_index = int(speech_frames[-1])
+            if last_index == len(decisions) - 1:
+                last_position = chunk_end
+            else:
+                last_position = chunk_start + (last_index + 1) * frame_size
+            
+            # 청크 안에서 음성이 끝났으면 hangover 구간은 음성에서 제외
+            if ended_position is not None and not self._vad_active:
+                last_position = max(first_position, ended_position)
+            
+            if not self.is_speaking:
+                # 음성 시작 감지
+                self.is_speaking = True
+                self.speech_start_position = first_position
+                self._log("음성 감지됨 - 녹음 시작")
+                
+                # pre-roll 오디오로 문장 시작
+                self.phrase_buffer.begin()
+                self._phrase_origin = chunk_start - self.phrase_buffer.length
+                self._segment_start = 0
+                self._segment_index = 0
+                self._last_cut_position = self._phrase_origin
             
+            # 마지막 음성 위치 업데이트 후 청크를 문장 버퍼에 복사
+            self.last_speech_position = last_position
+            self.phrase_buffer.append(chunk)
+        
+        elif self.is_speaking:
+            # 음성 중 묵음 상태 (묵음도 녹음에 포함)
+            self.phrase_buffer.append(chunk)
+            if ended_position is not None:
+                self.last_speech_position = ended_position
+            
+            # 일정 시간 이상 묵음이 지속되면 음성이 끝난 것으로 간주
+            if (chunk_end - self.last_speech_position) > self.pause_threshold * sample_rate:
+                speech_length = self.last_speech_position - self.speech_start_position
+                # 마지막 구간은 뒤쪽 묵음을 짧은 쉼 길이만 남기고 자름
+                final_cut = min(chunk_end, self.last_speech_position + int(self.micro_pause_time * sample_rate))
+                self._end_phrase()
+                
+                # 최소 인식 시간 확인
+                if speech_length >= self.phrase_threshold * sample_rate:
+                    self._log("음성 녹음 완료")
+                    self._emit_segment(final_cut, is_final=True)
+                    return self.phrase_buffer.view()
+                
+                self._log("음성이 너무 짧아서 무시됩니다.")
+                return None
+            
+            # 짧은 쉼이면 지금까지의 음성을 구간으로 잘라 먼저 넘김
+            if (self.segment_callback is not None
+                    and self.last_speech_position > self._last_cut_position
+                    and chunk_end - self.last_speech_position >= self.micro_pause_time * sample_rate
+                    and chunk_end - self._last_cut_position >= self.min_segment_time * sample_rate):
+                self._emit_segment(chunk_end, is_final=False)
+        
+        else:
+            # 대기 중에는 pre-roll 버퍼만 갱신
+            self.phrase_buffer.push_preroll(chunk)
+        
+        # 최대 녹음 시간 확인
+        if self.is_speaking and (chunk_end - self.speech_start_position) > self.max_phrase_time * sample_rate:
+            self._log(f"최대 녹음 시간({self.max_phrase_time}초)에 도달했습니다.")
+            self._end_phrase()
+            self._emit_segment(chunk_end, is_final=True)
+            return self.phrase_buffer.view()
+        
+        return None
+    
+    def get_metrics(self):
+        """
+        음성 감지 상태 지표를 반환합니다.
+        
         Returns:
         --------
-        float
-            정규화된 에너지 레벨 (0~1)
+        dict
+            현재 잡음 수준, 에너지 임계값, 음성 구간 여부, 오디오 버퍼 상태
         """
-        if audio_chunk is None or audio_chunk.size == 0:
-            return 0.0
-        
-        # 진폭 값을 제곱하여 에너지 계산
-        if audio_chunk.dtype.kind == 'i':  # int16 등의 정수형
-            # 정수형 데이터는 최대값으로 나누어 정규화
-            max_value = np.iinfo(audio_chunk.dtype).max
-            energy = np.mean(np.abs(audio_chunk / max_value))
-        else:  # float32 등의 부동소수점형
-            # 이미 -1~1 범위의 부동소수점은 바로 계산
-            energy = np.mean(np.abs(audio_chunk))
-        
-        return energy
+        metrics = {
+            "noise_floor": None,
+            "energy_threshold": self.energy_threshold,
+            "is_speaking": self.is_speaking,
+            "buffer": self.audio_input.get_buffer_stats(),
+        }
+        if self.noise_tracker is not None:
+            metrics["noise_floor"] = self.noise_tracker.noise_floor
+            metrics["noise_warming_up"] = self.noise_tracker.is_warming_up
+        return metrics
+    
+    def _emit_segment(self, cut_position, is_final):
+        """
+        마지막으로 자른 지점(겹침 포함)부터 cut_position까지를 구간으로 segment_callback에 넘김
+        
+        구간은 문장 버퍼의 뷰이므로 콜백 이후에도 사용하려면 콜백 안에서 복사해야 함
+        """
+        if self.segment_callback is None:
+            return
+        
+        end = cut_position - self._phrase_origin
+        segment = self.phrase_buffer.view()[min(self._segment_start, end):end]
+        self.segment_callback(segment, self._segment_index, is_final)
+        
+        overlap = int(self.segment_overlap * self.audio_input.sample_rate)
+        self._segment_index += 1
+        self._segment_start = max(0, end - overlap)
+        self._last_cut_position = cut_position
+    
+    def _end_phrase(self):
+        """문장 상태 초기화 (문장 버퍼 내용은 다음 음성 시작 전까지 유지)"""
+        self.is_speaking = False
+        self.speech_start_position = None
+        self.last_speech_position = None
     
     def _listen_for_phrase(self, callback=None):
         """
@@ -84,15 +311,11 @@ class VoiceDetector:
         callback : function or None
             음성이 감지되고 녹음이 완료되었을 때 호출할 콜백 함수
             콜백은 매개변수로 녹음된 오디오 데이터(numpy.ndarray)를 받음
+            (문장 버퍼의 뷰이므로 콜백 이후에도 보관하려면 복사해야 함)
         """
         # 오디오 입력 시작
         self.audio_input.start_recording()
-        
-        # 상태 변수
-        is_speaking = False
-        speech_start_time = None
-        last_speech_time = None
-        collected_chunks = []
+        self.reset_state()
         
         print("음성 감지 대기 중...")
         
@@ -103,79 +326,18 @@ class VoiceDetector:
                 if chunk is None:
                     continue
                 
-                # 에너지 레벨 계산
-                energy = self._calculate_energy(chunk)
-                
-                current_time = time.time()
-                
-                # 음성 감지 로직
-                if energy > self.energy_threshold:
-                    # 에너지가 임계값보다 높으면 음성으로 간주
-                    if not is_speaking:
-                        # 음성 시작 감지
-                        is_speaking = True
-                        speech_start_time = current_time
-                        print("음성 감지됨 - 녹음 시작")
-                    
-                    # 마지막 음성 시간 업데이트
-                    last_speech_time = current_time
-                    
-                    # 청크 저장
-                    collected_chunks.append(chunk)
-                    
-                elif is_speaking:
-                    # 음성 중 묵음 상태
-                    collected_chunks.append(chunk)  # 묵음도 녹음에 포함
-                    
-                    # 일정 시간 이상 묵음이 지속되면 음성이 끝난 것으로 간주
-                    if (current_time - last_speech_time) > self.pause_threshold:
-                        # 음성 종료 감지
-                        is_speaking = False
-                        
-                        # 최소 인식 시간 확인
-                        if (last_speech_time - speech_start_time) >= self.phrase_threshold:
-                            # 유효한 음성이 감지됨
-                            print("음성 녹음 완료")
-                            
-                            # 녹음된 청크를 하나의 배열로 결합
-                            if collected_chunks:
-                                audio_data = np.vstack(collected_chunks)
-                                
-                                # 콜백 호출
-                                if callback:
-                                    callback(audio_data)
-                            
-                        else:
-                            print("음성이 너무 짧아서 무시됩니다.")
-                        
-                        # 청크 초기화
-                        collected_chunks = []
-                        speech_start_time = None
-                        last_speech_time = None
+                # 음성 감지 및 문장 조립
+                audio_data = self.process_chunk(chunk)
                 
-                # 최대 녹음 시간 확인
-                if is_speaking and speech_start_time and (current_time - speech_start_time) > self.max_phrase_time:
-                    print(f"최대 녹음 시간({self.max_phrase_time}초)에 도달했습니다.")
-                    is_speaking = False
-                    
-                    # 녹음된 청크를 하나의 배열로 결합
-                    if collected_chunks:
-                        audio_data = np.vstack(collected_chunks)
-                        
-                        # 콜백 호출
-                        if callback:
-                            callback(audio_data)
-                    
-                    # 청크 초기화
-                    collected_chunks = []
-                    speech_start_time = None
-                    last_speech_time = None
+                # 문장이 완성되면 콜백 호출
+                if audio_data is not None and callback:
+                    callback(audio_data)
             
         finally:
             # 스레드 종료 시 오디오 스트림 중지
             self.audio_input.stop_recording()
     
-    def start_detection(self, callback=None):
+    def start_detection(self, callback=None, segment_callback=None):
         """
         음성 감지를 시작합니다.
         
@@ -183,11 +345,15 @@ class VoiceDetector:
         -----------
         callback : function or None
             음성이 감지되었을 때 호출할 콜백 함수
+        segment_callback : function or None
+            스트리밍 모드에서 문장 구간이 잘릴 때마다 호출할 콜백 함수
+            (구간 오디오, 구간 번호, 마지막 구간 여부)를 매개변수로 받음
         """
         if self.is_listening:
             print("이미 음성 감지 중입니다.")
             return
         
+        self.segment_callback = segment_callback
         self.is_listening = True
         self.listen_thread = threading.Thread(
             target=self._listen_for_phrase,
@@ -213,11 +379,21 @@ class VoiceDetector:
         """
         주변 환경 소음에 맞춰 에너지 임계값을 조정합니다.
         
+        adaptive_threshold가 켜져 있으면 잡음 수준 추적기를 초기 추정 단계로 되돌리기만 하고
+        바로 반환합니다. 이후 감지 루프가 (이미 실행 중이라면 스트림 재시작 없이)
+        주변 소음을 다시 학습합니다. 꺼져 있으면 기존처럼 잠시 녹음하여 임계값을 한 번 설정합니다.
+        
         Parameters:
         -----------
         duration : float
             샘플링할 시간 (초)
         """
+        if self.noise_tracker is not None:
+            self.noise_tracker.warmup_time = duration
+            self.noise_tracker.reset()
+            print(f"감지 중 처음 {duration}초 동안 주변 소음을 학습하고 이후에도 계속 임계값을 조정합니다.")
+            return
+        
         print(f"{duration}초 동안 주변 소음을 측정합니다...")
         
         # 임시 녹음
@@ -228,7 +404,7 @@ class VoiceDetector:
         while time.time() < end_time:
             chunk = self.audio_input.get_audio_chunk(timeout=0.1)
             if chunk is not None:
-                chunks.append(self._calculate_energy(chunk))
+                chunks.append(self.vad_engine.measure_energy(chunk))
         
         self.audio_input.stop_recording()
         
@@ -264,9 +440,12 @@ if __name__ == "__main__":
     voice_detector.start_detection(callback=print_audio_info)
     
     try:
-        # 메인 스레드는 사용자 중단을 기다림
+        # 메인 스레드는 사용자 중단을 기다리며 1초마다 잡음 지표 출력
         while True:
-            time.sleep(0.1)
+            time.sleep(1.0)
+            metrics = voice_detector.get_metrics()
+            if metrics["noise_floor"] is not None:
+                print(f"잡음 수준: {metrics['noise_floor']:.4f}, 임계값: {metrics['energy_threshold']:.4f}")
     except KeyboardInterrupt:
         print("\n사용자에 의해 중단되었습니다.")
     finally:
@@ -0,0 +1,98 @@
+"""
+백그라운드 WAV 파일 저장 모듈입니다.
+이미 인코딩된 WAV 바이트를 별도 스레드에서 디스크에 기록하여,
+녹음 직후 STT로 넘어가는 경로에서 디스크 I/O를 제외합니다.
+"""
+
+import os
+import queue
+import atexit
+import threading
+
+
+class BackgroundWavWriter:
+    """
+    WAV 바이트를 작업 큐에 받아 순서대로 파일로 저장하는 클래스입니다.
+    """
+    def __init__(self, on_saved=None):
+        """
+        BackgroundWavWriter 클래스 초기화
+
+        Parameters:
+        -----------
+        on_saved : function or None
+            파일 저장이 끝날 때마다 호출할 콜백 함수 (저장된 파일 경로를 매개변수로 받음)
+            작업 스레드에서 호출되므로 GUI 갱신은 큐를 거쳐야 함
+        """
+        self.on_saved = on_saved
+        self.saved_count = 0
+        self.failed_count = 0
+
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="wav-writer", daemon=True)
+        self._thread.start()
+
+        # 종료 시 남은 파일을 모두 기록
+        atexit.register(self.stop)
+
+    def submit(self, wav_bytes, file_path):
+        """
+        WAV 바이트 저장을 요청하고 바로 반환합니다.
+
+        Parameters:
+        -----------
+        wav_bytes : bytes
+            저장할 WAV 파일 내용
+        file_path : str
+            저장할 파일 경로
+
+        Returns:
+        --------
+        str
+            저장될 파일 경로
+        """
+        self._queue.put((wav_bytes, file_path))
+        return file_path
+
+    def flush(self):
+        """
+        요청된 파일이 모두 기록될 때까지 기다립니다.
+        """
+        self._queue.join()
+
+    def stop(self):
+        """
+        남은 파일을 모두 기록한 뒤 작업 스레드를 종료합니다.
+        """
+        if not self._thread.is_alive():
+            return
+        self._queue.put(None)
+        self._thread.join(timeout=5.0)
+
+    def _run(self):
+        """작업 큐의 WAV 바이트를 파일로 기록 (스레드 본체)"""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+
+                wav_bytes, file_path = item
+                directory = os.path.dirname(file_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+
+                with open(file_path, "wb") as f:
+                    f.write(wav_bytes)
+                self.saved_count += 1
+                print(f"오디오 파일이 저장되었습니다: {file_path}")
+
+                if self.on_saved:
+                    self.on_saved(file_path)
+
+            except Exception as e:
+                self.failed_count += 1
+                print(f"오디오 파일 저장 오류: {str(e)}")
+
+            finally:
+                self._queue.task_done()